@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Local record/replay simulator for the FRED and ECB APIs.
+
+Serves:
+  /fred/series/observations       (FRED, file_type=json)
+  /fred/series/release
+  /fred/release/dates
+  /fred/v2/release/observations   (FRED API v2 bulk, paged by next_cursor)
+  /ecb/service/data/<flow>/<key>  (ECB Data Portal, format=jsondata)
+
+Point the clients at it with:
+  FRED_BASE_URL=http://127.0.0.1:<port>/fred
+  ECB_BASE_URL=http://127.0.0.1:<port>/ecb/service/data
+
+Payloads come from recorded responses in --fixtures DIR when present
+(fred_<SERIES_ID>.json, ecb_<FLOW>_<KEY>.json), otherwise from the
+deterministic generators in benchmarks/fixtures.py. With --release-every N
+every series gains one new monthly observation each N seconds.
+Release membership for the bulk endpoint comes from 'releases'
+({release_id: [series_id, ...]}) or --portfolio config/portfolio.yml.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fixtures import fred_observations_payload, ecb_sdmx_payload
+
+# Synthetic history starts here; new releases extend it forward
+HISTORY_START_YEAR = 2000
+
+
+class ApiSimulator:
+    """
+    In-process HTTP server with configurable latency, failures and releases.
+
+    Args:
+        latency: Base response delay in seconds.
+        jitter: Mean of an extra exponential delay (models tail latency).
+        error_rate: Probability of an HTTP 500.
+        rate_limit_rate: Probability of an HTTP 429 with Retry-After.
+        release_every: Seconds between scheduled "new release" events.
+        history: Observations per series before the first release event.
+        releases: FRED release_id -> member series IDs (bulk endpoint).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        release_every: Optional[float] = None,
+        history: int = 240,
+        fixture_dir: Optional[str] = None,
+        seed: int = 0,
+        releases: Optional[Dict[int, List[str]]] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.release_every = release_every
+        self.history = history
+        self.fixture_dir = fixture_dir
+        self.releases = {int(k): list(v) for k, v in (releases or {}).items()}
+        self._release_of = {sid: rid for rid, members in self.releases.items() for sid in members}
+        self.rng = random.Random(seed)
+        self.stats = {"requests": 0, "ok": 0, "errors_500": 0, "rate_limited_429": 0}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+        simulator = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                simulator._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+
+    # --- Lifecycle ---
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def fred_base_url(self) -> str:
+        return f"{self.base_url}/fred"
+
+    @property
+    def ecb_base_url(self) -> str:
+        return f"{self.base_url}/ecb/service/data"
+
+    def start(self) -> "ApiSimulator":
+        self.started_at = time.time()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # --- Release schedule ---
+    def releases_so_far(self) -> int:
+        if not self.release_every:
+            return 0
+        return int((time.time() - self.started_at) / self.release_every)
+
+    def release_time(self, index: int) -> float:
+        """Wall-clock time at which release number 'index' became visible."""
+        return self.started_at + index * self.release_every
+
+    # --- Request handling ---
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        self._count("requests")
+        with self._lock:
+            delay = self.latency + (self.rng.expovariate(1 / self.jitter) if self.jitter else 0.0)
+            roll = self.rng.random()
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.rate_limit_rate:
+            self._count("rate_limited_429")
+            handler.send_response(429)
+            handler.send_header("Retry-After", str(self.retry_after))
+            handler.end_headers()
+            return
+        if roll < self.rate_limit_rate + self.error_rate:
+            self._count("errors_500")
+            handler.send_error(500)
+            return
+
+        url = urlparse(handler.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        # API v2 authenticates by header only, like the real service
+        if url.path.startswith("/fred/v2/") and not handler.headers.get(
+            "Authorization", ""
+        ).startswith("Bearer "):
+            handler.send_error(401)
+            return
+        payload = self._route(url.path, query)
+        if payload is None:
+            handler.send_error(404)
+            return
+
+        body = json.dumps(payload).encode()
+        self._count("ok")
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _route(self, path: str, query: dict) -> Optional[dict]:
+        if path == "/fred/series/observations":
+            return self._fred_observations(query.get("series_id", ""), query.get("observation_start"))
+        if path == "/fred/series/release":
+            return self._fred_release(query.get("series_id", ""))
+        if path == "/fred/release/dates":
+            return self._fred_release_dates(query.get("release_id", "0"))
+        if path == "/fred/v2/release/observations":
+            return self._fred_release_observations(
+                int(query.get("release_id", "0")),
+                int(query.get("next_cursor", "0") or 0),
+                int(query.get("limit", "100000")),
+            )
+        if path.startswith("/ecb/service/data/"):
+            parts = path[len("/ecb/service/data/"):].split("/")
+            if len(parts) == 2:
+                return self._ecb_data(*parts)
+        return None
+
+    def _recorded(self, filename: str) -> Optional[dict]:
+        if not self.fixture_dir:
+            return None
+        path = os.path.join(self.fixture_dir, filename.replace("/", "_"))
+        if os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+        return None
+
+    @staticmethod
+    def _seed(name: str) -> int:
+        return zlib.crc32(name.encode())
+
+    def _fred_observations(self, series_id: str, start: Optional[str]) -> dict:
+        payload = self._recorded(f"fred_{series_id}.json")
+        if payload is None:
+            n_obs = self.history + self.releases_so_far()
+            payload = fred_observations_payload(n_obs, self._seed(series_id), HISTORY_START_YEAR)
+        if start:
+            payload["observations"] = [o for o in payload["observations"] if o["date"] >= start]
+            payload["count"] = len(payload["observations"])
+        return payload
+
+    def _fred_release(self, series_id: str) -> dict:
+        release_id = self._release_of.get(series_id, 10 + self._seed(series_id) % 490)
+        return {"releases": [{"id": release_id, "name": f"Simulated Release {release_id}"}]}
+
+    def _fred_release_dates(self, release_id: str) -> dict:
+        # Next three monthly release dates from today
+        today = date.today()
+        dates = [(today + timedelta(days=7 + 30 * i)).isoformat() for i in range(3)]
+        return {"release_dates": [{"release_id": int(release_id), "date": d} for d in dates]}
+
+    def _fred_release_observations(self, release_id: int, cursor: int, limit: int) -> dict:
+        # Flattened (series, observation) stream, cut into pages of 'limit' observations;
+        # the cursor is the offset of the next page
+        stream = []
+        for series_id in self.releases.get(release_id, []):
+            for obs in self._fred_observations(series_id, None)["observations"]:
+                stream.append((series_id, obs))
+        page = stream[cursor:cursor + limit]
+
+        series = []
+        for series_id, obs in page:
+            if not series or series[-1]["series_id"] != series_id:
+                series.append({"series_id": series_id, "title": series_id, "observations": []})
+            series[-1]["observations"].append({"date": obs["date"], "value": obs["value"]})
+
+        has_more = cursor + limit < len(stream)
+        return {
+            "release": {"release_id": release_id, "name": f"Simulated Release {release_id}"},
+            "has_more": has_more,
+            "next_cursor": str(cursor + limit) if has_more else None,
+            "series": series,
+        }
+
+    def _ecb_data(self, flow_ref: str, key: str) -> dict:
+        payload = self._recorded(f"ecb_{flow_ref}_{key}.json")
+        if payload is None:
+            n_obs = self.history + self.releases_so_far()
+            payload = ecb_sdmx_payload(n_obs, self._seed(f"{flow_ref}/{key}"), HISTORY_START_YEAR)
+        return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local FRED/ECB API simulator")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base delay (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Mean extra exponential delay (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--release-every", type=float, default=None, help="Seconds between new releases")
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded responses")
+    parser.add_argument("--portfolio", default=None, help="portfolio.yml to take release members from")
+    args = parser.parse_args()
+
+    releases: Dict[int, List[str]] = {}
+    if args.portfolio:
+        from src.processing.settings import load_yaml
+
+        for item in load_yaml(args.portfolio).get("series", []):
+            if item.get("release_id") is not None:
+                releases.setdefault(int(item["release_id"]), []).append(str(item["id"]))
+
+    simulator = ApiSimulator(
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        release_every=args.release_every,
+        fixture_dir=args.fixtures,
+        releases=releases,
+    ).start()
+    print(f"FRED_BASE_URL={simulator.fred_base_url}")
+    print(f"ECB_BASE_URL={simulator.ecb_base_url}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Payload fixtures for the benchmark suite.
+
+Recorded responses placed in benchmarks/fixtures/ are used when present:
+  fred_observations.json   (FRED /series/observations response)
+  ecb_sdmx.json            (ECB /service/data response, format=jsondata)
+Otherwise deterministic payloads with the same shapes are generated.
+"""
+import json
+import os
+import random
+from datetime import date
+from typing import Optional
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _month_starts(n_obs: int, end_year: int = 2024, start_year: Optional[int] = None):
+    # Anchoring on start_year keeps old dates fixed as n_obs grows (new releases)
+    start_index = start_year * 12 if start_year else end_year * 12 - n_obs
+    return [date(i // 12, i % 12 + 1, 1) for i in range(start_index, start_index + n_obs)]
+
+
+def fred_observations_payload(n_obs: int = 900, seed: int = 0, start_year: Optional[int] = None) -> dict:
+    """Same shape as api.stlouisfed.org/fred/series/observations?file_type=json."""
+    rng = random.Random(seed)
+    level = 100.0
+    observations = []
+    for d in _month_starts(n_obs, start_year=start_year):
+        level *= 1 + rng.gauss(0.002, 0.003)
+        observations.append(
+            {
+                "realtime_start": "2024-06-01",
+                "realtime_end": "2024-06-01",
+                "date": d.isoformat(),
+                # FRED reports missing values as "."
+                "value": "." if rng.random() < 0.005 else f"{level:.3f}",
+            }
+        )
+    return {
+        "realtime_start": "2024-06-01",
+        "realtime_end": "2024-06-01",
+        "observation_start": "1600-01-01",
+        "observation_end": "9999-12-31",
+        "units": "lin",
+        "output_type": 1,
+        "file_type": "json",
+        "order_by": "observation_date",
+        "sort_order": "asc",
+        "count": n_obs,
+        "offset": 0,
+        "limit": 100000,
+        "observations": observations,
+    }
+
+
+def ecb_sdmx_payload(n_obs: int = 330, seed: int = 0, start_year: Optional[int] = None) -> dict:
+    """Same shape as data-api.ecb.europa.eu/service/data/...?format=jsondata&detail=dataonly."""
+    rng = random.Random(seed)
+    periods = [d.strftime("%Y-%m") for d in _month_starts(n_obs, start_year=start_year)]
+    observations = {str(i): [round(rng.gauss(2.0, 1.5), 1)] for i in range(n_obs)}
+    return {
+        "header": {"id": "benchmark", "prepared": "2024-06-01T00:00:00"},
+        "dataSets": [
+            {
+                "action": "Replace",
+                "series": {"0:0:0:0:0:0": {"observations": observations}},
+            }
+        ],
+        "structure": {
+            "dimensions": {
+                "series": [],
+                "observation": [
+                    {
+                        "id": "TIME_PERIOD",
+                        "name": "Time period or range",
+                        "values": [{"id": p, "name": p} for p in periods],
+                    }
+                ],
+            }
+        },
+    }
+
+
+def load_fixture(name: str, fallback):
+    path = os.path.join(FIXTURE_DIR, name)
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return fallback()
+
+
+def fred_fixture() -> dict:
+    return load_fixture("fred_observations.json", fred_observations_payload)
+
+
+def ecb_fixture() -> dict:
+    return load_fixture("ecb_sdmx.json", ecb_sdmx_payload)
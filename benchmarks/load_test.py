@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Offline load test: MacroScheduler against the local API simulator.
+
+  python benchmarks/load_test.py --series 500 --release-every 5 --duration 30 \
+      --latency 0.02 --jitter 0.05 --rate-limit-rate 0.02
+
+With --release-size N the FRED series are grouped into releases of N, so
+groups large enough for the release-level bulk ingest are pulled in one
+paged download each (compare simulator request counts with --release-size 0).
+With --jitter, compare detect_p99_s with and without --no-hedge.
+
+Reports cycle throughput, release-to-alert detection latency and the
+client retry/backoff/hedging counters.
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from benchmarks.api_simulator import ApiSimulator, HISTORY_START_YEAR
+from src.alerts.alert_bus import AlertBus
+from src.alerts.sinks import FileSink
+from src.api.request_policy import POLICY
+from src.processing.portfolio import Portfolio
+from src.processing.metrics import METRICS
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def release_id_for(i: int, release_size: int):
+    return 1000 + i // release_size if release_size else None
+
+
+def run(args) -> dict:
+    releases = {}
+    for i in range(args.series):
+        release_id = release_id_for(i, args.release_size)
+        if release_id is not None:
+            releases.setdefault(release_id, []).append(f"SIM{i:05d}")
+
+    simulator = ApiSimulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        release_every=args.release_every,
+        history=args.history,
+        releases=releases,
+    ).start()
+
+    os.environ["FRED_BASE_URL"] = simulator.fred_base_url
+    os.environ["ECB_BASE_URL"] = simulator.ecb_base_url
+    os.environ.setdefault("FRED_API_KEY", "SIMULATED")
+
+    from src.processing.scheduler import MacroScheduler
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            scheduler = MacroScheduler()
+            POLICY.hedge = not args.no_hedge
+            scheduler.alerts.close()
+            scheduler.alerts = AlertBus([FileSink(os.path.join(tmp, "alerts.jsonl"))])
+            # Offline: no market overlay downloads for the correlation engine
+            scheduler._market_due = float("inf")
+            # Polling interval 0: every series is due on every cycle
+            scheduler.portfolio = Portfolio.from_items([
+                {
+                    "id": f"SIM{i:05d}",
+                    "source": "FRED",
+                    "name": f"Sim FRED {i}",
+                    "units": "lin",
+                    "release_id": release_id_for(i, args.release_size),
+                }
+                for i in range(args.series)
+            ] + [
+                {"id": f"ICP/M.SIM{i:04d}", "source": "ECB", "name": f"Sim ECB {i}", "units": "lin"}
+                for i in range(args.ecb_series)
+            ], {"fast": 0})
+
+            # Detection latency: release visible on the simulator -> alert published
+            latencies = []
+            publish = scheduler.alerts.publish
+
+            def timed_publish(event):
+                obs = pd.Timestamp(event["date"])
+                months = (obs.year - HISTORY_START_YEAR) * 12 + obs.month - 1
+                release_index = months - args.history + 1
+                if release_index > 0:
+                    latencies.append(time.time() - simulator.release_time(release_index))
+                publish(event)
+
+            scheduler.alerts.publish = timed_publish
+
+            before = METRICS.snapshot()
+            cycle_times = []
+            deadline = time.time() + args.duration
+            while time.time() < deadline:
+                start = time.perf_counter()
+                scheduler.run_pipeline()
+                cycle_times.append(time.perf_counter() - start)
+
+            summary = METRICS.cycle_summary(before)
+            scheduler.alerts.close()
+        finally:
+            os.chdir(cwd)
+            simulator.stop()
+
+    n_series = args.series + args.ecb_series
+    return {
+        "series": n_series,
+        "cycles": len(cycle_times),
+        "cycle_median_s": statistics.median(cycle_times) if cycle_times else None,
+        "series_per_s": n_series / statistics.median(cycle_times) if cycle_times else None,
+        "releases": simulator.releases_so_far(),
+        "alerts": len(latencies),
+        "detect_p50_s": percentile(latencies, 0.50),
+        "detect_p99_s": percentile(latencies, 0.99),
+        "simulator": simulator.stats,
+        "retries": {k: v for k, v in summary["counters"].items() if "retries" in k},
+        "hedges": {k: v for k, v in summary["counters"].items() if "hedges" in k},
+        "deadline_exceeded": {
+            k: v for k, v in summary["counters"].items() if "deadline_exceeded" in k
+        },
+        "errors": {k: v for k, v in summary["counters"].items() if "errors" in k},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for MacroScheduler")
+    parser.add_argument("--series", type=int, default=100, help="Synthetic FRED series")
+    parser.add_argument("--ecb-series", type=int, default=10, help="Synthetic ECB series")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--release-every", type=float, default=5.0)
+    parser.add_argument("--history", type=int, default=240)
+    parser.add_argument(
+        "--release-size", type=int, default=0, help="FRED series per release (0 = no releases)"
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--no-hedge", action="store_true", help="Disable hedged requests")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmarks for the ingest -> detect pipeline.
+
+Usage:
+  python benchmarks/run_benchmarks.py --save benchmarks/baselines/local.json
+  python benchmarks/run_benchmarks.py --compare benchmarks/baselines/local.json
+  python benchmarks/run_benchmarks.py --sizes 10,100,1000,10000 --repeat 3
+
+--compare exits with status 1 if any benchmark's median is slower than the
+baseline by more than --threshold (default 25%), so it can gate CI.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import fred_fixture, ecb_fixture
+from src.alerts.alert_bus import AlertBus
+from src.alerts.sinks import FileSink
+from src.processing.portfolio import Portfolio
+from src.api.ecb_client import EcbClient
+from src.processing.cleaners import normalise_series
+from src.processing.event_detector import EventDetector
+from src.processing.summaries import build_series_summary
+
+# Differences below this are timer noise, never a regression
+NOISE_FLOOR_S = 0.002
+
+
+def measure(func, repeat: int) -> dict:
+    func()  # Warm-up (imports, caches, first-touch allocation)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "runs": repeat,
+    }
+
+
+def fred_frame() -> pd.DataFrame:
+    # Mirrors FredClient.get_series_data after the HTTP call
+    df = pd.DataFrame(fred_fixture()["observations"])[["date", "value"]]
+    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    df["date"] = pd.to_datetime(df["date"])
+    return df.dropna()
+
+
+class FixtureFred:
+    """Stands in for FredClient: serves fixture frames, one new print per cycle."""
+
+    api_key = "MISSING_KEY"  # Skips the calendar (network only)
+
+    def __init__(self, base: pd.DataFrame):
+        self.base = base
+        self.extra_rows = 0
+
+    def get_series_data(self, series_id, start_date=None, units="lin"):
+        if not self.extra_rows:
+            return self.base
+        last = self.base.iloc[-1]
+        new_dates = pd.date_range(last["date"], periods=self.extra_rows + 1, freq="MS")[1:]
+        new_rows = pd.DataFrame({"date": new_dates, "value": last["value"] * 1.01})
+        return pd.concat([self.base, new_rows], ignore_index=True)
+
+    def get_next_release(self, series_id):
+        return "Pending Schedule"
+
+
+def bench_pipeline(size: int, repeat: int, base: pd.DataFrame) -> dict:
+    """Full run_pipeline cycle over a synthetic portfolio of 'size' series."""
+    from src.processing.scheduler import MacroScheduler
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            scheduler = MacroScheduler()
+            # Quiet but realistic dispatch: alerts go to a JSONL file, not the terminal
+            scheduler.alerts.close()
+            scheduler.alerts = AlertBus([FileSink(os.path.join(tmp, "alerts.jsonl"))])
+            fred = FixtureFred(base)
+            scheduler.fred = fred
+            # Offline: no market overlay downloads for the correlation engine
+            scheduler._market_due = float("inf")
+            # Polling interval 0: every series is due on every cycle
+            scheduler.portfolio = Portfolio.from_items([
+                {"id": f"SYN{i:05d}", "source": "FRED", "name": f"Synthetic {i}", "units": "lin"}
+                for i in range(size)
+            ], {"fast": 0})
+
+            def cycle():
+                # Every cycle lands a new release for every series
+                fred.extra_rows += 1
+                scheduler.run_pipeline()
+
+            scheduler.run_pipeline()  # Initialise last_seen_dates
+            result = measure(cycle, repeat)
+            scheduler.alerts.close()
+            result["per_series_s"] = result["median_s"] / size
+            return result
+        finally:
+            os.chdir(cwd)
+
+
+def run_all(sizes, repeat: int) -> dict:
+    results = {}
+    fred_payload = fred_fixture()
+    ecb_payload = ecb_fixture()
+    ecb = EcbClient()
+    detector = EventDetector(lookback_window=12)
+
+    # 1. Parsing
+    results["parse_sdmx"] = measure(lambda: ecb._parse_sdmx_response(ecb_payload), repeat)
+    results["parse_fred_observations"] = measure(fred_frame, repeat)
+
+    base = fred_frame()
+    clean = normalise_series(base, "FRED", "Synthetic")
+
+    # 2. Processing
+    results["normalise_series"] = measure(lambda: normalise_series(base, "FRED", "Synthetic"), repeat)
+    results["analyze_release"] = measure(lambda: detector.analyze_release(clean), repeat)
+    results["build_series_summary"] = measure(lambda: build_series_summary(clean), repeat)
+
+    # 3. Storage + dashboard loading
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        results["csv_write"] = measure(lambda: clean.to_csv(path, index=False), repeat)
+
+        def dashboard_load():
+            # Same steps as the dashboard's per-file loader
+            df = pd.read_csv(path)
+            df["date"] = pd.to_datetime(df["date"])
+            return df.sort_values("date")
+
+        results["dashboard_load"] = measure(dashboard_load, repeat)
+
+    # 4. End-to-end cycles across portfolio sizes
+    for size in sizes:
+        results[f"run_pipeline[{size}]"] = bench_pipeline(size, max(1, repeat // 5), base)
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, base in baseline["results"].items():
+        current = results.get(name)
+        if current is None:
+            continue
+        delta = current["median_s"] - base["median_s"]
+        ratio = current["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+        status = "OK"
+        if delta > NOISE_FLOOR_S and ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        print(f"{name:<32} {base['median_s']:>10.4f}s -> {current['median_s']:>10.4f}s  x{ratio:5.2f}  {status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Macro Tracker benchmark suite")
+    parser.add_argument("--sizes", default="10,100,1000", help="Portfolio sizes for run_pipeline")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per micro-benchmark")
+    parser.add_argument("--save", help="Write results as a JSON baseline")
+    parser.add_argument("--compare", help="Baseline JSON to gate against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    # Per-cycle INFO lines would dominate the timings of small portfolios
+    logging.disable(logging.INFO)
+    results = run_all(sizes, args.repeat)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
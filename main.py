@@ -1,19 +1,95 @@
 #!/usr/bin/env python3
+import time
+
+_START = time.perf_counter()
+
+import argparse
 import sys
 import os
 
 # Ensure Python finds the src folder
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from src.processing.scheduler import MacroScheduler
+# NOTE: The engine (pandas, clients, scheduler) is imported lazily inside
+# main() so '--once' runs that have nothing to do exit in milliseconds.
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Real-Time Macro Tracker engine")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Shard indicators across N worker processes (0 = single process)",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Run a single headless cycle and exit (cron / CI / serverless)",
+    )
+    parser.add_argument(
+        "--series",
+        default="",
+        help="Comma-separated series names or ids to poll (default: whole portfolio)",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Print startup and run time to stderr",
+    )
+    return parser.parse_args()
+
+
+def report_timing(enabled: bool, label: str, since: float = _START):
+    if enabled:
+        print(f"[timing] {label}: {(time.perf_counter() - since) * 1000:.1f} ms", file=sys.stderr)
 
 
 def main():
-    print("Initializing Real-Time Macro Tracker...")
-    print("Targeting: US CPI, US Unemployment, Eurozone Inflation")
+    args = parse_args()
+    names = [n for n in args.series.split(",") if n.strip()]
+
+    # Resolve --series against config only (YAML, no pandas) before booting
+    if names:
+        from src.processing.portfolio import Portfolio
+        from src.processing.settings import load_settings
+
+        settings = load_settings()
+        portfolio = Portfolio.load(settings["portfolio_file"], settings["polling_classes"])
+        if not portfolio.select(names):
+            print(f"No series in the portfolio match: {', '.join(names)}. Nothing to do.")
+            report_timing(args.timing, "no-op run")
+            return 0
+
+    from src.processing.log_config import configure_logging
+    from src.processing.settings import load_settings
+
+    configure_logging(load_settings()["logging"])
+
+    if not args.once:
+        print("Initializing Real-Time Macro Tracker...")
+        print("Targeting: US CPI, US Unemployment, Eurozone Inflation")
 
     try:
-        scheduler = MacroScheduler()
+        if args.workers:
+            from src.processing.sharded_scheduler import ShardedScheduler
+
+            scheduler = ShardedScheduler(workers=args.workers)
+        else:
+            from src.processing.scheduler import MacroScheduler
+
+            scheduler = MacroScheduler()
+        report_timing(args.timing, "engine startup")
+
+        if args.once:
+            run_start = time.perf_counter()
+            scheduler.run_once(names or None)
+            if args.workers:
+                scheduler.close()
+            report_timing(args.timing, "one-shot cycle", since=run_start)
+            report_timing(args.timing, "total")
+            return 0
+
         scheduler.start()
     except KeyboardInterrupt:
         print("\nStopping Tracker... Goodbye!")
@@ -21,4 +97,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
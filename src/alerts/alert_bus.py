@@ -0,0 +1,159 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Any, List, Tuple
+
+from src.processing.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AlertSink:
+    """
+    Base class for an alert destination.
+    Subclasses implement emit_batch(); a batch is a list of event dicts.
+    """
+
+    name = "sink"
+
+    def emit_batch(self, events: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class _SinkWorker:
+    """One bounded queue + one thread per sink, so a slow sink only delays itself."""
+
+    def __init__(self, sink: AlertSink, queue_size: int, batch_size: int, batch_window: float):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "delivered": 0,
+            "failed": 0,
+            "batches": 0,
+            "max_depth": 0,
+            "last_latency_s": 0.0,
+        }
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(
+            target=self._run, name=f"alert-sink-{sink.name}", daemon=True
+        )
+        self.thread.start()
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+        try:
+            self.queue.put_nowait((time.monotonic(), event))
+        except queue.Full:
+            # Backpressure: never block the detection loop, count the loss instead
+            with self._lock:
+                self.stats["dropped"] += 1
+            METRICS.inc("macro_alerts_dropped_total", sink=self.sink.name)
+            return False
+        with self._lock:
+            self.stats["enqueued"] += 1
+            self.stats["max_depth"] = max(self.stats["max_depth"], self.queue.qsize())
+        return True
+
+    def _collect_batch(self, first) -> Tuple[List, bool]:
+        batch = [first]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _coalesce(self, batch: List) -> List:
+        # Release mornings: keep only the newest alert per (indicator, date)
+        latest = {}
+        for enqueued_at, event in batch:
+            key = (event.get("indicator"), event.get("date"))
+            if key in latest:
+                # Keep the original enqueue time so latency stays honest
+                enqueued_at = min(enqueued_at, latest[key][0])
+            latest[key] = (enqueued_at, event)
+        return list(latest.values())
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self.queue.get()
+            if first is _STOP:
+                break
+            batch, stopping = self._collect_batch(first)
+            merged = self._coalesce(batch)
+            try:
+                with METRICS.timed("alert_dispatch", sink=self.sink.name):
+                    self.sink.emit_batch([event for _, event in merged])
+                outcome = "delivered"
+            except Exception as e:
+                logger.error("Alert sink '%s' failed: %s", self.sink.name, e)
+                outcome = "failed"
+            with self._lock:
+                self.stats[outcome] += len(merged)
+                self.stats["coalesced"] += len(batch) - len(merged)
+                self.stats["batches"] += 1
+                self.stats["last_latency_s"] = round(
+                    time.monotonic() - min(t for t, _ in merged), 4
+                )
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["depth"] = self.queue.qsize()
+        return stats
+
+
+class AlertBus:
+    """
+    Fans detected events out to every registered sink asynchronously.
+    publish() only enqueues, so a slow file system or webhook can never
+    delay detection of the next indicator.
+    """
+
+    def __init__(
+        self,
+        sinks: List[AlertSink],
+        queue_size: int = 1000,
+        batch_size: int = 50,
+        batch_window: float = 0.25,
+    ):
+        self.workers = [
+            _SinkWorker(sink, queue_size, batch_size, batch_window) for sink in sinks
+        ]
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        for worker in self.workers:
+            worker.offer(event)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-sink backpressure metrics (queue depth, drops, latency...)."""
+        return {worker.sink.name: worker.snapshot() for worker in self.workers}
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flushes pending alerts and stops the workers."""
+        for worker in self.workers:
+            try:
+                worker.queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("Alert sink '%s' did not drain in time.", worker.sink.name)
+        for worker in self.workers:
+            worker.thread.join(timeout)
+            worker.sink.close()
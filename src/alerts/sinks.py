@@ -0,0 +1,115 @@
+import json
+import logging
+import logging.handlers
+import os
+import requests
+from typing import Dict, Any, List, Optional
+
+from src.alerts.alert_bus import AlertSink
+from src.alerts.terminal_alerts import print_event_alert
+
+logger = logging.getLogger(__name__)
+
+
+class TerminalSink(AlertSink):
+    """The original coloured terminal printout, now one sink among many."""
+
+    name = "terminal"
+
+    def emit_batch(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            print_event_alert(event)
+
+
+class FileSink(AlertSink):
+    """Appends one JSON line per alert (audit trail)."""
+
+    name = "file"
+
+    def __init__(self, path: str = "data/alerts.jsonl"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def emit_batch(self, events: List[Dict[str, Any]]) -> None:
+        # One write per batch instead of one per alert
+        with open(self.path, "a") as f:
+            f.write("".join(json.dumps(event) + "\n" for event in events))
+
+
+class SyslogSink(AlertSink):
+    """Forwards alerts to the local (or a remote) syslog daemon."""
+
+    name = "syslog"
+
+    def __init__(self, address: str = "/dev/log"):
+        # "host:port" for UDP syslog, otherwise a Unix socket path
+        if ":" in address:
+            host, port = address.rsplit(":", 1)
+            target = (host, int(port))
+        else:
+            target = address
+        self.handler = logging.handlers.SysLogHandler(address=target)
+        self.logger = logging.getLogger("MacroAlerts")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def emit_batch(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            self.logger.warning(
+                "MACRO EVENT %s %s actual=%s expected=%s z=%s (%s)",
+                event.get("indicator"),
+                event.get("date"),
+                event.get("actual"),
+                event.get("expected"),
+                event.get("z_score"),
+                event.get("classification"),
+            )
+
+    def close(self) -> None:
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+
+class WebhookSink(AlertSink):
+    """POSTs each batch as {"events": [...]} to an HTTP endpoint."""
+
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def emit_batch(self, events: List[Dict[str, Any]]) -> None:
+        response = self.session.post(
+            self.url, json={"events": events}, timeout=self.timeout
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def sinks_from_env() -> List[AlertSink]:
+    """
+    Builds the sink list. The terminal is always on; the rest are opt-in:
+    ALERT_FILE_PATH, ALERT_SYSLOG_ADDRESS, ALERT_WEBHOOK_URL.
+    """
+    sinks: List[AlertSink] = [TerminalSink()]
+
+    file_path: Optional[str] = os.getenv("ALERT_FILE_PATH")
+    if file_path:
+        sinks.append(FileSink(file_path))
+
+    syslog_address = os.getenv("ALERT_SYSLOG_ADDRESS")
+    if syslog_address:
+        try:
+            sinks.append(SyslogSink(syslog_address))
+        except OSError as e:
+            logger.warning("Syslog sink disabled: %s", e)
+
+    webhook_url = os.getenv("ALERT_WEBHOOK_URL")
+    if webhook_url:
+        sinks.append(WebhookSink(webhook_url))
+
+    return sinks
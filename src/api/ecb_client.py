@@ -1,10 +1,11 @@
-import requests
 import pandas as pd
 import logging
+import os
 from typing import Optional
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO)
+from src.api.request_policy import get_with_retry
+from src.processing.metrics import METRICS
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,24 +15,33 @@ class EcbClient:
     Ref: https://data.ecb.europa.eu/help/api/overview
     """
 
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
         # UPDATED: New Base URL for ECB Data Portal (Old 'sdw-wsrest' is deprecated)
-        self.base_url = "https://data-api.ecb.europa.eu/service/data"
+        # ECB_BASE_URL lets tests and load runs point at a local simulator
+        self.base_url = (
+            base_url
+            or os.getenv("ECB_BASE_URL")
+            or "https://data-api.ecb.europa.eu/service/data"
+        ).rstrip("/")
 
     def get_series_data(self, flow_ref: str, key: str) -> pd.DataFrame:
-        print(f"--- DEBUG: Requesting {flow_ref}/{key} ---")
+        logger.debug("Requesting %s/%s", flow_ref, key)
 
         url = f"{self.base_url}/{flow_ref}/{key}"
         # 'dataonly' and 'jsondata' are still valid parameters for the new API
         params = {"detail": "dataonly", "format": "jsondata"}
 
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            return self._parse_sdmx_response(response.json())
+            with METRICS.timed("fetch", source="ECB"):
+                # One latency history for all dataflows: the path is per series
+                response = get_with_retry(url, params=params, source="ECB", endpoint="ECB data")
+            METRICS.inc("macro_payload_bytes_total", len(response.content), source="ECB")
+
+            with METRICS.timed("parse", source="ECB"):
+                return self._parse_sdmx_response(response.json())
 
         except Exception as e:
-            print(f"--- DEBUG: API Error: {e} ---")
+            logger.error("Data Request failed for %s/%s: %s", flow_ref, key, e)
             return pd.DataFrame()
 
     def _parse_sdmx_response(self, data: dict) -> pd.DataFrame:
@@ -74,7 +84,7 @@ class EcbClient:
             return df
 
         except Exception as e:
-            print(f"--- DEBUG: Parsing Error: {e} ---")
+            logger.error("Failed to parse SDMX response: %s", e)
             return pd.DataFrame()
 
 
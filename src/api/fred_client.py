@@ -1,10 +1,12 @@
-import requests
 import pandas as pd
 import logging
+import os
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+from src.api.request_policy import get_with_retry
+from src.processing.metrics import METRICS
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -14,9 +16,14 @@ class FredClient:
     Supports Data Fetching AND Release Calendar Scheduling.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
         self.api_key = api_key
-        self.base_url = "https://api.stlouisfed.org/fred"
+        # FRED_BASE_URL lets tests and load runs point at a local simulator
+        self.base_url = (
+            base_url or os.getenv("FRED_BASE_URL") or "https://api.stlouisfed.org/fred"
+        ).rstrip("/")
+        # Release membership never changes, so lookups are kept for the process
+        self._release_ids: Dict[str, Optional[int]] = {}
 
     def get_series_data(
         self, series_id: str, start_date: Optional[str] = None, units: str = "lin"
@@ -32,26 +39,115 @@ class FredClient:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            with METRICS.timed("fetch", source="FRED"):
+                response = get_with_retry(url, params=params, source="FRED")
+            METRICS.inc("macro_payload_bytes_total", len(response.content), source="FRED")
 
-            data = response.json()
-            observations = data.get("observations", [])
+            with METRICS.timed("parse", source="FRED"):
+                data = response.json()
+                observations = data.get("observations", [])
 
-            if not observations:
-                return pd.DataFrame()
+                if not observations:
+                    return pd.DataFrame()
 
-            df = pd.DataFrame(observations)
-            df = df[["date", "value"]]
-            df["value"] = pd.to_numeric(df["value"], errors="coerce")
-            df["date"] = pd.to_datetime(df["date"])
+                df = pd.DataFrame(observations)
+                df = df[["date", "value"]]
+                df["value"] = pd.to_numeric(df["value"], errors="coerce")
+                df["date"] = pd.to_datetime(df["date"])
 
             return df.dropna()
 
         except Exception as e:
-            logger.error(f"Data Request failed for {series_id}: {e}")
+            logger.error("Data Request failed for %s: %s", series_id, e)
             return pd.DataFrame()
 
+    def get_release_observations(
+        self, release_id: int, series_ids: Optional[List[str]] = None, page_size: int = 50000
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Bulk-downloads every series of a release (FRED API v2), following
+        'next_cursor' until 'has_more' is false. Observations are levels
+        ('lin'); see transformers.apply_units for other units.
+        Ref: https://fred.stlouisfed.org/docs/api/fred/v2/api_v2_release_observations.html
+
+        Args:
+            release_id: FRED release (e.g. 10 = Consumer Price Index).
+            series_ids: Keep only these series (the release may hold thousands).
+            page_size: Observations per page.
+
+        Returns:
+            dict: series_id -> [date, value] DataFrame. Empty on failure.
+        """
+        url = f"{self.base_url}/v2/release/observations"
+        wanted = set(series_ids) if series_ids else None
+        rows: Dict[str, List[dict]] = {}
+        cursor = None
+
+        try:
+            while True:
+                # v2 takes the key as a Bearer header only, keeping it out of URLs and logs
+                params = {
+                    "release_id": release_id,
+                    "format": "json",
+                    "limit": page_size,
+                }
+                if cursor:
+                    params["next_cursor"] = cursor
+
+                with METRICS.timed("fetch", source="FRED_RELEASE"):
+                    response = get_with_retry(
+                        url,
+                        params=params,
+                        timeout=30,
+                        source="FRED",
+                        headers={"Authorization": f"Bearer {self.api_key}"},
+                    )
+                METRICS.inc("macro_payload_bytes_total", len(response.content), source="FRED")
+
+                with METRICS.timed("parse", source="FRED_RELEASE"):
+                    page = response.json()
+                    # A series can continue on the next page
+                    for series in page.get("series", []):
+                        series_id = series.get("series_id")
+                        if wanted is None or series_id in wanted:
+                            rows.setdefault(series_id, []).extend(series.get("observations", []))
+
+                cursor = page.get("next_cursor")
+                if not page.get("has_more") or not cursor:
+                    break
+
+            frames = {}
+            with METRICS.timed("parse", source="FRED_RELEASE"):
+                for series_id, observations in rows.items():
+                    df = pd.DataFrame(observations, columns=["date", "value"])
+                    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+                    df["date"] = pd.to_datetime(df["date"])
+                    frames[series_id] = df.dropna()
+            return frames
+
+        except Exception as e:
+            logger.error("Release request failed for release %s: %s", release_id, e)
+            return {}
+
+    def get_release_id(self, series_id: str) -> Optional[int]:
+        """Release a series belongs to (None if FRED lists none). Cached."""
+        if series_id in self._release_ids:
+            return self._release_ids[series_id]
+
+        rel_url = f"{self.base_url}/series/release"
+        params = {
+            "series_id": series_id,
+            "api_key": self.api_key,
+            "file_type": "json",
+        }
+        with METRICS.timed("calendar_fetch", source="FRED"):
+            resp = get_with_retry(rel_url, params=params, timeout=5, source="FRED")
+        releases = resp.json().get("releases", [])
+
+        release_id = int(releases[0]["id"]) if releases else None
+        self._release_ids[series_id] = release_id
+        return release_id
+
     def get_next_release(self, series_id: str) -> str:
         """
         Chains two API calls to find the confirmed Next Release Date.
@@ -60,22 +156,11 @@ class FredClient:
         """
         try:
             # Step 1: Get Release ID
-            rel_url = f"{self.base_url}/series/release"
-            params = {
-                "series_id": series_id,
-                "api_key": self.api_key,
-                "file_type": "json",
-            }
+            release_id = self.get_release_id(series_id)
 
-            resp = requests.get(rel_url, params=params, timeout=5)
-            resp.raise_for_status()
-            releases = resp.json().get("releases", [])
-
-            if not releases:
+            if release_id is None:
                 return "Unknown"
 
-            release_id = releases[0]["id"]
-
             # Step 2: Get Future Dates
             dates_url = f"{self.base_url}/release/dates"
             params = {
@@ -86,7 +171,8 @@ class FredClient:
                 "realtime_start": datetime.now().strftime("%Y-%m-%d"),
             }
 
-            resp = requests.get(dates_url, params=params, timeout=5)
+            with METRICS.timed("calendar_fetch", source="FRED"):
+                resp = get_with_retry(dates_url, params=params, timeout=5, source="FRED")
             dates_data = resp.json().get("release_dates", [])
 
             # Filter for dates >= Today
@@ -99,5 +185,5 @@ class FredClient:
                 return "Pending Schedule"
 
         except Exception as e:
-            logger.warning(f"Calendar fetch failed for {series_id}: {e}")
+            logger.warning("Calendar fetch failed for %s: %s", series_id, e)
             return "Estimate Only"
@@ -0,0 +1,64 @@
+import logging
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.api.request_policy import POLICY, time_left
+from src.processing.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Market overlays, shared by the dashboard selector and the correlation engine
+MARKET_ASSETS = {
+    "S&P 500 (SPY)": "SPY",
+    "US 10Y Treasury Yield": "^TNX",
+    "USD Index (DXY)": "DX-Y",
+    "GBP/USD": "GBPUSD=X",
+    "EUR/USD": "EURUSD=X",
+    "Bitcoin (BTC)": "BTC-USD",
+}
+
+
+class MarketClient:
+    """
+    Month-end closes for the market overlays via Yahoo Finance.
+    yfinance is imported on first use so one-shot runs don't pay for it.
+    yfinance has its own HTTP stack, so the request policy's timeout and
+    any enclosing request_deadline() are applied here explicitly.
+    """
+
+    def __init__(self):
+        self.available = True
+
+    def get_monthly_closes(self, ticker: str, months: int = 72) -> pd.Series:
+        """Last close of each month, indexed by date. Empty on any failure."""
+        if not self.available:
+            return pd.Series(dtype=float)
+        try:
+            import yfinance as yf
+        except ImportError:
+            self.available = False
+            logger.warning("yfinance is not installed; market overlays are skipped.")
+            return pd.Series(dtype=float)
+
+        timeout, left = POLICY.timeout, time_left()
+        if left is not None:
+            if left <= 0:
+                METRICS.inc("macro_http_deadline_exceeded_total", source="MARKET")
+                logger.warning("Market data fetch for %s skipped: cycle deadline passed", ticker)
+                return pd.Series(dtype=float)
+            timeout = min(timeout, left)
+
+        start = datetime.now() - timedelta(days=31 * (months + 1))
+        try:
+            with METRICS.timed("fetch", source="MARKET"):
+                df = yf.download(
+                    ticker, start=start, interval="1mo", progress=False, timeout=timeout
+                )
+            close = df["Close"]
+            if isinstance(close, pd.DataFrame):
+                close = close.iloc[:, 0]
+            return close.dropna()
+        except Exception as e:
+            logger.warning("Market data fetch failed for %s: %s", ticker, e)
+            return pd.Series(dtype=float)
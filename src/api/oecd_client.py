@@ -2,7 +2,6 @@ import pandas as pd
 import logging
 from typing import Optional
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,278 @@
+import requests
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, wait
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from src.processing.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: rate limits and transient server errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+_local = threading.local()
+
+
+class DeadlineExceeded(requests.Timeout):
+    """The caller's deadline passed before (or while) the request could run."""
+
+
+@contextmanager
+def request_deadline(at: Optional[float]):
+    """
+    Bounds every request made in this block, on this thread, by the
+    wall-clock time 'at' (time.time() based, so it can cross processes).
+    Nested deadlines only ever tighten.
+    """
+    previous = getattr(_local, "deadline", None)
+    if at is not None and previous is not None:
+        at = min(at, previous)
+    _local.deadline = at if at is not None else previous
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def time_left() -> Optional[float]:
+    """Seconds until the current deadline, or None without one."""
+    deadline = getattr(_local, "deadline", None)
+    return None if deadline is None else deadline - time.time()
+
+
+class LatencyTracker:
+    """Recent response times per endpoint (bounded window) and their percentiles."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, endpoint: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """q in [0, 100]; None until the endpoint has min_samples responses."""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if not samples or len(samples) < min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+class RequestPolicy:
+    """
+    How a single GET is executed: timeout, deadline and hedging.
+
+    Once an endpoint has enough history, a request still unanswered at the
+    endpoint's hedge percentile (p95 by default) gets a second, identical
+    request; whichever answers first wins and the other is abandoned.
+    Hedges spend from a budget refilled by 'hedge_ratio' per request, so
+    on top of normal load they add at most that fraction (plus a small
+    burst) even when the endpoint is slow across the board.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        hedge: bool = True,
+        hedge_percentile: float = 95,
+        hedge_min_samples: int = 20,
+        hedge_ratio: float = 0.1,
+        hedge_burst: float = 5,
+        min_hedge_delay: float = 0.05,
+        window: int = 200,
+        max_threads: int = 16,
+    ):
+        self.timeout = timeout
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_ratio = hedge_ratio
+        self.hedge_burst = hedge_burst
+        self.min_hedge_delay = min_hedge_delay
+        self.max_threads = max_threads
+        self.latency = LatencyTracker(window)
+        self._tokens = hedge_burst
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def configure(self, settings: Dict[str, Any]):
+        """Applies the 'requests' block of settings.yml (unknown keys are ignored)."""
+        self.timeout = float(settings.get("timeout_seconds", self.timeout))
+        self.hedge = bool(settings.get("hedge", self.hedge))
+        self.hedge_percentile = float(settings.get("hedge_percentile", self.hedge_percentile))
+        self.hedge_min_samples = int(settings.get("hedge_min_samples", self.hedge_min_samples))
+        self.hedge_ratio = float(settings.get("hedge_ratio", self.hedge_ratio))
+        self.hedge_burst = float(settings.get("hedge_burst", self.hedge_burst))
+        self.min_hedge_delay = float(settings.get("min_hedge_delay", self.min_hedge_delay))
+        with self._lock:
+            self._tokens = min(self._tokens, self.hedge_burst)
+
+    def hedge_delay(self, endpoint: str, timeout: float) -> Optional[float]:
+        """When to send the hedge, or None if this request should not be hedged."""
+        if not self.hedge:
+            return None
+        delay = self.latency.percentile(endpoint, self.hedge_percentile, self.hedge_min_samples)
+        if delay is None:
+            return None
+        delay = max(delay, self.min_hedge_delay)
+        # A hedge sent in the last moments before the timeout can't win
+        return delay if delay < timeout * 0.8 else None
+
+    def _earn_token(self):
+        with self._lock:
+            self._tokens = min(self.hedge_burst, self._tokens + self.hedge_ratio)
+
+    def _spend_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_threads, thread_name_prefix="http-hedge"
+                )
+            return self._executor
+
+    def _timed_get(self, endpoint: str, url: str, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            response = requests.get(url, **kwargs)
+        except requests.Timeout:
+            # A timeout is a (censored) sample of the tail, keep it
+            self.latency.observe(endpoint, time.perf_counter() - start)
+            raise
+        # Fast 429/5xx answers would drag the percentiles (and hedge delay) down
+        if response.status_code not in RETRYABLE_STATUS:
+            self.latency.observe(endpoint, time.perf_counter() - start)
+        return response
+
+    def get(
+        self,
+        url: str,
+        endpoint: str,
+        timeout: float,
+        source: str = "HTTP",
+        **kwargs,
+    ) -> requests.Response:
+        """One attempt: a plain GET, hedged when the endpoint's history allows."""
+        self._earn_token()
+        delay = self.hedge_delay(endpoint, timeout)
+        if delay is None:
+            return self._timed_get(endpoint, url, timeout=timeout, **kwargs)
+
+        started = time.perf_counter()
+        first = self._pool().submit(self._timed_get, endpoint, url, timeout=timeout, **kwargs)
+        try:
+            return first.result(timeout=delay)
+        except TimeoutError:
+            pass
+        if not self._spend_token():
+            METRICS.inc("macro_http_hedges_total", source=source, outcome="no_budget")
+            return first.result()
+
+        logger.debug("%s slow past %.3fs, hedging %s", source, delay, endpoint)
+        remaining = max(timeout - (time.perf_counter() - started), 0.001)
+        second = self._pool().submit(self._timed_get, endpoint, url, timeout=remaining, **kwargs)
+
+        # First usable answer wins; an error or retryable status from one
+        # request is only returned if the other fails too
+        pending = {first, second}
+        fallback, error = None, None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except requests.RequestException as e:
+                    error = e
+                    continue
+                if response.status_code in RETRYABLE_STATUS:
+                    fallback = response
+                    continue
+                outcome = "won" if future is second else "lost"
+                METRICS.inc("macro_http_hedges_total", source=source, outcome=outcome)
+                return response
+        METRICS.inc("macro_http_hedges_total", source=source, outcome="failed")
+        if fallback is not None:
+            return fallback
+        raise error
+
+
+# Process-wide policy shared by the API clients (configured from settings.yml)
+POLICY = RequestPolicy()
+
+
+def get_with_retry(
+    url: str,
+    params: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    source: str = "HTTP",
+    retries: int = 2,
+    backoff: float = 0.5,
+    max_wait: float = 5.0,
+    headers: Optional[dict] = None,
+    endpoint: Optional[str] = None,
+    policy: Optional[RequestPolicy] = None,
+) -> requests.Response:
+    """
+    GET with exponential backoff on 429/5xx and connection errors.
+    Honours Retry-After (capped at max_wait) so a rate-limited API is not
+    hammered. Raises the last error if every attempt fails.
+
+    'timeout' caps each attempt (default: the policy's); an enclosing
+    request_deadline() caps attempts and backoff together. 'endpoint' groups
+    latency history for hedging (default: source + URL path).
+    """
+    policy = policy or POLICY
+    cap = policy.timeout if timeout is None else timeout
+    endpoint = endpoint or f"{source} {urlsplit(url).path}"
+
+    for attempt in range(retries + 1):
+        left = time_left()
+        if left is not None and left <= 0:
+            METRICS.inc("macro_http_deadline_exceeded_total", source=source)
+            raise DeadlineExceeded(f"{source} deadline passed before attempt {attempt + 1}")
+        attempt_timeout = cap if left is None else min(cap, left)
+        try:
+            response = policy.get(
+                url, endpoint, attempt_timeout, source, params=params, headers=headers
+            )
+            if response.status_code not in RETRYABLE_STATUS or attempt == retries:
+                response.raise_for_status()
+                return response
+            reason = str(response.status_code)
+            retry_after = response.headers.get("Retry-After")
+            wait_s = float(retry_after) if retry_after and retry_after.isdigit() else backoff * 2**attempt
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == retries:
+                raise
+            reason = type(e).__name__
+            wait_s = backoff * 2**attempt
+
+        wait_s = min(wait_s, max_wait)
+        left = time_left()
+        if left is not None and wait_s >= left:
+            # Backing off would run past the deadline: give up now
+            METRICS.inc("macro_http_deadline_exceeded_total", source=source)
+            raise DeadlineExceeded(f"{source} deadline leaves no room to retry ({reason})")
+        METRICS.inc("macro_http_retries_total", source=source, reason=reason)
+        logger.warning(
+            "%s request retry %d/%d in %.2fs (%s)", source, attempt + 1, retries, wait_s, reason
+        )
+        time.sleep(wait_s)
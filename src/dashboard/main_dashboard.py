@@ -117,22 +117,105 @@ if not chart_files:
             st.stop()
 # ============================
 
+sys.path.append(os.getcwd())
+from src.processing.summaries import load_summary, summary_path, ma_series, build_series_summary, series_fingerprint
+from src.processing.series_store import SharedSeriesReader
+from src.processing.change_feed import ChangeFeedSubscriber
+from src.processing.event_log import EventLog
+from src.processing.portfolio import Portfolio
+from src.processing.settings import load_settings
+from src.processing.correlations import load_correlations, CORRELATIONS_FILE
+from src.processing.surprise_index import load_surprise_history, SURPRISE_FILE, ALL_BASKET
+from src.api.market_client import MARKET_ASSETS as MARKET_TICKERS
+
+SCALED_FIELDS = ["latest", "previous", "delta", "vol_12m", "high_12m", "low_12m", "q01", "q99"]
+
+@st.cache_data(ttl=60)
+def load_portfolio_config():
+    settings = load_settings()
+    return Portfolio.load(settings["portfolio_file"], settings["polling_classes"]).items
+
+@st.cache_resource
+def get_change_feed():
+    # One subscriber per server process, shared by every browser session
+    return ChangeFeedSubscriber().start()
+
+@st.cache_resource
+def get_series_store():
+    # Memory-mapped series written by the engine: one copy per host, whatever the session count
+    return SharedSeriesReader()
+
+@st.cache_resource(max_entries=256)
+def load_series(path, version, stamp):
+    # 'version' comes from the change feed and 'stamp' from the shared store file,
+    # so only changed series are re-mapped. Results are shared by every session:
+    # treat them as read-only.
+    name = os.path.basename(path).replace(".csv", "").replace("_", " ").upper()
+    shared = get_series_store().frame(os.path.basename(path)) if stamp else None
+    if shared is not None:
+        df, ma = shared
+    else:
+        # Shared store not written yet (older engine): private copy for this process
+        df = pd.read_csv(path, usecols=['date', 'value'])
+        df['date'] = pd.to_datetime(df['date'])
+        df = df.sort_values('date').reset_index(drop=True)
+        ma = None
+    
+    # Precomputed by the scheduler; only rebuilt here if missing or stale
+    summary = load_summary(summary_path(path))
+    if summary is None or summary.get("fingerprint") != series_fingerprint(df):
+        summary = build_series_summary(df)
+    summary["ma"] = ma if ma is not None else ma_series(summary)
+    
+    # NFP Logic: 159 -> 159,000
+    if "NFP" in name or "PAYROLL" in name:
+        df = df.assign(value=df['value'] * 1000)
+        for field in SCALED_FIELDS:
+            if summary.get(field) is not None:
+                summary[field] = summary[field] * 1000
+        summary["ma"] = summary["ma"] * 1000
+    
+    return name, df, summary
+
+change_feed = get_change_feed()
+series_store = get_series_store()
+feed_versions = {}
+series_versions = {}
+
 data_store = {}
+summary_store = {}
 for f in chart_files:
     try:
-        name = os.path.basename(f).replace(".csv", "").replace("_", " ").upper()
-        df = pd.read_csv(f)
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
-        
-        # NFP Logic: 159 -> 159,000
-        if "NFP" in name or "PAYROLL" in name:
-            df['value'] = df['value'] * 1000
-            
+        file_key = os.path.basename(f)
+        feed_versions[file_key] = change_feed.version(file_key)
+        series_versions[file_key] = (feed_versions[file_key], series_store.stamp(file_key))
+        name, df, summary = load_series(f, *series_versions[file_key])
         data_store[name] = df
+        summary_store[name] = summary
     except Exception:
         pass
 
+@st.cache_data
+def load_correlation_snapshot(version):
+    # Maintained incrementally by the engine; the dashboard only reads it
+    return load_correlations()
+
+feed_versions[CORRELATIONS_FILE] = change_feed.version(CORRELATIONS_FILE)
+
+@st.cache_data
+def load_surprise_index(version):
+    # Appended to incrementally by the engine; re-read only when it publishes
+    return load_surprise_history()
+
+feed_versions[SURPRISE_FILE] = change_feed.version(SURPRISE_FILE)
+
+# --- LIVE UPDATES (pushed by the engine, no filesystem polling) ---
+@st.fragment(run_every="1s")
+def watch_change_feed():
+    # Only checks an in-memory counter; a rerun re-reads just the changed files
+    if change_feed.changed_since(feed_versions):
+        st.rerun()
+
 # --- 4. MARKET DATA ENGINE ---
 @st.cache_data(ttl=3600)
 def fetch_market_data(ticker, start_date):
@@ -145,15 +228,7 @@ def fetch_market_data(ticker, start_date):
     except Exception:
         return pd.Series()
 
-MARKET_ASSETS = {
-    "None": None,
-    "S&P 500 (SPY)": "SPY",
-    "US 10Y Treasury Yield": "^TNX",
-    "USD Index (DXY)": "DX-Y",
-    "GBP/USD": "GBPUSD=X",
-    "EUR/USD": "EURUSD=X",
-    "Bitcoin (BTC)": "BTC-USD"
-}
+MARKET_ASSETS = {"None": None, **MARKET_TICKERS}
 
 # --- 5. SIDEBAR CONFIGURATION ---
 if st.sidebar.button("REFRESH DATA", use_container_width=True):
@@ -162,16 +237,16 @@ if st.sidebar.button("REFRESH DATA", use_container_width=True):
 st.sidebar.markdown("---")
 st.sidebar.caption(f"Tracking {len(data_store)} Macro Indicators")
 st.sidebar.caption("Source: FRED / ECB Data Portal")
+st.sidebar.caption("Live Feed: CONNECTED" if change_feed.connected else "Live Feed: OFFLINE (manual refresh)")
+with st.sidebar:
+    watch_change_feed()
 
 # --- CUSTOM SORT ORDER ---
-DISPLAY_ORDER = [
-    "US CPI",
-    "US PPI",
-    "US NFP",
-    "US UNEMPLOYMENT",
-    "UK INFLATION",
-    "EUROZONE INFLATION"
-]
+# Follows config/portfolio.yml order
+try:
+    DISPLAY_ORDER = [item["name"].upper() for item in load_portfolio_config()]
+except Exception:
+    DISPLAY_ORDER = sorted(data_store.keys())
 
 sorted_data_store = {}
 for key in DISPLAY_ORDER:
@@ -194,10 +269,9 @@ cols = st.columns(len(sorted_data_store))
 for idx, (name, df) in enumerate(sorted_data_store.items()):
     if df.empty: continue
     
-    latest = df.iloc[-1]
-    prev = df.iloc[-2] if len(df) > 1 else latest
-    val = latest['value']
-    delta = val - prev['value']
+    summary = summary_store[name]
+    val = summary['latest']
+    delta = summary['delta']
     
     # Conditional Formatting
     if "NFP" in name:
@@ -218,7 +292,7 @@ for idx, (name, df) in enumerate(sorted_data_store.items()):
 st.markdown("<br><br>", unsafe_allow_html=True)
 
 # --- 8. MAIN WORKSPACE ---
-tab_chart, tab_data, tab_cal = st.tabs(["ANALYTICS & CHARTING", "RAW DATA LOG", "UPCOMING CALENDAR"])
+tab_chart, tab_surprise, tab_corr, tab_data, tab_events, tab_cal = st.tabs(["ANALYTICS & CHARTING", "SURPRISE INDEX", "CORRELATIONS", "RAW DATA LOG", "EVENT HISTORY", "UPCOMING CALENDAR"])
 
 with tab_chart:
     st.markdown("##")
@@ -238,20 +312,12 @@ with tab_chart:
         st.markdown("---")
         
         df_chart = sorted_data_store[selected_series]
+        chart_summary = summary_store[selected_series]
         
-        # 12M Stats Logic
-        latest_date = df_chart['date'].max()
-        cutoff_date = latest_date - pd.DateOffset(years=1)
-        stats_df = df_chart[df_chart['date'] > cutoff_date]
-        
-        if not stats_df.empty:
-            current_vol = stats_df['value'].std()
-            high_12m = stats_df['value'].max()
-            low_12m = stats_df['value'].min()
-        else:
-            current_vol = df_chart['value'].std()
-            high_12m = df_chart['value'].max()
-            low_12m = df_chart['value'].min()
+        # 12M Stats Logic (precomputed at ingest)
+        current_vol = chart_summary['vol_12m'] if chart_summary['vol_12m'] is not None else float('nan')
+        high_12m = chart_summary['high_12m']
+        low_12m = chart_summary['low_12m']
         
         st.markdown(f"""
         <div style='background-color: #121212; padding: 10px; border: 1px solid #333;'>
@@ -271,8 +337,8 @@ with tab_chart:
         min_date_ts = max_date_ts - pd.DateOffset(years=10)
         
         # Smart Scaling Calculation
-        y_lower = df_chart['value'].quantile(0.01)
-        y_upper = df_chart['value'].quantile(0.99)
+        y_lower = chart_summary['q01']
+        y_upper = chart_summary['q99']
         y_buffer = (y_upper - y_lower) * 0.1 if y_upper != y_lower else 1.0
         final_y_min = y_lower - y_buffer
         final_y_max = y_upper + y_buffer
@@ -287,9 +353,8 @@ with tab_chart:
             fill='tozeroy', fillcolor='rgba(0, 227, 150, 0.1)' 
         ))
         
-        df_chart['MA'] = df_chart['value'].rolling(window=12).mean()
         fig.add_trace(go.Scatter(
-            x=df_chart['date'], y=df_chart['MA'],
+            x=df_chart['date'], y=chart_summary['ma'],
             mode='lines', name='12M Trend',
             line=dict(color='#FF8C00', width=1)
         ))
@@ -367,13 +432,116 @@ with tab_chart:
         )
         st.plotly_chart(fig, use_container_width=True, config={'scrollZoom': True, 'displayModeBar': True})
 
+with tab_surprise:
+    st.markdown("##")
+    surprise_df = load_surprise_index(feed_versions[SURPRISE_FILE])
+    
+    if not surprise_df.empty:
+        baskets = [ALL_BASKET] + sorted(b for b in surprise_df["basket"].unique() if b != ALL_BASKET)
+        c_basket, c_info = st.columns([1, 2])
+        with c_basket:
+            basket = st.selectbox("Basket:", baskets)
+        with c_info:
+            st.caption(
+                "Decayed, weighted mean of each print's surprise z-score per region "
+                "(>0: data beating expectations). Set region / basket / surprise_weight in portfolio.yml."
+            )
+        
+        # One line per region; several prints on one day keep the last value
+        shown = surprise_df[surprise_df["basket"] == basket].drop_duplicates(["date", "region"], keep="last")
+        fig = go.Figure()
+        for region, region_df in shown.groupby("region"):
+            fig.add_trace(go.Scatter(
+                x=region_df["date"], y=region_df["index"], name=region,
+                mode="lines", line=dict(width=2, shape="hv")
+            ))
+        fig.add_hline(y=0, line_dash="dot", line_color="#666")
+        fig.update_layout(
+            height=550,
+            paper_bgcolor="#000000", plot_bgcolor="#000000",
+            margin=dict(l=60, r=60, t=30, b=50),
+            xaxis=dict(showgrid=False, tickfont=dict(color='#ccc')),
+            yaxis=dict(title="Surprise index (z)", gridcolor="#333", tickfont=dict(color='#ccc')),
+            legend=dict(orientation="h", y=1.05, x=0.5, xanchor="center", bgcolor="rgba(0,0,0,0)", font=dict(color="#ccc")),
+            font=dict(color="#ccc")
+        )
+        st.plotly_chart(fig, use_container_width=True, config={'scrollZoom': True, 'displayModeBar': True})
+    else:
+        st.info("Surprise index not built yet. Add 'region' to series in config/portfolio.yml and run 'python3 main.py'.")
+
+with tab_corr:
+    st.markdown("##")
+    corr = load_correlation_snapshot(feed_versions[CORRELATIONS_FILE])
+    
+    if corr and corr["names"]:
+        c_lag, c_info = st.columns([1, 2])
+        with c_lag:
+            lag = st.select_slider("Lead / Lag (months, rows lead columns):", options=corr["lags"], value=0)
+        with c_info:
+            st.caption(
+                f"Rolling {corr['window']}M correlation of monthly changes "
+                f"(min {corr['min_periods']} overlapping months). "
+                f"Data through {corr['latest_month']}, updated {corr['updated_at']}."
+            )
+        
+        labels = [name.upper() if name not in MARKET_TICKERS else name for name in corr["names"]]
+        matrix = corr["matrices"][str(lag)]
+        heatmap = go.Figure(go.Heatmap(
+            z=matrix, x=labels, y=labels,
+            zmin=-1, zmax=1, colorscale="RdBu", reversescale=True,
+            text=[[f"{v:.2f}" if v is not None else "" for v in row] for row in matrix],
+            texttemplate="%{text}", hovertemplate="%{y} vs %{x}: %{z:.2f}<extra></extra>"
+        ))
+        heatmap.update_layout(
+            height=600,
+            paper_bgcolor="#000000", plot_bgcolor="#000000",
+            margin=dict(l=60, r=60, t=30, b=50),
+            xaxis=dict(tickfont=dict(color='#ccc'), side="bottom"),
+            yaxis=dict(tickfont=dict(color='#ccc'), autorange="reversed"),
+            font=dict(color="#ccc")
+        )
+        st.plotly_chart(heatmap, use_container_width=True)
+        
+        # Strongest lead/lag per pair, read off the same cached matrices
+        best_rows = []
+        for i, leader in enumerate(labels):
+            for j, follower in enumerate(labels):
+                best = corr["best_lag"][i][j]
+                value = corr["matrices"][str(best)][i][j]
+                if i < j and value is not None:
+                    best_rows.append({"Pair": f"{leader} / {follower}", "Best Lag (M)": best, "Correlation": value})
+        if best_rows:
+            best_df = pd.DataFrame(best_rows)
+            best_df = best_df.reindex(best_df["Correlation"].abs().sort_values(ascending=False).index)
+            st.dataframe(
+                best_df,
+                column_config={
+                    "Correlation": st.column_config.NumberColumn("Correlation", format="%.2f"),
+                    "Best Lag (M)": st.column_config.NumberColumn("Best Lag (M, +: first leads)")
+                },
+                use_container_width=True,
+                height=300,
+                hide_index=True
+            )
+    else:
+        st.info("Correlation matrix not built yet. Run 'python3 main.py' to start the engine.")
+
+@st.cache_resource(max_entries=4)
+def build_master_log(_store, _sources, versions):
+    # One long-format log per data version, shared by every session (filters copy only what they show)
+    frames = [
+        df.assign(indicator=name, source=_sources.get(name, ""))
+        for name, df in _store.items()
+    ]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["date", "value", "indicator", "source"])
+
 with tab_data:
     st.markdown("##")
-    master_log = pd.DataFrame()
-    for name, df in sorted_data_store.items():
-        temp = df.copy()
-        temp['indicator'] = name
-        master_log = pd.concat([master_log, temp])
+    try:
+        source_by_name = {item["name"].upper(): item["source"] for item in load_portfolio_config()}
+    except Exception:
+        source_by_name = {}
+    master_log = build_master_log(sorted_data_store, source_by_name, tuple(sorted(series_versions.items())))
     
     all_indicators = DISPLAY_ORDER
     c_filter, _ = st.columns([1, 2])
@@ -395,7 +563,8 @@ with tab_data:
         else:
             return f"{val:,.2f}"
 
-    display_df = filtered_log.copy()
+    # sort_values already returned a private frame; no extra copy of the log
+    display_df = filtered_log
     display_df['Actual Value'] = display_df.apply(format_for_display, axis=1)
     
     st.dataframe(
@@ -412,6 +581,52 @@ with tab_data:
         hide_index=True
     )
 
+@st.cache_resource
+def get_event_log():
+    return EventLog()
+
+with tab_events:
+    st.markdown("##")
+    event_log = get_event_log()
+    
+    c_ev_ind, c_ev_cls, c_ev_range = st.columns([2, 2, 2])
+    with c_ev_ind:
+        event_indicators = st.multiselect("Filter by Indicator:", options=list(event_log.latest_dates().keys()))
+    with c_ev_cls:
+        event_classes = st.multiselect(
+            "Filter by Classification:",
+            options=["Large Positive Surprise", "Large Negative Surprise", "Moderate Surprise", "Neutral"]
+        )
+    with c_ev_range:
+        event_range = st.date_input("Observation Date Range:", value=(), format="DD/MM/YYYY")
+    
+    start_date, end_date = (event_range + (None, None))[:2] if event_range else (None, None)
+    events = event_log.query(
+        start=start_date, end=end_date,
+        indicators=event_indicators, classifications=event_classes
+    )
+    
+    if events:
+        st.dataframe(
+            pd.DataFrame(events),
+            column_config={
+                "obs_date": st.column_config.DateColumn("Observation", format="DD/MM/YYYY"),
+                "indicator": "Indicator ID",
+                "classification": "Analysis",
+                "z_score": st.column_config.NumberColumn("Z-Score", format="%.2f"),
+                "actual": "Actual",
+                "expected": "Expected",
+                "surprise": "Surprise",
+                "emitted_at": "Alerted At"
+            },
+            column_order=["obs_date", "indicator", "classification", "z_score", "actual", "expected", "surprise", "emitted_at"],
+            use_container_width=True,
+            height=600,
+            hide_index=True
+        )
+    else:
+        st.info("No alerts recorded for this selection yet.")
+
 with tab_cal:
     st.markdown("##")
     try:
@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Dict, Any, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = os.getenv("MACRO_FEED_SOCKET", "data/feed.sock")
+
+
+class ChangeFeedPublisher:
+    """
+    Scheduler side of the local change feed.
+    Broadcasts one JSON line per changed series over a Unix domain socket.
+    New subscribers get the latest message for every series on connect,
+    so a dashboard started mid-session is immediately in sync.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+        # Seeded from the clock so sequence numbers stay monotonic across restarts
+        self.seq = int(time.time() * 1000)
+        self._clients: List[socket.socket] = []
+        self._snapshot: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[socket.socket] = None
+
+    def start(self) -> bool:
+        if not hasattr(socket, "AF_UNIX"):
+            logger.warning("Unix sockets unavailable on this platform. Change feed disabled.")
+            return False
+
+        try:
+            os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        except OSError as e:
+            logger.warning("Change feed could not create %s (%s). Disabled.", self.socket_path, e)
+            return False
+        if os.path.exists(self.socket_path):
+            # Only a stale file from a crashed engine may be removed; a live
+            # one belongs to another engine and its dashboards
+            stale = False
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(self.socket_path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    stale = True
+                except OSError:
+                    pass
+            if not stale:
+                logger.warning(
+                    "Another engine owns the change feed at %s. Change feed disabled.",
+                    self.socket_path,
+                )
+                return False
+            try:
+                os.remove(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.socket_path)
+            server.listen()
+        except OSError as e:
+            server.close()
+            logger.warning("Change feed could not listen on %s (%s). Disabled.", self.socket_path, e)
+            return False
+        self._server = server
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        logger.info("Change feed listening on %s", self.socket_path)
+        return True
+
+    def _accept_loop(self):
+        while self._server is not None:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            # A wedged dashboard must never stall the polling cycle
+            client.settimeout(1.0)
+            with self._lock:
+                try:
+                    for line in self._snapshot.values():
+                        client.sendall(line.encode())
+                except OSError:
+                    client.close()
+                    continue
+                self._clients.append(client)
+
+    def publish(self, series: str, file: str, latest_date: str, tail: List[list]) -> None:
+        """Sends the changed series and its newest rows to every subscriber."""
+        with self._lock:
+            self.seq += 1
+            message = {
+                "seq": self.seq,
+                "series": series,
+                "file": file,
+                "latest_date": latest_date,
+                "tail": tail,
+                "ts": time.time(),
+            }
+            line = json.dumps(message) + "\n"
+            self._snapshot[file] = line
+
+            alive = []
+            for client in self._clients:
+                try:
+                    client.sendall(line.encode())
+                    alive.append(client)
+                except OSError:
+                    client.close()
+            self._clients = alive
+
+    def close(self):
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients = []
+        # Never unlink a socket this publisher did not bind
+        if server is not None and os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class ChangeFeedSubscriber:
+    """
+    Dashboard side of the change feed.
+    A background thread keeps the latest message per file in memory and
+    reconnects if the engine restarts. Readers only touch memory.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, retry_seconds: float = 2.0):
+        self.socket_path = socket_path
+        self.retry_seconds = retry_seconds
+        self.seq = 0
+        self.connected = False
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "ChangeFeedSubscriber":
+        if hasattr(socket, "AF_UNIX"):
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(self.socket_path)
+                    self.connected = True
+                    for line in sock.makefile("r"):
+                        self._handle(line)
+            except OSError:
+                pass
+            self.connected = False
+            time.sleep(self.retry_seconds)
+
+    def _handle(self, line: str):
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return
+        with self._lock:
+            self.latest[message["file"]] = message
+            self.seq += 1
+
+    def version(self, file: str) -> int:
+        """Monotonic per-file counter, used as a cache key by readers."""
+        with self._lock:
+            message = self.latest.get(file)
+            return message["seq"] if message else 0
+
+    def changed_since(self, versions: Dict[str, int]) -> Set[str]:
+        with self._lock:
+            return {
+                name
+                for name, message in self.latest.items()
+                if message["seq"] != versions.get(name, 0)
+            }
@@ -1,8 +1,6 @@
 import pandas as pd
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +21,7 @@ def normalise_series(df: pd.DataFrame, source: str, indicator: str) -> pd.DataFr
     """
     # 1. Safety Check: Handle empty inputs (e.g., from failed API calls)
     if df.empty:
-        logger.warning(f"Received empty DataFrame for {indicator} ({source})")
+        logger.warning("Received empty DataFrame for %s (%s)", indicator, source)
         return pd.DataFrame(columns=["date", "value", "indicator", "source"])
 
     # 2. Copy to avoid SettingWithCopy warnings
@@ -36,7 +34,7 @@ def normalise_series(df: pd.DataFrame, source: str, indicator: str) -> pd.DataFr
 
     required_cols = {"date", "value"}
     if not required_cols.issubset(clean_df.columns):
-        logger.error(f"Data missing required columns. Found: {clean_df.columns}")
+        logger.error("Data missing required columns. Found: %s", list(clean_df.columns))
         return pd.DataFrame()
 
     # 4. Type Enforcement
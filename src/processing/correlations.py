@@ -0,0 +1,258 @@
+import json
+import math
+import os
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+CORRELATIONS_FILE = "correlations.json"
+CORRELATIONS_PATH = os.path.join("data/processed", CORRELATIONS_FILE)
+
+
+def month_index(date) -> int:
+    """Months since year 0; monthly and month-end dates of one month collide."""
+    ts = pd.Timestamp(date)
+    return ts.year * 12 + ts.month - 1
+
+
+def month_label(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+class _PairStats:
+    """
+    Running sums for corr(x[t - lag], y[t]) over a sliding window of months.
+    Contributions are kept per month so a revision or an expiring month is
+    subtracted exactly instead of triggering a recompute.
+    """
+
+    __slots__ = ("n", "sx", "sy", "sxx", "syy", "sxy", "points")
+
+    def __init__(self):
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.syy = self.sxy = 0.0
+        # month -> (x, y), in arrival order (months mostly arrive in order)
+        self.points: "OrderedDict[int, Tuple[float, float]]" = OrderedDict()
+
+    def _apply(self, x: float, y: float, sign: int):
+        self.n += sign
+        self.sx += sign * x
+        self.sy += sign * y
+        self.sxx += sign * x * x
+        self.syy += sign * y * y
+        self.sxy += sign * x * y
+
+    def put(self, month: int, x: float, y: float):
+        old = self.points.get(month)
+        if old is not None:
+            self._apply(old[0], old[1], -1)
+        self.points[month] = (x, y)
+        self._apply(x, y, 1)
+
+    def drop(self, month: int):
+        old = self.points.pop(month, None)
+        if old is not None:
+            self._apply(old[0], old[1], -1)
+
+    def expire(self, cutoff: int):
+        while self.points:
+            month = next(iter(self.points))
+            if month >= cutoff:
+                break
+            self.drop(month)
+
+    def corr(self, min_periods: int) -> Optional[float]:
+        if self.n < min_periods:
+            return None
+        cov = self.n * self.sxy - self.sx * self.sy
+        var_x = self.n * self.sxx - self.sx * self.sx
+        var_y = self.n * self.syy - self.sy * self.sy
+        if var_x <= 1e-12 or var_y <= 1e-12:
+            return None
+        return max(-1.0, min(1.0, cov / math.sqrt(var_x * var_y)))
+
+
+class CorrelationEngine:
+    """
+    Rolling correlation and lead/lag matrices across macro series and
+    market assets, on monthly changes.
+
+    Every (leader, follower, lag) pair keeps running sums, so a new or
+    revised observation costs O(series x lags) updates; the matrices are
+    read straight off the sums. Lag k means the leader's change k months
+    earlier against the follower's change this month.
+    """
+
+    def __init__(self, window: int = 60, max_lag: int = 6, min_periods: int = 12):
+        self.window = window
+        self.max_lag = max_lag
+        self.min_periods = min_periods
+        self.names: List[str] = []
+        self._transform: Dict[str, str] = {}
+        # Per series: month -> level, and month -> change vs previous month
+        self._levels: Dict[str, Dict[int, float]] = {}
+        self._changes: Dict[str, Dict[int, float]] = {}
+        # Values are shifted by the first change seen, which keeps the
+        # squared sums small and the subtraction stable
+        self._shift: Dict[str, float] = {}
+        self._pairs: Dict[Tuple[str, str, int], _PairStats] = {}
+        self.latest_month = 0
+        self.dirty = False
+
+    def track(self, name: str, transform: str = "diff"):
+        """Registers a series. 'diff' for macro levels/rates, 'logret' for prices."""
+        if name in self._transform:
+            return
+        self._transform[name] = transform
+        self._levels[name] = {}
+        self._changes[name] = {}
+        for other in self.names:
+            for lag in range(self.max_lag + 1):
+                self._pairs[(name, other, lag)] = _PairStats()
+                self._pairs[(other, name, lag)] = _PairStats()
+        self._pairs[(name, name, 0)] = _PairStats()
+        self.names.append(name)
+
+    def update(self, name: str, date, value: float) -> bool:
+        """Feeds one level observation. Returns False if nothing changed."""
+        if name not in self._transform:
+            return False
+        if value is None or not np.isfinite(value):
+            return False
+        month = month_index(date)
+        levels = self._levels[name]
+        if levels.get(month) == value:
+            return False
+        levels[month] = float(value)
+        # Keep only what the window and lags can still reach
+        horizon = max(self.latest_month, month) - self.window - self.max_lag - 1
+        changes = self._changes[name]
+        for old in [m for m in levels if m < horizon]:
+            del levels[old]
+            changes.pop(old, None)
+
+        # A level moves its own change and the following month's change
+        self._refresh_change(name, month)
+        self._refresh_change(name, month + 1)
+
+        if month > self.latest_month:
+            self.latest_month = month
+            cutoff = month - self.window + 1
+            for stats in self._pairs.values():
+                stats.expire(cutoff)
+        self.dirty = True
+        return True
+
+    def update_series(self, name: str, dates, values) -> int:
+        """Feeds several observations (a tail or a backfill); returns how many changed."""
+        return sum(self.update(name, d, v) for d, v in zip(dates, values))
+
+    def _change(self, name: str, month: int) -> Optional[float]:
+        levels = self._levels[name]
+        current, previous = levels.get(month), levels.get(month - 1)
+        if current is None or previous is None:
+            return None
+        if self._transform[name] == "logret":
+            if current <= 0 or previous <= 0:
+                return None
+            return math.log(current / previous)
+        return current - previous
+
+    def _refresh_change(self, name: str, month: int):
+        change = self._change(name, month)
+        changes = self._changes[name]
+        if change is None:
+            if changes.pop(month, None) is not None:
+                self._touch(name, month, None)
+            return
+        shift = self._shift.setdefault(name, change)
+        change -= shift
+        if changes.get(month) == change:
+            return
+        changes[month] = change
+        self._touch(name, month, change)
+
+    def _touch(self, name: str, month: int, change: Optional[float]):
+        """Re-applies every pair contribution that involves name's change at month."""
+        cutoff = self.latest_month - self.window + 1
+        for other in self.names:
+            other_changes = self._changes[other]
+            for lag in range(self.max_lag + 1):
+                if other == name and lag:
+                    continue
+                # name as leader: x = name[month], y = other[month + lag]
+                target = month + lag
+                stats = self._pairs[(name, other, lag)]
+                y = other_changes.get(target)
+                if change is None or y is None or target < cutoff:
+                    stats.drop(target)
+                else:
+                    stats.put(target, change, y)
+                if other == name:
+                    continue
+                # name as follower: x = other[month - lag], y = name[month]
+                stats = self._pairs[(other, name, lag)]
+                x = other_changes.get(month - lag)
+                if change is None or x is None or month < cutoff:
+                    stats.drop(month)
+                else:
+                    stats.put(month, x, change)
+
+    def correlation(self, leader: str, follower: str, lag: int = 0) -> Optional[float]:
+        if lag < 0:
+            leader, follower, lag = follower, leader, -lag
+        if leader == follower:
+            return 1.0 if lag == 0 else None
+        stats = self._pairs.get((leader, follower, lag))
+        return stats.corr(self.min_periods) if stats else None
+
+    def matrix(self, lag: int = 0) -> pd.DataFrame:
+        """Rows lead columns by 'lag' months (negative: columns lead)."""
+        return pd.DataFrame(
+            [[self.correlation(a, b, lag) for b in self.names] for a in self.names],
+            index=self.names,
+            columns=self.names,
+            dtype=float,
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready view for the dashboard: one matrix per lag plus the best lag."""
+        lags = list(range(-self.max_lag, self.max_lag + 1))
+        matrices = {str(lag): self.matrix(lag) for lag in lags}
+        stacked = np.stack([matrices[str(lag)].to_numpy() for lag in lags])
+        magnitude = np.where(np.isnan(stacked), -1.0, np.abs(stacked))
+        best = np.asarray(lags)[magnitude.argmax(axis=0)]
+        best = np.where(np.isnan(stacked).all(axis=0), 0, best)
+
+        def to_lists(values):
+            return [[None if pd.isna(v) else round(float(v), 4) for v in row] for row in values]
+
+        return {
+            "names": list(self.names),
+            "window": self.window,
+            "min_periods": self.min_periods,
+            "lags": lags,
+            "latest_month": month_label(self.latest_month) if self.latest_month else None,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "matrices": {lag: to_lists(m.to_numpy()) for lag, m in matrices.items()},
+            "best_lag": best.tolist(),
+        }
+
+
+def write_correlations(snapshot: Dict[str, Any], path: str = CORRELATIONS_PATH) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_path, path)
+
+
+def load_correlations(path: str = CORRELATIONS_PATH) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
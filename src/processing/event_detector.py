@@ -3,7 +3,6 @@ import numpy as np
 import logging
 from typing import Dict, Any
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -75,6 +74,18 @@ class EventDetector:
 
         return result
 
+    def z_scores(self, history: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scores every print of a history the way analyze_release scores the
+        latest one without a consensus (trailing mean and std), in one pass.
+        Returns [date, z_score]; prints without a full lookback are dropped.
+        """
+        df = history.sort_values(by="date", ascending=True)
+        prior = df["value"].shift(1).rolling(self.lookback_window - 1)
+        mean, std = prior.mean(), prior.std()
+        z_score = ((df["value"] - mean) / std).mask(std == 0, 0.0).round(2)
+        return pd.DataFrame({"date": df["date"], "z_score": z_score}).dropna()
+
 
 if __name__ == "__main__":
     # Test Data: History has slight noise (normal market), then a BIG jump
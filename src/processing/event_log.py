@@ -0,0 +1,144 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVENT_DB = "data/events.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    indicator TEXT NOT NULL,
+    obs_date TEXT NOT NULL,
+    vintage TEXT NOT NULL,
+    classification TEXT,
+    z_score REAL,
+    actual REAL,
+    expected REAL,
+    surprise REAL,
+    emitted_at TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    UNIQUE (indicator, obs_date, vintage)
+);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (obs_date);
+CREATE INDEX IF NOT EXISTS idx_events_indicator_date ON events (indicator, obs_date);
+CREATE INDEX IF NOT EXISTS idx_events_class_date ON events (classification, obs_date);
+"""
+
+
+def _as_date_str(value) -> str:
+    # Accepts pandas Timestamps, datetimes or ISO strings
+    if hasattr(value, "date"):
+        return str(value.date())
+    return str(value)[:10]
+
+
+class EventLog:
+    """
+    Durable, append-only record of every alert the engine has emitted.
+    Ref: event_detection_logic.txt
+
+    Keyed by (indicator, observation date, vintage). A vintage is the
+    released value, so a revised print of the same month counts as a new
+    event while a re-poll of an unchanged release never does.
+    The UNIQUE constraint makes claim() safe across restarts and across
+    several scheduler instances sharing the same database.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_EVENT_DB):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+        # WAL: readers (the dashboard) never block the writer
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._seen = set(
+            self._conn.execute("SELECT indicator, obs_date, vintage FROM events")
+        )
+
+    @staticmethod
+    def make_key(indicator: str, obs_date, vintage) -> tuple:
+        return (indicator, _as_date_str(obs_date), str(vintage))
+
+    def seen(self, indicator: str, obs_date, vintage) -> bool:
+        """O(1) in-memory check, no database round trip."""
+        return self.make_key(indicator, obs_date, vintage) in self._seen
+
+    def claim(self, indicator: str, obs_date, vintage, event: Dict[str, Any]) -> bool:
+        """
+        Records the event and returns True if this caller should dispatch it.
+        Returns False if it was already emitted (by us or another instance).
+        """
+        key = self.make_key(indicator, obs_date, vintage)
+        if key in self._seen:
+            return False
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO events (indicator, obs_date, vintage, classification,"
+                " z_score, actual, expected, surprise, emitted_at, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    event.get("classification"),
+                    event.get("z_score"),
+                    event.get("actual"),
+                    event.get("expected"),
+                    event.get("surprise"),
+                    datetime.now().isoformat(timespec="seconds"),
+                    json.dumps(event, default=str),
+                ),
+            )
+        self._seen.add(key)
+        return cursor.rowcount == 1
+
+    def latest_dates(self) -> Dict[str, str]:
+        """Newest emitted observation date per indicator (seeds the scheduler)."""
+        rows = self._conn.execute(
+            "SELECT indicator, MAX(obs_date) FROM events GROUP BY indicator"
+        )
+        return dict(rows)
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        indicators: Optional[Iterable[str]] = None,
+        classifications: Optional[Iterable[str]] = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Range query by date, indicator and classification (index-backed)."""
+        clauses, params = [], []
+        if start:
+            clauses.append("obs_date >= ?")
+            params.append(_as_date_str(start))
+        if end:
+            clauses.append("obs_date <= ?")
+            params.append(_as_date_str(end))
+        for column, values in (("indicator", indicators), ("classification", classifications)):
+            if values:
+                values = list(values)
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+
+        sql = (
+            "SELECT indicator, obs_date, vintage, classification, z_score, actual,"
+            " expected, surprise, emitted_at FROM events"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY obs_date DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        cursor = self._conn.execute(sql, params)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def close(self):
+        self._conn.close()
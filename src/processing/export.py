@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Streaming export of the normalised long-format dataset.
+
+    python -m src.processing.export --format ndjson > macro.ndjson
+    python -m src.processing.export --format parquet --output macro.parquet \\
+        --source FRED --start 2015-01-01 --batch-size 100000
+
+Rows are [date, value, indicator, source], produced in batches of at most
+--batch-size rows. Filters are resolved before any data is read:
+indicator/source pick the per-series files, and the date range becomes a
+binary search on the memory-mapped series store (data/processed/shared),
+so only matching rows are ever touched. Memory stays bounded by the batch
+size, whatever the history length. Arrow IPC and Parquet need pyarrow.
+"""
+import argparse
+import glob
+import logging
+import os
+import sys
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.processing.series_store import DATE_ROW, SharedSeriesReader, frame_from_block
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = "data/processed"
+COLUMNS = ["date", "value", "indicator", "source"]
+FORMATS = ("ndjson", "arrow", "parquet")
+
+
+def _portfolio_catalog() -> dict:
+    """CSV filename -> (indicator, source) for the configured portfolio."""
+    from src.processing.portfolio import Portfolio, series_filename
+    from src.processing.settings import load_settings
+
+    try:
+        settings = load_settings()
+        portfolio = Portfolio.load(settings["portfolio_file"], settings["polling_classes"])
+    except Exception as e:
+        logger.warning("Portfolio unavailable, reading series metadata from files: %s", e)
+        return {}
+    return {series_filename(item["name"]): (item["name"], item["source"]) for item in portfolio}
+
+
+def _file_metadata(path: str) -> Tuple[str, str]:
+    # Series outside the portfolio: indicator/source from the first data row
+    first = pd.read_csv(path, nrows=1)
+    if first.empty or not {"indicator", "source"} <= set(first.columns):
+        return os.path.splitext(os.path.basename(path))[0], ""
+    return str(first["indicator"].iloc[0]), str(first["source"].iloc[0])
+
+
+def list_series(
+    data_dir: str = DATA_DIR,
+    indicators: Optional[Sequence[str]] = None,
+    sources: Optional[Sequence[str]] = None,
+    catalog: Optional[dict] = None,
+) -> List[Tuple[str, str, str]]:
+    """(indicator, source, csv path) of every stored series passing the filters."""
+    catalog = _portfolio_catalog() if catalog is None else catalog
+    wanted_indicators = {i.lower() for i in indicators} if indicators else None
+    wanted_sources = {s.upper() for s in sources} if sources else None
+
+    selected = []
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        filename = os.path.basename(path)
+        if filename == "calendar.csv":
+            continue
+        indicator, source = catalog.get(filename) or _file_metadata(path)
+        if wanted_indicators is not None and indicator.lower() not in wanted_indicators:
+            continue
+        if wanted_sources is not None and source.upper() not in wanted_sources:
+            continue
+        selected.append((indicator, source, path))
+    return selected
+
+
+def _as_ns(value, default: int) -> int:
+    return default if value is None else int(pd.Timestamp(value).value)
+
+
+def _batches_from_store(block, indicator, source, start_ns, end_ns, batch_size):
+    dates = block[DATE_ROW]
+    lo = int(np.searchsorted(dates, start_ns, side="left"))
+    hi = int(np.searchsorted(dates, end_ns, side="right"))
+    df, _ = frame_from_block(block)
+    for offset in range(lo, hi, batch_size):
+        # Slicing the mapping reads only these pages
+        batch = df.iloc[offset: min(offset + batch_size, hi)]
+        yield batch.assign(indicator=indicator, source=source)[COLUMNS]
+
+
+def _batches_from_csv(path, indicator, source, start_ns, end_ns, batch_size):
+    for chunk in pd.read_csv(path, usecols=["date", "value"], chunksize=batch_size):
+        chunk["date"] = pd.to_datetime(chunk["date"])
+        stamps = chunk["date"].to_numpy().astype("datetime64[ns]").view(np.int64)
+        chunk = chunk[(stamps >= start_ns) & (stamps <= end_ns)]
+        if not chunk.empty:
+            yield chunk.assign(indicator=indicator, source=source)[COLUMNS]
+
+
+def iter_batches(
+    indicators: Optional[Sequence[str]] = None,
+    sources: Optional[Sequence[str]] = None,
+    start=None,
+    end=None,
+    batch_size: int = 50000,
+    data_dir: str = DATA_DIR,
+    catalog: Optional[dict] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the long-format dataset as DataFrames of at most 'batch_size' rows.
+
+    Args:
+        indicators: Indicator names to keep (any case). None = all.
+        sources: Sources to keep (e.g. ['FRED']). None = all.
+        start, end: Inclusive observation date bounds. None = open.
+        batch_size: Upper bound on rows per batch.
+        data_dir: Where the scheduler writes the series.
+        catalog: CSV filename -> (indicator, source); defaults to the portfolio.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    start_ns = _as_ns(start, np.iinfo(np.int64).min)
+    end_ns = _as_ns(end, np.iinfo(np.int64).max)
+    reader = SharedSeriesReader(os.path.join(data_dir, "shared"))
+
+    for indicator, source, path in list_series(data_dir, indicators, sources, catalog):
+        block = reader.block(os.path.basename(path))
+        if block is not None:
+            yield from _batches_from_store(block, indicator, source, start_ns, end_ns, batch_size)
+        else:
+            # Series written before the shared store existed
+            yield from _batches_from_csv(path, indicator, source, start_ns, end_ns, batch_size)
+
+
+# --- Writers ---
+def write_ndjson(batches: Iterator[pd.DataFrame], stream) -> int:
+    """Writes one JSON object per row to a text stream; returns the row count."""
+    rows = 0
+    for batch in batches:
+        batch = batch.assign(date=batch["date"].dt.strftime("%Y-%m-%d"))
+        stream.write(batch.to_json(orient="records", lines=True))
+        rows += len(batch)
+    return rows
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise RuntimeError("Arrow and Parquet export need pyarrow: pip install pyarrow")
+    return pyarrow
+
+
+def _arrow_schema(pa):
+    return pa.schema(
+        [
+            ("date", pa.date32()),
+            ("value", pa.float64()),
+            ("indicator", pa.string()),
+            ("source", pa.string()),
+        ]
+    )
+
+
+def _to_record_batch(pa, schema, batch: pd.DataFrame):
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(batch["date"].to_numpy().astype("datetime64[D]"), type=pa.date32()),
+            pa.array(batch["value"].to_numpy(), type=pa.float64()),
+            pa.array(batch["indicator"].to_numpy(), type=pa.string()),
+            pa.array(batch["source"].to_numpy(), type=pa.string()),
+        ],
+        schema=schema,
+    )
+
+
+def write_arrow(batches: Iterator[pd.DataFrame], sink) -> int:
+    """Arrow IPC stream format (path or binary file object)."""
+    pa = _require_pyarrow()
+    import pyarrow.ipc
+
+    schema = _arrow_schema(pa)
+    rows = 0
+    with pyarrow.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(_to_record_batch(pa, schema, batch))
+            rows += len(batch)
+    return rows
+
+
+def write_parquet(batches: Iterator[pd.DataFrame], sink) -> int:
+    """Parquet, one row group per batch (path or binary file object)."""
+    pa = _require_pyarrow()
+    import pyarrow.parquet
+
+    schema = _arrow_schema(pa)
+    rows = 0
+    with pyarrow.parquet.ParquetWriter(sink, schema) as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([_to_record_batch(pa, schema, batch)]))
+            rows += len(batch)
+    return rows
+
+
+def export(batches: Iterator[pd.DataFrame], fmt: str, output: str = "-") -> int:
+    """Streams batches to 'output' ('-' = stdout) in the given format."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    if fmt == "ndjson":
+        if output == "-":
+            return write_ndjson(batches, sys.stdout)
+        with open(output, "w") as f:
+            return write_ndjson(batches, f)
+
+    writer = write_arrow if fmt == "arrow" else write_parquet
+    if output == "-":
+        return writer(batches, sys.stdout.buffer)
+    return writer(batches, output)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Stream the normalised macro dataset")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--output", default="-", help="File path, or '-' for stdout")
+    parser.add_argument("--indicator", action="append", help="Indicator name (repeatable)")
+    parser.add_argument("--source", action="append", help="Source, e.g. FRED (repeatable)")
+    parser.add_argument("--start", default=None, help="First observation date (inclusive)")
+    parser.add_argument("--end", default=None, help="Last observation date (inclusive)")
+    parser.add_argument("--batch-size", type=int, default=50000)
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    args = parser.parse_args(argv)
+
+    batches = iter_batches(
+        indicators=args.indicator,
+        sources=args.source,
+        start=args.start,
+        end=args.end,
+        batch_size=args.batch_size,
+        data_dir=args.data_dir,
+    )
+    try:
+        rows = export(batches, args.format, args.output)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"Exported {rows} rows", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
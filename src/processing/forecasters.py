@@ -0,0 +1,378 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.processing.portfolio import series_filename
+
+logger = logging.getLogger(__name__)
+
+FORECAST_DIR = "data/processed/forecasts"
+
+
+class Forecaster:
+    """
+    One-step-ahead expectation for a single series.
+    update() and predict() are O(1) in the length of the history; fit()
+    is the full (re)estimation and is meant to run off the polling path.
+    """
+
+    name = "base"
+
+    def fit(self, values: np.ndarray) -> None:
+        """Re-estimates parameters on the full history and rebuilds the state."""
+        for value in values:
+            self.update(float(value))
+
+    def update(self, value: float) -> None:
+        raise NotImplementedError
+
+    def predict(self) -> Optional[float]:
+        raise NotImplementedError
+
+    def get_state(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class EwmaForecaster(Forecaster):
+    """Exponentially weighted level; fit() picks alpha by one-step error."""
+
+    name = "ewma"
+    ALPHAS = (0.1, 0.2, 0.3, 0.5, 0.7, 0.9)
+
+    def __init__(self, alpha: float = 0.3, **_):
+        self.alpha = alpha
+        self.level: Optional[float] = None
+
+    def fit(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        if len(values) > 2:
+            errors = {}
+            for alpha in self.ALPHAS:
+                # Recursive filter, vectorised: level_t = alpha * x_t + (1 - alpha) * level_t-1
+                levels = pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+                errors[alpha] = float(np.mean((values[1:] - levels[:-1]) ** 2))
+            self.alpha = min(errors, key=errors.get)
+        self.level = None
+        if len(values):
+            self.level = float(pd.Series(values).ewm(alpha=self.alpha, adjust=False).mean().iloc[-1])
+
+    def update(self, value: float) -> None:
+        self.level = value if self.level is None else self.alpha * value + (1 - self.alpha) * self.level
+
+    def predict(self) -> Optional[float]:
+        return self.level
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"alpha": self.alpha, "level": self.level}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.alpha = state["alpha"]
+        self.level = state["level"]
+
+
+class ArForecaster(Forecaster):
+    """
+    AR(p) with intercept, updated by recursive least squares.
+    Each update is O(p^2); 'forgetting' < 1 lets coefficients drift with
+    the regime. fit() is an ordinary least-squares refit on the full history.
+    """
+
+    name = "ar"
+
+    def __init__(self, order: int = 3, forgetting: float = 0.99, **_):
+        self.order = order
+        self.forgetting = forgetting
+        self.theta = np.zeros(order + 1)
+        self.P = np.eye(order + 1) * 1e3
+        self.lags: deque = deque(maxlen=order)
+        # Observations behind theta; predictions wait until it is identified
+        self.n = 0
+
+    def _regressors(self) -> Optional[np.ndarray]:
+        if len(self.lags) < self.order:
+            return None
+        return np.concatenate(([1.0], np.asarray(self.lags)[::-1]))
+
+    def fit(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        p = self.order
+        self.lags = deque(values[-p:].tolist(), maxlen=p)
+        self.n = len(values)
+        if len(values) <= 2 * (p + 1):
+            # Too short for OLS: let the recursive updates take it from here
+            self.theta = np.zeros(p + 1)
+            self.P = np.eye(p + 1) * 1e3
+            self.n = 0
+            return
+        # Row t: [1, x_t-1, ..., x_t-p] -> x_t
+        X = np.column_stack([np.ones(len(values) - p)] + [values[p - k: len(values) - k] for k in range(1, p + 1)])
+        y = values[p:]
+        XtX = X.T @ X + np.eye(p + 1) * 1e-8
+        self.theta = np.linalg.solve(XtX, X.T @ y)
+        self.P = np.linalg.inv(XtX)
+
+    def update(self, value: float) -> None:
+        phi = self._regressors()
+        if phi is not None:
+            Pphi = self.P @ phi
+            gain = Pphi / (self.forgetting + phi @ Pphi)
+            self.theta = self.theta + gain * (value - phi @ self.theta)
+            self.P = (self.P - np.outer(gain, Pphi)) / self.forgetting
+            self.n += 1
+        self.lags.append(value)
+
+    def predict(self) -> Optional[float]:
+        phi = self._regressors()
+        if phi is None or self.n <= 2 * (self.order + 1):
+            return None
+        return float(phi @ self.theta)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "order": self.order,
+            "forgetting": self.forgetting,
+            "theta": self.theta.tolist(),
+            "P": self.P.tolist(),
+            "lags": list(self.lags),
+            "n": self.n,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.order = state["order"]
+        self.forgetting = state["forgetting"]
+        self.theta = np.asarray(state["theta"])
+        self.P = np.asarray(state["P"])
+        self.lags = deque(state["lags"], maxlen=self.order)
+        self.n = state["n"]
+
+
+class SeasonalNaiveForecaster(Forecaster):
+    """Expects the value from one season ago (e.g. same month last year)."""
+
+    name = "seasonal_naive"
+
+    def __init__(self, season: int = 12, **_):
+        self.season = season
+        self.history: deque = deque(maxlen=season)
+
+    def fit(self, values: np.ndarray) -> None:
+        self.history = deque(np.asarray(values, dtype=float)[-self.season:].tolist(), maxlen=self.season)
+
+    def update(self, value: float) -> None:
+        self.history.append(value)
+
+    def predict(self) -> Optional[float]:
+        # Next period sits one season after the oldest value kept
+        return self.history[0] if len(self.history) == self.season else None
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"season": self.season, "history": list(self.history)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.season = state["season"]
+        self.history = deque(state["history"], maxlen=self.season)
+
+
+FORECASTERS = {
+    EwmaForecaster.name: EwmaForecaster,
+    ArForecaster.name: ArForecaster,
+    SeasonalNaiveForecaster.name: SeasonalNaiveForecaster,
+}
+
+
+def make_forecaster(name: str, **options) -> Forecaster:
+    if name not in FORECASTERS:
+        raise ValueError(f"Unknown forecaster: {name}")
+    return FORECASTERS[name](**options)
+
+
+class _Entry:
+    __slots__ = ("model", "last_date", "last_value", "fitted_at", "stale")
+
+    def __init__(self, model: Forecaster, last_date, last_value: float, fitted_at: float):
+        self.model = model
+        self.last_date = pd.Timestamp(last_date)
+        self.last_value = last_value
+        self.fitted_at = fitted_at
+        self.stale = False
+
+
+class ForecastBook:
+    """
+    Per-indicator forecaster cache.
+
+    expectation() is a dictionary lookup plus predict(); observe() folds new
+    prints in with the model's O(1) update and persists the state. Full
+    refits (cold start aside) run on a background thread and are swapped
+    in under the lock, so the polling cycle never waits for one.
+    """
+
+    def __init__(
+        self,
+        default: str = "ewma",
+        options: Optional[Dict[str, Any]] = None,
+        state_dir: str = FORECAST_DIR,
+        refit_seconds: float = 86400,
+    ):
+        self.default = default
+        self.options = options or {}
+        self.state_dir = state_dir
+        self.refit_seconds = refit_seconds
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Persistence ---
+    def _path(self, indicator: str) -> str:
+        # Same stem as the indicator's CSV, so state and data files pair up
+        stem = os.path.splitext(series_filename(indicator))[0]
+        return os.path.join(self.state_dir, stem + ".json")
+
+    def _save(self, indicator: str, entry: _Entry) -> None:
+        record = {
+            "model": entry.model.name,
+            "state": entry.model.get_state(),
+            "last_date": str(entry.last_date.date()),
+            "last_value": entry.last_value,
+            "fitted_at": entry.fitted_at,
+        }
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self._path(indicator)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+
+    def _load(self, indicator: str, model_name: str) -> Optional[_Entry]:
+        try:
+            with open(self._path(indicator)) as f:
+                record = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if record.get("model") != model_name:
+            return None  # Config switched models: refit from scratch
+        model = make_forecaster(model_name, **self.options.get(model_name, {}))
+        model.set_state(record["state"])
+        return _Entry(model, record["last_date"], record["last_value"], record["fitted_at"])
+
+    def _entry(self, indicator: str, model_name: str) -> Optional[_Entry]:
+        entry = self._entries.get(indicator)
+        if entry is None or entry.model.name != model_name:
+            entry = self._load(indicator, model_name)
+            if entry is not None:
+                self._entries[indicator] = entry
+        return entry
+
+    # --- Hot path ---
+    def has(self, indicator: str, model_name: Optional[str] = None) -> bool:
+        with self._lock:
+            return self._entry(indicator, model_name or self.default) is not None
+
+    def expectation(self, indicator: str, model_name: Optional[str] = None):
+        """(last observed date, expected next value) or None if not fitted yet."""
+        model_name = model_name or self.default
+        with self._lock:
+            entry = self._entry(indicator, model_name)
+            if entry is None:
+                return None
+            expected = entry.model.predict()
+            return None if expected is None else (entry.last_date, expected)
+
+    def observe(self, indicator: str, df: pd.DataFrame, model_name: Optional[str] = None) -> None:
+        """
+        Folds observations newer than the model's last date into it (O(1)
+        each). Fits on the first sight of an indicator. A revision of an
+        already-seen print can't be unwound incrementally, so it marks the
+        model for the next background refit.
+        """
+        model_name = model_name or self.default
+        with self._lock:
+            entry = self._entry(indicator, model_name)
+            if entry is None:
+                self._entries[indicator] = self._fit(df, model_name)
+                self._save(indicator, self._entries[indicator])
+                return
+
+            seen = df[df["date"] == entry.last_date]
+            if not seen.empty and float(seen["value"].iloc[-1]) != entry.last_value:
+                entry.stale = True
+
+            new_rows = df[df["date"] > entry.last_date]
+            if new_rows.empty:
+                return
+            if seen.empty:
+                # No overlap with what the model saw: prints may be missing
+                entry.stale = True
+            for value in new_rows["value"]:
+                entry.model.update(float(value))
+            entry.last_date = new_rows["date"].iloc[-1]
+            entry.last_value = float(new_rows["value"].iloc[-1])
+            self._save(indicator, entry)
+
+    def _fit(self, df: pd.DataFrame, model_name: str) -> _Entry:
+        model = make_forecaster(model_name, **self.options.get(model_name, {}))
+        model.fit(df["value"].to_numpy(dtype=float))
+        return _Entry(model, df["date"].iloc[-1], float(df["value"].iloc[-1]), time.time())
+
+    # --- Background refits ---
+    def refit(self, indicator: str, df: pd.DataFrame, model_name: Optional[str] = None) -> bool:
+        """Full refit outside the lock; swapped in only if no newer print arrived meanwhile."""
+        model_name = model_name or self.default
+        if df.empty:
+            return False
+        fitted = self._fit(df, model_name)
+        with self._lock:
+            current = self._entries.get(indicator)
+            if current is not None and current.last_date > fitted.last_date:
+                return False
+            self._entries[indicator] = fitted
+            self._save(indicator, fitted)
+        return True
+
+    def needs_refit(self, indicator: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(indicator)
+            return entry is not None and (entry.stale or now - entry.fitted_at >= self.refit_seconds)
+
+    def start_refitter(
+        self,
+        indicators: Callable[[], Dict[str, str]],
+        load_history: Callable[[str], pd.DataFrame],
+        interval: float = 60,
+    ) -> None:
+        """
+        Starts the background refit loop. 'indicators' returns
+        {indicator: model_name} for the current portfolio; 'load_history'
+        reads one indicator's stored series, only when a refit is due.
+        """
+        if self._thread is not None:
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                for indicator, model_name in indicators().items():
+                    if not self.needs_refit(indicator):
+                        continue
+                    try:
+                        if self.refit(indicator, load_history(indicator), model_name):
+                            logger.info("Forecaster refit for %s (%s)", indicator, model_name)
+                    except Exception as e:
+                        logger.error("Forecaster refit failed for %s: %s", indicator, e)
+
+        self._thread = threading.Thread(target=loop, name="forecast-refit", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
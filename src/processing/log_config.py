@@ -0,0 +1,136 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from typing import Dict, Any, Optional
+
+DEFAULT_LOGGING = {
+    "level": "INFO",
+    "format": "text",  # 'text' or 'json'
+    "file": None,
+    # Per-component overrides, e.g. {"src.api": "WARNING", "MacroScheduler": "INFO"}
+    "levels": {},
+    "rate_limit": {"window_seconds": 60, "max_repeats": 5},
+}
+
+# Attributes every LogRecord has; anything else came in through extra={...}
+_STANDARD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """One JSON object per line, including any extra={...} fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets at most 'max_repeats' records with the same (logger, level, template)
+    through per window, then reports how many were suppressed.
+    Keyed on the unformatted template, so it costs no string formatting.
+    """
+
+    def __init__(self, window_seconds: float = 60, max_repeats: int = 5):
+        super().__init__()
+        self.window_seconds = window_seconds
+        self.max_repeats = max_repeats
+        self._counts: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, record.msg)
+        now = record.created
+        with self._lock:
+            window = self._counts.get(key)
+            if window is None or now - window[0] >= self.window_seconds:
+                suppressed = window[2] if window else 0
+                self._counts[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed_repeats = suppressed
+                    record.msg = f"{record.msg} (suppressed {suppressed} repeats in last window)"
+                return True
+            window[1] += 1
+            if window[1] <= self.max_repeats:
+                return True
+            window[2] += 1
+            return False
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands the raw record to the listener thread. Unlike the stock handler
+    it does not format in the caller, so a log call on the hot path costs
+    one record allocation and a queue put.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener():
+    # Flushes whatever is still queued at interpreter exit
+    if _listener is not None:
+        _listener.stop()
+
+
+def configure_logging(config: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Installs queue-based logging for the whole process.
+    Handlers (stderr and optional file) run on a background listener thread.
+    Safe to call more than once; the previous listener is stopped.
+    """
+    global _listener
+    cfg = dict(DEFAULT_LOGGING)
+    cfg.update(config or {})
+
+    formatter: logging.Formatter
+    if cfg["format"] == "json":
+        formatter = StructuredFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if cfg.get("file"):
+        handlers.append(logging.FileHandler(cfg["file"]))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        _listener.stop()
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=False)
+    _listener.start()
+
+    queue_handler = _LazyQueueHandler(log_queue)
+    limits = cfg.get("rate_limit") or {}
+    if limits:
+        queue_handler.addFilter(
+            RateLimitFilter(limits.get("window_seconds", 60), limits.get("max_repeats", 5))
+        )
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(cfg["level"])
+
+    for name, level in (cfg.get("levels") or {}).items():
+        logging.getLogger(name).setLevel(level)
+
@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds. Covers a cached parse (~1ms) up to a stalled API call (10s timeout)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+
+class MetricsRegistry:
+    """
+    In-process counters and latency histograms for every pipeline stage.
+    Cheap enough to leave on: one perf_counter pair and a dict update per call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[LabelKey, _Histogram] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, seconds: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = _Histogram()
+            hist.observe(seconds)
+
+    @contextmanager
+    def timed(self, stage: str, **labels):
+        """Records stage latency, and an error count if the block raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc("macro_stage_errors_total", stage=stage, **labels)
+            raise
+        finally:
+            self.observe(time.perf_counter() - start, stage=stage, **labels)
+
+    def drain(self) -> Dict[str, Any]:
+        """Returns and resets everything recorded (used by worker processes)."""
+        with self._lock:
+            data = {
+                "counters": self.counters,
+                "histograms": {
+                    k: (h.counts, h.sum, h.count, h.max) for k, h in self.histograms.items()
+                },
+            }
+            self.counters, self.histograms = {}, {}
+        return data
+
+    def absorb(self, data: Dict[str, Any]):
+        """Adds a worker's drained metrics into this registry."""
+        with self._lock:
+            for name, series in data["counters"].items():
+                target = self.counters.setdefault(name, {})
+                for key, value in series.items():
+                    target[key] = target.get(key, 0) + value
+            for key, (counts, total, count, peak) in data["histograms"].items():
+                hist = self.histograms.get(key)
+                if hist is None:
+                    hist = self.histograms[key] = _Histogram()
+                hist.counts = [a + b for a, b in zip(hist.counts, counts)]
+                hist.sum += total
+                hist.count += count
+                hist.max = max(hist.max, peak)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the cumulative totals (used to diff one cycle)."""
+        with self._lock:
+            return {
+                "counters": {n: dict(s) for n, s in self.counters.items()},
+                "stages": {k: (h.count, h.sum, h.max) for k, h in self.histograms.items()},
+            }
+
+    def cycle_summary(self, before: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-stage calls / total / mean latency and counter deltas since 'before'."""
+        after = self.snapshot()
+        stages = {}
+        for key, (count, total, _) in after["stages"].items():
+            prev_count, prev_total, _ = before["stages"].get(key, (0, 0.0, 0.0))
+            if count == prev_count:
+                continue
+            label = ",".join(f"{k}={v}" for k, v in key)
+            calls = count - prev_count
+            stages[label] = {
+                "calls": calls,
+                "total_s": round(total - prev_total, 4),
+                "mean_s": round((total - prev_total) / calls, 4),
+            }
+
+        counters = {}
+        for name, series in after["counters"].items():
+            prev = before["counters"].get(name, {})
+            for key, value in series.items():
+                delta = value - prev.get(key, 0)
+                if delta:
+                    label = ",".join(f"{k}={v}" for k, v in key)
+                    counters[f"{name}{{{label}}}"] = delta
+        return {"stages": stages, "counters": counters}
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (v0.0.4)."""
+
+        def fmt(key: LabelKey, extra: str = "") -> str:
+            parts = [f'{k}="{v}"' for k, v in key]
+            if extra:
+                parts.append(extra)
+            return "{" + ",".join(parts) + "}" if parts else ""
+
+        lines = []
+        with self._lock:
+            for name in sorted(self.counters):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in self.counters[name].items():
+                    lines.append(f"{name}{fmt(key)} {value}")
+
+            lines.append("# TYPE macro_stage_seconds histogram")
+            for key, hist in self.histograms.items():
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, hist.counts):
+                    cumulative += count
+                    le = 'le="%s"' % bound
+                    lines.append(f"macro_stage_seconds_bucket{fmt(key, le)} {cumulative}")
+                le_inf = 'le="+Inf"'
+                lines.append(f"macro_stage_seconds_bucket{fmt(key, le_inf)} {hist.count}")
+                lines.append(f"macro_stage_seconds_sum{fmt(key)} {hist.sum}")
+                lines.append(f"macro_stage_seconds_count{fmt(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry shared by the clients, the scheduler and the alert bus
+METRICS = MetricsRegistry()
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1", registry: MetricsRegistry = METRICS):
+    """Serves GET /metrics on a daemon thread. Returns the server."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info("Metrics endpoint on http://%s:%s/metrics", host, server.server_port)
+    return server
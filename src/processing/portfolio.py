@@ -0,0 +1,218 @@
+import heapq
+import logging
+import os
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.processing.settings import load_yaml, DEFAULT_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+VALID_SOURCES = {"FRED", "ECB"}
+
+# FRED 'units' transformations (Ref: FRED API series/observations docs)
+FRED_UNITS = {"lin", "chg", "ch1", "pch", "pc1", "pca", "cch", "cca", "log"}
+
+# Expected-value models (src/processing/forecasters.py FORECASTERS)
+VALID_FORECASTERS = {"ewma", "ar", "seasonal_naive"}
+
+
+def series_filename(name: str) -> str:
+    return name.replace(" ", "_").replace("(", "").replace(")", "").lower() + ".csv"
+
+
+def _is_int(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    return isinstance(value, str) and value.strip().isdigit()
+
+
+def _is_interval(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+
+def validate_items(
+    items: List[Dict[str, Any]], polling_classes: Dict[str, float]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Normalises series definitions and collects every problem found.
+    Returns (clean_items, errors); callers decide whether errors are fatal.
+    """
+    clean, errors, names = [], [], set()
+
+    for i, raw in enumerate(items):
+        label = f"series[{i}]"
+        if not isinstance(raw, dict):
+            errors.append(f"{label}: expected a mapping")
+            continue
+
+        item = dict(raw)
+        missing = [k for k in ("id", "source", "name") if not item.get(k)]
+        if missing:
+            errors.append(f"{label}: missing {', '.join(missing)}")
+            continue
+
+        item["id"] = str(item["id"])
+        item["source"] = str(item["source"]).upper()
+        item["name"] = str(item["name"])
+        item.setdefault("units", "lin")
+        item["polling"] = str(item.get("polling", "fast"))
+        if item.get("region") is not None:
+            item["region"] = str(item["region"])
+        label = f"{label} '{item['name']}'"
+
+        if item["source"] not in VALID_SOURCES:
+            errors.append(f"{label}: unknown source {item['source']}")
+        elif item["source"] == "FRED" and item["units"] not in FRED_UNITS:
+            errors.append(f"{label}: unknown FRED units {item['units']}")
+        elif item["source"] == "ECB" and item["id"].count("/") != 1:
+            errors.append(f"{label}: ECB id must look like FLOW/KEY")
+        elif item.get("release_id") is not None and not _is_int(item["release_id"]):
+            errors.append(f"{label}: release_id must be an integer")
+        elif item.get("forecaster") is not None and item["forecaster"] not in VALID_FORECASTERS:
+            errors.append(f"{label}: unknown forecaster {item['forecaster']}")
+        elif item.get("basket") is not None and item.get("region") is None:
+            errors.append(f"{label}: basket needs a region")
+        elif not isinstance(item.get("surprise_weight", 1.0), (int, float)):
+            errors.append(f"{label}: surprise_weight must be a number")
+        elif item["polling"] not in polling_classes:
+            errors.append(f"{label}: unknown polling class {item['polling']}")
+        elif not _is_interval(polling_classes[item["polling"]]):
+            errors.append(f"{label}: polling class {item['polling']} needs a number of minutes")
+        elif item["name"] in names:
+            errors.append(f"{label}: duplicate name")
+        else:
+            if item.get("release_id") is not None:
+                item["release_id"] = int(item["release_id"])
+            names.add(item["name"])
+            clean.append(item)
+
+    return clean, errors
+
+
+class Portfolio:
+    """
+    Config-driven set of tracked series.
+    Ref: config/portfolio.yml, config/settings.yml (polling_classes)
+
+    Keeps lookup indexes by name, source and FRED release ID, plus a
+    min-heap of next-due times so each cycle only touches series that
+    are actually due, however large the portfolio is.
+    """
+
+    def __init__(
+        self,
+        items: List[Dict[str, Any]],
+        polling_classes: Optional[Dict[str, float]] = None,
+        path: Optional[str] = None,
+    ):
+        self.polling_classes = polling_classes or dict(DEFAULT_SETTINGS["polling_classes"])
+        self.path = path
+        self._mtime = os.path.getmtime(path) if path and os.path.exists(path) else None
+        self._next_due: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+        clean, errors = validate_items(items, self.polling_classes)
+        if errors:
+            raise ValueError("Invalid portfolio:\n  " + "\n  ".join(errors))
+        self._build(clean)
+
+    @classmethod
+    def load(cls, path: str, polling_classes: Optional[Dict[str, float]] = None) -> "Portfolio":
+        return cls(load_yaml(path).get("series", []), polling_classes, path=path)
+
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]], polling_classes=None) -> "Portfolio":
+        return cls(items, polling_classes)
+
+    def _build(self, items: List[Dict[str, Any]]):
+        # Indexes are built aside and swapped in together, so a failure
+        # leaves the previous portfolio whole
+        by_name = {item["name"]: item for item in items}
+        by_source: Dict[str, List[Dict[str, Any]]] = {}
+        by_release: Dict[int, List[Dict[str, Any]]] = {}
+        for item in items:
+            by_source.setdefault(item["source"], []).append(item)
+            if item.get("release_id") is not None:
+                by_release.setdefault(int(item["release_id"]), []).append(item)
+
+        # Keep schedules of series that survived a reload; new ones are due now
+        next_due = {name: self._next_due.get(name, 0.0) for name in by_name}
+        heap = [(due, name) for name, due in next_due.items()]
+        heapq.heapify(heap)
+
+        self.items, self.by_name, self.by_source, self.by_release = items, by_name, by_source, by_release
+        self._next_due, self._heap = next_due, heap
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.by_name.get(name)
+
+    def select(self, names: List[str]) -> List[Dict[str, Any]]:
+        """Series matching any of 'names' (display name or source id, any case)."""
+        wanted = {n.strip().lower() for n in names if n.strip()}
+        return [
+            item
+            for item in self.items
+            if item["name"].lower() in wanted or item["id"].lower() in wanted
+        ]
+
+    def interval_seconds(self, item: Dict[str, Any]) -> float:
+        return float(self.polling_classes[item["polling"]]) * 60
+
+    def due(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Pops every series whose next poll time has passed (O(k log n))."""
+        now = time.time() if now is None else now
+        due_items = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, name = heapq.heappop(self._heap)
+            # Lazy deletion: skip entries superseded by a reschedule or reload
+            if self._next_due.get(name) == due_at:
+                due_items.append(self.by_name[name])
+        return due_items
+
+    def mark_polled(self, name: str, now: Optional[float] = None):
+        item = self.by_name.get(name)
+        if item is None:
+            return
+        now = time.time() if now is None else now
+        due_at = now + self.interval_seconds(item)
+        self._next_due[name] = due_at
+        heapq.heappush(self._heap, (due_at, name))
+
+    def reload_if_changed(self) -> bool:
+        """
+        Hot-reloads the YAML file if it changed on disk.
+        An invalid edit is logged and ignored; the running portfolio stays.
+        """
+        if not self.path or not os.path.exists(self.path):
+            return False
+        mtime = os.path.getmtime(self.path)
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        try:
+            raw = load_yaml(self.path).get("series", [])
+        except Exception as e:
+            logger.error("Portfolio reload failed (%s): %s", self.path, e)
+            return False
+        clean, errors = validate_items(raw, self.polling_classes)
+        if errors:
+            logger.error("Portfolio reload rejected:\n  " + "\n  ".join(errors))
+            return False
+
+        added = set(i["name"] for i in clean) - set(self.by_name)
+        removed = set(self.by_name) - set(i["name"] for i in clean)
+        self._build(clean)
+        logger.info(
+            "Portfolio reloaded: %d series (+%d / -%d)", len(clean), len(added), len(removed)
+        )
+        return True
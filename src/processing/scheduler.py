@@ -1,5 +1,4 @@
 import time
-import schedule
 import pandas as pd
 import logging
 import os
@@ -11,14 +10,165 @@ load_dotenv()
 
 from src.api.fred_client import FredClient
 from src.api.ecb_client import EcbClient
+from src.api.market_client import MarketClient, MARKET_ASSETS
+from src.api.request_policy import POLICY, request_deadline
 from src.processing.cleaners import normalise_series
+from src.processing.transformers import apply_units
 from src.processing.event_detector import EventDetector
-from src.alerts.terminal_alerts import print_event_alert
+from src.processing.forecasters import ForecastBook
+from src.processing.summaries import (
+    build_series_summary,
+    series_fingerprint,
+    summary_path,
+    write_summary,
+    load_summary,
+)
+from src.processing.series_store import store_path, write_series_store
+from src.processing.change_feed import ChangeFeedPublisher
+from src.processing.correlations import CorrelationEngine, CORRELATIONS_FILE, write_correlations
+from src.processing.surprise_index import SurpriseIndex, SURPRISE_FILE
+from src.processing.event_log import EventLog
+from src.processing.metrics import METRICS, start_metrics_server
+from src.processing.portfolio import Portfolio, series_filename
+from src.processing.settings import load_settings, load_endpoints
+from src.alerts.alert_bus import AlertBus
+from src.alerts.sinks import sinks_from_env
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MacroScheduler")
 
 
+def fetch_release_frames(fred, items, min_series=20, page_size=50000):
+    """
+    Bulk-fetches FRED series that share a release: one paged download per
+    release instead of one call per series. Returns {name: levels DataFrame};
+    series missing from the bulk response fall back to per-series calls.
+    """
+    groups = {}
+    for item in items:
+        if item["source"] == "FRED" and item.get("release_id") is not None:
+            groups.setdefault(int(item["release_id"]), []).append(item)
+
+    frames = {}
+    for release_id, group in groups.items():
+        if len(group) < min_series:
+            continue
+        by_id = fred.get_release_observations(
+            release_id, [item["id"] for item in group], page_size=page_size
+        )
+        METRICS.inc("macro_release_bulk_total", release=str(release_id))
+        for item in group:
+            df = by_id.get(item["id"])
+            if df is not None and not df.empty:
+                frames[item["name"]] = df
+    return frames
+
+
+def vintage_of(value) -> str:
+    """Released value as stored in the event log; a different vintage of the same date is a revision."""
+    return f"{float(value):.6g}"
+
+
+def collect_indicator(
+    fred,
+    ecb,
+    detector,
+    item,
+    last_seen_date=None,
+    known_fingerprint=None,
+    raw_df=None,
+    forecast=None,
+    last_seen_vintage=None,
+):
+    """
+    Fetch -> normalise -> persist -> detect for one series.
+    Touches no engine state, so it runs unchanged inside a worker process.
+    A print is analysed when it is newer than 'last_seen_date', or when it
+    revises that date's value ('last_seen_vintage').
+    'raw_df' is a levels frame already pulled by a release-level bulk fetch.
+    'forecast' is (last date seen by the model, expected next value, model
+    name) from ForecastBook; it becomes the consensus when exactly one new
+    print landed since that date.
+    Returns a compact, picklable result (None if no data came back).
+    """
+    df = pd.DataFrame()
+    if item["source"] == "FRED":
+        units = item.get("units", "lin")
+        if raw_df is not None:
+            # Bulk downloads are levels; FRED's units are applied locally
+            df = apply_units(raw_df, units)
+        else:
+            df = fred.get_series_data(item["id"], units=units)
+    elif item["source"] == "ECB":
+        parts = item["id"].split("/")
+        df = ecb.get_series_data(parts[0], parts[1])
+
+    with METRICS.timed("normalise", source=item["source"]):
+        clean_df = normalise_series(df, item["source"], item["name"])
+    METRICS.inc("macro_rows_total", len(clean_df), source=item["source"])
+    if clean_df.empty:
+        return None
+
+    filename = series_filename(item["name"])
+    filepath = os.path.join("data/processed", filename)
+    with METRICS.timed("persist", source=item["source"]):
+        clean_df.to_csv(filepath, index=False)
+
+        # Dashboard summary: recomputed only when the series changed
+        path = summary_path(filename)
+        fingerprint = series_fingerprint(clean_df)
+        if known_fingerprint is None:
+            # First sight since startup: trust an existing record if it still matches
+            existing = load_summary(path)
+            known_fingerprint = existing.get("fingerprint") if existing else None
+        changed = known_fingerprint != fingerprint
+        if changed:
+            METRICS.inc("macro_cache_total", cache="summary", result="miss")
+            write_summary(build_series_summary(clean_df), path)
+            logger.info("Summary refreshed for %s", filename)
+        else:
+            METRICS.inc("macro_cache_total", cache="summary", result="hit")
+
+        # Memory-mapped copy shared by every dashboard session on the host
+        shared_path = store_path(filename)
+        if changed or not os.path.exists(shared_path):
+            write_series_store(clean_df, shared_path)
+
+    latest = clean_df.iloc[-1]
+    analysis, trailing_z = None, None
+    is_new = last_seen_date is not None and latest["date"] > last_seen_date
+    is_revision = (
+        last_seen_vintage is not None
+        and latest["date"] == last_seen_date
+        and vintage_of(latest["value"]) != last_seen_vintage
+    )
+    if is_new or is_revision:
+        consensus, expected_by = None, "trailing_mean"
+        if forecast is not None and len(clean_df) > 1 and clean_df["date"].iloc[-2] == forecast[0]:
+            consensus, expected_by = forecast[1], forecast[2]
+        with METRICS.timed("detect", source=item["source"]):
+            analysis = detector.analyze_release(clean_df, consensus_value=consensus)
+            # The surprise index scores every print by the trailing-mean rule,
+            # as its backfill does, whatever model set the alert's expectation
+            scored = detector.z_scores(clean_df.tail(detector.lookback_window))
+        if "expected" in analysis:
+            analysis["expected_by"] = expected_by
+            analysis["revision"] = is_revision
+        if not scored.empty and scored["date"].iloc[-1] == latest["date"]:
+            trailing_z = float(scored["z_score"].iloc[-1])
+
+    tail = clean_df.tail(5)
+    return {
+        "filename": filename,
+        "fingerprint": fingerprint,
+        "changed": changed,
+        "latest_date": latest["date"],
+        "latest_value": float(latest["value"]),
+        "tail": [[str(d.date()), float(v)] for d, v in zip(tail["date"], tail["value"])],
+        "analysis": analysis,
+        "trailing_z": trailing_z,
+    }
+
+
 class MacroScheduler:
     def __init__(self):
         # SECURITY FIX: Only load from environment. No hardcoded fallback.
@@ -30,84 +180,381 @@ class MacroScheduler:
             # but API calls will fail gracefully later.
             api_key = "MISSING_KEY"
 
-        self.fred = FredClient(api_key=api_key)
-        self.ecb = EcbClient()
+        self.settings = load_settings()
+        endpoints = load_endpoints()
+        # Timeouts and hedging for every client call in this process
+        POLICY.configure(self.settings["requests"])
+        self.cycle_budget_seconds = float(self.settings["requests"]["cycle_budget_seconds"])
+
+        self.fred = FredClient(api_key=api_key, base_url=endpoints["FRED"])
+        self.ecb = EcbClient(base_url=endpoints["ECB"])
         self.detector = EventDetector(lookback_window=12)
-        self.last_seen_dates = {}
-
-        self.portfolio = [
-            {"id": "CPIAUCSL", "source": "FRED", "name": "US CPI", "units": "pc1"},
-            {"id": "PPIFIS", "source": "FRED", "name": "US PPI", "units": "pc1"},
-            {"id": "PAYEMS", "source": "FRED", "name": "US NFP", "units": "chg"},
-            {
-                "id": "UNRATE",
-                "source": "FRED",
-                "name": "US Unemployment",
-                "units": "lin",
-            },
-            {
-                "id": "CPALTT01GBM659N",
-                "source": "FRED",
-                "name": "UK Inflation",
-                "units": "lin",
-            },
-            {
-                "id": "ICP/M.U2.N.000000.4.ANR",
-                "source": "ECB",
-                "name": "Eurozone Inflation",
-                "units": "lin",
-            },
-        ]
+        # Alerts are dispatched off-thread; the terminal is one sink of several
+        self.alerts = AlertBus(sinks_from_env())
+        # Durable record of emitted alerts; also seeds what we've already seen
+        self.event_log = EventLog()
+        self.last_seen_dates = {
+            name: pd.Timestamp(date) for name, date in self.event_log.latest_dates().items()
+        }
+        # Released value (vintage_of) of each last-seen date, to spot revisions
+        self.last_seen_vintages = {}
+        # Fingerprint of the last summary written per CSV file
+        self.summary_fingerprints = {}
+        self.last_cycle_metrics = {}
+        # Sink -> (dropped, failed) alert counts at the last backpressure check
+        self._alert_losses = {}
+        # Local push feed to the dashboard (opened by start())
+        self.feed = None
+
+        # Expected-value models per indicator (state in data/processed/forecasts)
+        forecasting = self.settings["forecasting"]
+        self.forecasts = ForecastBook(
+            default=forecasting["default"],
+            options=forecasting.get("models") or {},
+            refit_seconds=float(forecasting["refit_minutes"]) * 60,
+        )
+
+        # Release IDs found by the calendar for series that don't declare one
+        self.resolved_release_ids = {}
+
+        # Series definitions come from config/portfolio.yml (hot-reloaded)
+        self.portfolio = Portfolio.load(
+            self.settings["portfolio_file"], self.settings["polling_classes"]
+        )
+        if not len(self.portfolio):
+            logger.warning("Portfolio is empty: %s", self.settings["portfolio_file"])
+        self.calendar_refresh_seconds = (
+            float(self.settings["scheduler"]["calendar_refresh_minutes"]) * 60
+        )
+        self._calendar_due = 0.0
+
+        # Stored summaries remember the last observation across restarts and
+        # one-shot runs, so a release landing in between still alerts
+        for item in self.portfolio:
+            summary = load_summary(summary_path(series_filename(item["name"])))
+            if summary and summary.get("latest_date"):
+                stored = pd.Timestamp(summary["latest_date"])
+                previous = self.last_seen_dates.get(item["name"])
+                if previous is None or stored > previous:
+                    self.last_seen_dates[item["name"]] = stored
+                if stored == self.last_seen_dates[item["name"]] and summary.get("latest") is not None:
+                    self.last_seen_vintages[item["name"]] = vintage_of(summary["latest"])
+
+        # Rolling correlation / lead-lag matrices, seeded from stored CSVs
+        corr_settings = self.settings["correlations"]
+        self.market = MarketClient()
+        self.correlations = CorrelationEngine(
+            window=int(corr_settings["window_months"]),
+            max_lag=int(corr_settings["max_lag"]),
+            min_periods=int(corr_settings["min_periods"]),
+        )
+        self.market_refresh_seconds = float(corr_settings["market_refresh_minutes"]) * 60
+        self._market_due = 0.0
+        self.correlation_max_series = int(corr_settings["max_series"])
+        self._correlation_backfilled = set()
+        for item in self.portfolio:
+            self.backfill_correlations(item["name"])
+        for asset in MARKET_ASSETS:
+            self.correlations.track(asset, transform="logret")
+
+        # Composite surprise index; rebuilt from stored CSVs when the
+        # portfolio's regions/baskets change (see publish_surprise_index)
+        self.surprise = SurpriseIndex(
+            half_life_days=float(self.settings["surprise_index"]["half_life_days"])
+        )
+        self.surprise.load()
 
         os.makedirs("data/processed", exist_ok=True)
 
     def run_pipeline(self):
-        logger.info(
-            f"--- Running Update Cycle: {datetime.now().strftime('%H:%M:%S')} ---"
+        logger.info("--- Running Update Cycle: %s ---", datetime.now().strftime("%H:%M:%S"))
+        cycle_start = METRICS.snapshot()
+        try:
+            self.portfolio.reload_if_changed()
+        except Exception as e:
+            # A bad edit must not stop the engine: keep polling the previous portfolio
+            logger.error("Portfolio reload failed, keeping the previous portfolio: %s", e)
+
+        # Series fetches and market overlays share one deadline, so neither
+        # can push the cycle past the next tick
+        deadline = self.cycle_deadline()
+
+        # 1. Update Data Series (only those whose polling interval elapsed)
+        now = time.time()
+        due_items = self.portfolio.due(now)
+        METRICS.inc("macro_series_polled_total", len(due_items))
+        with request_deadline(deadline):
+            self.process_items(due_items)
+        for item in due_items:
+            self.portfolio.mark_polled(item["name"], now)
+
+        # 2. Update Calendar (New Feature) on its own, slower cadence
+        if now >= self._calendar_due:
+            with METRICS.timed("calendar"):
+                self.update_calendar()
+            self._calendar_due = now + self.calendar_refresh_seconds
+
+        # 3. Correlations: market overlays on their own cadence, then publish
+        if now >= self._market_due:
+            with request_deadline(deadline):
+                self.update_market_data()
+            self._market_due = now + self.market_refresh_seconds
+        self.publish_correlations()
+        self.publish_surprise_index()
+
+        # 4. Surface alert backpressure (slow or failing sinks)
+        self.report_alert_backpressure()
+
+        # 5. Per-cycle instrumentation summary
+        self.last_cycle_metrics = METRICS.cycle_summary(cycle_start)
+        for stage, stats in self.last_cycle_metrics["stages"].items():
+            logger.info(
+                "[metrics] %s: calls=%d total=%ss mean=%ss",
+                stage,
+                stats["calls"],
+                stats["total_s"],
+                stats["mean_s"],
+            )
+
+    def report_alert_backpressure(self):
+        """Warns about sinks that dropped or failed alerts since the last cycle."""
+        for sink, stats in self.alerts.metrics().items():
+            seen_dropped, seen_failed = self._alert_losses.get(sink, (0, 0))
+            dropped = stats["dropped"] - seen_dropped
+            failed = stats["failed"] - seen_failed
+            self._alert_losses[sink] = (stats["dropped"], stats["failed"])
+            if dropped > 0 or failed > 0:
+                logger.warning(
+                    "Alert sink '%s': depth=%d dropped=+%d (%d total) failed=+%d (%d total)",
+                    sink,
+                    stats["depth"],
+                    dropped,
+                    stats["dropped"],
+                    failed,
+                    stats["failed"],
+                )
+
+    def with_release_ids(self, items):
+        """Fills in release IDs the calendar discovered, so siblings can be bulk-fetched."""
+        return [
+            dict(item, release_id=self.resolved_release_ids[item["name"]])
+            if item.get("release_id") is None and item["name"] in self.resolved_release_ids
+            else item
+            for item in items
+        ]
+
+    def bulk_options(self):
+        """fetch_release_frames kwargs, or None when release-level ingest is off."""
+        ingest = self.settings["ingest"]
+        if not ingest.get("release_bulk"):
+            return None
+        return {
+            "min_series": int(ingest["min_release_series"]),
+            "page_size": int(ingest["page_size"]),
+        }
+
+    def cycle_deadline(self):
+        """Wall-clock deadline for a cycle's series fetches and market overlays (None = unbounded)."""
+        if self.cycle_budget_seconds <= 0:
+            return None
+        return time.time() + self.cycle_budget_seconds
+
+    def process_items(self, items):
+        """Processes due series one by one (see ShardedScheduler for the parallel mode)."""
+        items = self.with_release_ids(items)
+        options = self.bulk_options()
+        with request_deadline(self.cycle_deadline()):
+            prefetched = fetch_release_frames(self.fred, items, **options) if options else {}
+            for item in items:
+                try:
+                    self.process_indicator(item, prefetched.get(item["name"]))
+                except Exception as e:
+                    METRICS.inc("macro_indicator_errors_total", source=item["source"])
+                    logger.error("Failed to process %s: %s", item["name"], e)
+
+    def process_indicator(self, item, raw_df=None):
+        filename = series_filename(item["name"])
+        result = collect_indicator(
+            self.fred,
+            self.ecb,
+            self.detector,
+            item,
+            last_seen_date=self.last_seen_dates.get(item["name"]),
+            last_seen_vintage=self.last_seen_vintages.get(item["name"]),
+            known_fingerprint=self.summary_fingerprints.get(filename),
+            raw_df=raw_df,
+            forecast=self.forecast_for(item),
         )
+        self.apply_result(item, result)
 
-        # 1. Update Data Series
-        for item in self.portfolio:
-            try:
-                self.process_indicator(item)
-            except Exception as e:
-                logger.error(f"Failed to process {item['name']}: {e}")
-
-        # 2. Update Calendar (New Feature)
-        self.update_calendar()
-
-    def process_indicator(self, item):
-        df = pd.DataFrame()
-        if item["source"] == "FRED":
-            units = item.get("units", "lin")
-            df = self.fred.get_series_data(item["id"], units=units)
-        elif item["source"] == "ECB":
-            parts = item["id"].split("/")
-            df = self.ecb.get_series_data(parts[0], parts[1])
+    def forecaster_name(self, item):
+        return item.get("forecaster") or self.forecasts.default
 
-        clean_df = normalise_series(df, item["source"], item["name"])
-        if clean_df.empty:
+    def forecast_for(self, item):
+        """O(1) cached expectation for the series' next print, or None."""
+        model_name = self.forecaster_name(item)
+        expectation = self.forecasts.expectation(item["name"], model_name)
+        return None if expectation is None else (*expectation, model_name)
+
+    def load_history(self, name):
+        df = pd.read_csv(os.path.join("data/processed", series_filename(name)), usecols=["date", "value"])
+        df["date"] = pd.to_datetime(df["date"])
+        return df
+
+    def update_forecasts(self, item, result):
+        """Folds new prints into the indicator's model; cold starts fit on the stored history."""
+        model_name = self.forecaster_name(item)
+        with METRICS.timed("forecast"):
+            if self.forecasts.has(item["name"], model_name):
+                df = pd.DataFrame(result["tail"], columns=["date", "value"])
+                df["date"] = pd.to_datetime(df["date"])
+            else:
+                df = self.load_history(item["name"])
+            self.forecasts.observe(item["name"], df, model_name)
+
+    def apply_result(self, item, result):
+        """
+        Merges one collected indicator into engine state: summary cache,
+        change feed, last-seen dates, event log and alert dispatch.
+        Runs in the coordinating process only.
+        """
+        if result is None:
             return
 
-        filename = (
-            item["name"].replace(" ", "_").replace("(", "").replace(")", "").lower()
-            + ".csv"
-        )
-        filepath = os.path.join("data/processed", filename)
-        clean_df.to_csv(filepath, index=False)
+        filename = result["filename"]
+        self.summary_fingerprints[filename] = result["fingerprint"]
+        if result["changed"] and self.feed is not None:
+            self.feed.publish(
+                series=item["name"],
+                file=filename,
+                latest_date=result["tail"][-1][0],
+                tail=result["tail"],
+            )
+
+        if result["changed"]:
+            self.update_correlations(item["name"], result["tail"])
+            self.update_forecasts(item, result)
 
-        latest_date = clean_df.iloc[-1]["date"]
+        latest_date = result["latest_date"]
         indicator_id = item["name"]
 
+        vintage = vintage_of(result["latest_value"])
+
         if indicator_id not in self.last_seen_dates:
             self.last_seen_dates[indicator_id] = latest_date
-            logger.info(f"Initialized {indicator_id}")
+            self.last_seen_vintages[indicator_id] = vintage
+            logger.info("Initialized %s", indicator_id)
             return
 
-        if latest_date > self.last_seen_dates[indicator_id]:
-            analysis = self.detector.analyze_release(clean_df)
-            print_event_alert(analysis)
+        previous_date = self.last_seen_dates[indicator_id]
+        previous_vintage = self.last_seen_vintages.get(indicator_id)
+        is_new = latest_date > previous_date
+        # Same date, different released value: a revision, which alerts again
+        # under its own vintage; a re-poll of an unchanged print never does
+        is_revision = (
+            latest_date == previous_date
+            and previous_vintage is not None
+            and vintage != previous_vintage
+        )
+        if is_new or is_revision:
+            analysis = result["analysis"]
+            # A short history yields only a status (no classification or z):
+            # nothing to alert, and the print stays unclaimed until it scores
+            if analysis is not None and "classification" in analysis and self.event_log.claim(
+                indicator_id, latest_date, vintage, analysis
+            ):
+                METRICS.inc("macro_alerts_total", source=item["source"])
+                self.alerts.publish(analysis)
+            if result.get("trailing_z") is not None:
+                self.surprise.update(indicator_id, latest_date, result["trailing_z"])
+        if latest_date >= previous_date:
             self.last_seen_dates[indicator_id] = latest_date
+            self.last_seen_vintages[indicator_id] = vintage
+
+    def backfill_correlations(self, name):
+        """Loads a series' stored history into the correlation engine once."""
+        path = os.path.join("data/processed", series_filename(name))
+        if name in self._correlation_backfilled or not os.path.exists(path):
+            return
+        self._correlation_backfilled.add(name)
+        if name not in self.correlations.names:
+            tracked = [n for n in self.correlations.names if n not in MARKET_ASSETS]
+            if len(tracked) >= self.correlation_max_series:
+                return
+            self.correlations.track(name)
+        # Window + lags + one month for the first change is all the engine can use
+        months = self.correlations.window + self.correlations.max_lag + 1
+        df = pd.read_csv(path, usecols=["date", "value"]).tail(months)
+        self.correlations.update_series(name, pd.to_datetime(df["date"]), df["value"])
+
+    def update_correlations(self, name, tail):
+        """Feeds a changed series' newest rows (new prints and revisions)."""
+        with METRICS.timed("correlate"):
+            if name not in self._correlation_backfilled:
+                self.backfill_correlations(name)
+            else:
+                dates, values = zip(*tail)
+                self.correlations.update_series(name, dates, values)
+
+    def update_market_data(self):
+        """Month-end closes of the market overlays, fed into the correlation engine."""
+        months = self.correlations.window + self.correlations.max_lag + 1
+        for asset, ticker in MARKET_ASSETS.items():
+            closes = self.market.get_monthly_closes(ticker, months=months)
+            with METRICS.timed("correlate"):
+                self.correlations.update_series(asset, closes.index, closes.values)
+
+    def publish_correlations(self):
+        """Writes the matrix snapshot for the dashboard if anything moved."""
+        if not self.correlations.dirty:
+            return
+        snapshot = self.correlations.snapshot()
+        write_correlations(snapshot)
+        self.correlations.dirty = False
+        if self.feed is not None:
+            self.feed.publish(
+                series="correlations",
+                file=CORRELATIONS_FILE,
+                latest_date=snapshot["latest_month"],
+                tail=[],
+            )
+
+    def surprise_assignments(self):
+        """indicator -> [region, basket, weight] for indexed series that have data."""
+        return {
+            item["name"]: [item["region"], item.get("basket"), float(item.get("surprise_weight", 1.0))]
+            for item in self.portfolio
+            if item.get("region") is not None and item["name"] in self.last_seen_dates
+        }
+
+    def backfill_surprise_index(self, assignments):
+        """Rebuilds the whole index from stored histories (one vectorised pass)."""
+        frames = []
+        for name in assignments:
+            path = os.path.join("data/processed", series_filename(name))
+            if not os.path.exists(path):
+                continue
+            scored = self.detector.z_scores(self.load_history(name))
+            frames.append(scored.assign(indicator=name))
+        events = (
+            pd.concat(frames, ignore_index=True)
+            if frames
+            else pd.DataFrame(columns=["date", "z_score", "indicator"])
+        )
+        with METRICS.timed("surprise_backfill"):
+            self.surprise.backfill(events, assignments)
+
+    def publish_surprise_index(self):
+        """Persists new index points (rebuilding after portfolio changes) and notifies the dashboard."""
+        assignments = self.surprise_assignments()
+        if assignments != self.surprise.assignments:
+            self.backfill_surprise_index(assignments)
+        elif self.surprise.dirty:
+            self.surprise.save()
+        else:
+            return
+        if self.feed is not None:
+            self.feed.publish(series="surprise_index", file=SURPRISE_FILE, latest_date=None, tail=[])
 
     def update_calendar(self):
         """Generates a verified calendar.csv using API data."""
@@ -119,12 +566,28 @@ class MacroScheduler:
         logger.info("Updating Release Calendar...")
         calendar_rows = []
 
+        # Series from the same FRED release share one lookup
+        release_dates = {}
+
         for item in self.portfolio:
             next_date = "N/A"
 
             # FRED: Fetch real calendar date
             if item["source"] == "FRED":
-                next_date = self.fred.get_next_release(item["id"])
+                if item.get("release_id") is None and item["name"] not in self.resolved_release_ids:
+                    try:
+                        release_id = self.fred.get_release_id(item["id"])
+                    except Exception as e:
+                        logger.warning("Release lookup failed for %s: %s", item["id"], e)
+                        release_id = None
+                    if release_id is not None:
+                        self.resolved_release_ids[item["name"]] = release_id
+                release_key = (
+                    item.get("release_id") or self.resolved_release_ids.get(item["name"]) or item["id"]
+                )
+                if release_key not in release_dates:
+                    release_dates[release_key] = self.fred.get_next_release(item["id"])
+                next_date = release_dates[release_key]
 
             # ECB: Fallback to heuristic (API doesn't allow easy calendar lookup)
             else:
@@ -144,10 +607,46 @@ class MacroScheduler:
         cal_df = pd.DataFrame(calendar_rows)
         cal_df.to_csv("data/processed/calendar.csv", index=False)
 
+    def run_once(self, names=None):
+        """
+        One headless cycle for cron/CI: polls the selected series (or all),
+        refreshes the calendar on full runs, and flushes pending alerts.
+        """
+        items = self.portfolio.select(names) if names else list(self.portfolio)
+        logger.info("One-shot run over %d series", len(items))
+        self.process_items(items)
+        if not names:
+            self.update_calendar()
+            with request_deadline(self.cycle_deadline()):
+                self.update_market_data()
+        self.publish_correlations()
+        self.publish_surprise_index()
+        # Async sinks must deliver before the process exits
+        self.alerts.close()
+
     def start(self):
+        import schedule
+
         logger.info("Macro Tracker Engine Started. Press Ctrl+C to stop.")
+        metrics_port = os.getenv("METRICS_PORT", "9108")
+        if metrics_port:
+            try:
+                start_metrics_server(int(metrics_port))
+            except OSError as e:
+                # e.g. a second engine on this host already serves the port
+                logger.warning("Metrics endpoint disabled (port %s): %s", metrics_port, e)
+        self.feed = ChangeFeedPublisher()
+        if not self.feed.start():
+            self.feed = None
+        # Full model refits stay off the polling path
+        self.forecasts.start_refitter(
+            lambda: {item["name"]: self.forecaster_name(item) for item in self.portfolio},
+            self.load_history,
+        )
         self.run_pipeline()
-        schedule.every(1).minutes.do(self.run_pipeline)
+        schedule.every(int(self.settings["scheduler"]["tick_minutes"])).minutes.do(
+            self.run_pipeline
+        )
         while True:
             schedule.run_pending()
             time.sleep(1)
\ No newline at end of file
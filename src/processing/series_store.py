@@ -0,0 +1,100 @@
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR = "data/processed/shared"
+
+# Row layout of a store file: one (3, n) int64 .npy per series.
+# Dates are int64 nanoseconds; value and trend are float64 bit patterns,
+# viewed back as floats without copying.
+DATE_ROW, VALUE_ROW, MA_ROW = 0, 1, 2
+
+
+def store_path(csv_filename: str, store_dir: str = STORE_DIR) -> str:
+    stem = os.path.splitext(os.path.basename(csv_filename))[0]
+    return os.path.join(store_dir, stem + ".npy")
+
+
+def write_series_store(df: pd.DataFrame, path: str, ma_window: int = 12) -> None:
+    """
+    Writes a series' date/value/trend arrays for memory-mapped readers.
+    The file is replaced atomically: readers holding the old mapping keep
+    a consistent (old) view, new readers see the new one.
+    """
+    df = df.sort_values(by="date", ascending=True)
+    values = df["value"].to_numpy(dtype="float64")
+    ma = df["value"].rolling(window=ma_window).mean().to_numpy(dtype="float64")
+
+    block = np.empty((3, len(df)), dtype=np.int64)
+    block[DATE_ROW] = df["date"].to_numpy().astype("datetime64[ns]").view(np.int64)
+    block[VALUE_ROW] = values.view(np.int64)
+    block[MA_ROW] = ma.view(np.int64)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, block)
+    os.replace(tmp_path, path)
+
+
+def frame_from_block(block: np.ndarray) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Wraps a store block as ([date, value] DataFrame, trend array) without copying."""
+    df = pd.DataFrame(
+        {
+            "date": block[DATE_ROW].view("datetime64[ns]"),
+            "value": block[VALUE_ROW].view("float64"),
+        },
+        copy=False,
+    )
+    return df, block[MA_ROW].view("float64")
+
+
+class SharedSeriesReader:
+    """
+    Read side of the shared series store, one per process.
+
+    Every series is memory-mapped read-only, so all dashboard sessions (and
+    processes) on a host share the same page-cache copy. A mapping is only
+    re-opened when the scheduler swapped the file (new inode or mtime).
+    """
+
+    def __init__(self, store_dir: str = STORE_DIR):
+        self.store_dir = store_dir
+        self._maps: Dict[str, Tuple[Tuple[int, int], np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def stamp(self, csv_filename: str) -> Optional[Tuple[int, int]]:
+        """(inode, mtime_ns) of the current file, or None if not written yet."""
+        try:
+            stat = os.stat(store_path(csv_filename, self.store_dir))
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def block(self, csv_filename: str) -> Optional[np.ndarray]:
+        stamp = self.stamp(csv_filename)
+        if stamp is None:
+            return None
+        with self._lock:
+            cached = self._maps.get(csv_filename)
+            if cached is None or cached[0] != stamp:
+                try:
+                    mapped = np.load(store_path(csv_filename, self.store_dir), mmap_mode="r")
+                except (OSError, ValueError) as e:
+                    logger.warning("Shared series %s unreadable: %s", csv_filename, e)
+                    return cached[1] if cached else None
+                # Dropping the old mapping is safe: the replaced file lives
+                # on until the last reader lets go of it
+                self._maps[csv_filename] = (stamp, mapped)
+                cached = self._maps[csv_filename]
+            return cached[1]
+
+    def frame(self, csv_filename: str) -> Optional[Tuple[pd.DataFrame, np.ndarray]]:
+        block = self.block(csv_filename)
+        return frame_from_block(block) if block is not None else None
@@ -0,0 +1,79 @@
+import logging
+import os
+import yaml
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Config lives next to src/, wherever the engine is launched from
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CONFIG_DIR = os.path.join(ROOT_DIR, "config")
+
+DEFAULT_SETTINGS = {
+    "portfolio_file": os.path.join(CONFIG_DIR, "portfolio.yml"),
+    "scheduler": {"tick_minutes": 1, "calendar_refresh_minutes": 60},
+    "polling_classes": {"fast": 1, "standard": 15, "slow": 60, "daily": 1440},
+    "logging": {},
+    "forecasting": {
+        "default": "ewma",
+        "refit_minutes": 1440,
+        "models": {"ar": {"order": 3, "forgetting": 0.99}, "seasonal_naive": {"season": 12}},
+    },
+    "requests": {
+        "timeout_seconds": 10,
+        "cycle_budget_seconds": 45,
+        "hedge": True,
+        "hedge_percentile": 95,
+        "hedge_min_samples": 20,
+        "hedge_ratio": 0.1,
+        "hedge_burst": 5,
+    },
+    "ingest": {"release_bulk": True, "min_release_series": 20, "page_size": 50000},
+    "surprise_index": {"half_life_days": 30},
+    "correlations": {
+        "window_months": 60,
+        "max_lag": 6,
+        "min_periods": 12,
+        "max_series": 40,
+        "market_refresh_minutes": 60,
+    },
+}
+
+
+def load_yaml(path: str) -> Dict[str, Any]:
+    """Reads a YAML mapping; a missing or empty file is an empty dict."""
+    try:
+        with open(path) as f:
+            data = yaml.safe_load(f)
+    except FileNotFoundError:
+        return {}
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a mapping at the top level")
+    return data
+
+
+def load_settings(path: str = os.path.join(CONFIG_DIR, "settings.yml")) -> Dict[str, Any]:
+    """settings.yml merged over DEFAULT_SETTINGS (one level deep)."""
+    settings = {k: (dict(v) if isinstance(v, dict) else v) for k, v in DEFAULT_SETTINGS.items()}
+    for key, value in load_yaml(path).items():
+        if isinstance(value, dict) and isinstance(settings.get(key), dict):
+            settings[key].update(value)
+        else:
+            settings[key] = value
+    if not os.path.isabs(settings["portfolio_file"]):
+        settings["portfolio_file"] = os.path.join(ROOT_DIR, settings["portfolio_file"])
+    return settings
+
+
+def load_endpoints(path: str = os.path.join(CONFIG_DIR, "endpoints.yml")) -> Dict[str, str]:
+    """
+    Base URL per source. Environment variables win over the file so a
+    simulator or proxy can be swapped in without editing config.
+    """
+    endpoints = load_yaml(path)
+    return {
+        "FRED": os.getenv("FRED_BASE_URL") or endpoints.get("fred", {}).get("base_url"),
+        "ECB": os.getenv("ECB_BASE_URL") or endpoints.get("ecb", {}).get("base_url"),
+    }
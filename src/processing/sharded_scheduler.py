@@ -0,0 +1,220 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional
+
+from src.api.fred_client import FredClient
+from src.api.ecb_client import EcbClient
+from src.api.request_policy import POLICY, request_deadline
+from src.processing.event_detector import EventDetector
+from src.processing.log_config import configure_logging
+from src.processing.metrics import METRICS
+from src.processing.scheduler import (
+    MacroScheduler,
+    collect_indicator,
+    fetch_release_frames,
+    series_filename,
+)
+
+logger = logging.getLogger("ShardedScheduler")
+
+# More shards than workers keeps the pool busy when one release is slow
+SHARDS_PER_WORKER = 4
+
+# Per-process clients, created once by the pool initializer
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(
+    api_key: str,
+    fred_url: str,
+    ecb_url: str,
+    lookback_window: int,
+    log_settings: Dict[str, Any],
+    request_settings: Dict[str, Any],
+):
+    # Spawned workers start with bare logging; give them the same queue setup
+    configure_logging(log_settings)
+    # Each worker keeps its own per-endpoint latency history for hedging
+    POLICY.configure(request_settings)
+    _worker["fred"] = FredClient(api_key=api_key, base_url=fred_url)
+    _worker["ecb"] = EcbClient(base_url=ecb_url)
+    _worker["detector"] = EventDetector(lookback_window=lookback_window)
+
+
+def run_shard(
+    items: List[Dict[str, Any]],
+    last_seen: Dict[str, Any],
+    fingerprints: Dict[str, str],
+    bulk: Optional[Dict[str, Any]] = None,
+    forecasts: Optional[Dict[str, tuple]] = None,
+    deadline: Optional[float] = None,
+    vintages: Optional[Dict[str, str]] = None,
+):
+    """
+    Worker entry point: fetch -> normalise -> detect for one shard.
+    Shards keep release siblings together, so 'bulk' (fetch_release_frames
+    options) lets a worker pull each release in one download. 'deadline'
+    is the coordinator's cycle deadline (wall-clock) for every request;
+    'vintages' are the last-seen released values, for revision detection.
+    Returns compact per-series results plus this worker's drained metrics.
+    """
+    with request_deadline(deadline):
+        results = _collect_shard(items, last_seen, fingerprints, bulk, forecasts, vintages or {})
+    return results, METRICS.drain()
+
+
+def _collect_shard(items, last_seen, fingerprints, bulk, forecasts, vintages):
+    prefetched = {}
+    if bulk:
+        try:
+            prefetched = fetch_release_frames(_worker["fred"], items, **bulk)
+        except Exception as e:
+            logger.error("Release bulk fetch failed: %s", e)
+    results = []
+    for item in items:
+        try:
+            result = collect_indicator(
+                _worker["fred"],
+                _worker["ecb"],
+                _worker["detector"],
+                item,
+                last_seen_date=last_seen.get(item["name"]),
+                last_seen_vintage=vintages.get(item["name"]),
+                known_fingerprint=fingerprints.get(series_filename(item["name"])),
+                raw_df=prefetched.get(item["name"]),
+                forecast=(forecasts or {}).get(item["name"]),
+            )
+            results.append((item["name"], result, None))
+        except Exception as e:
+            results.append((item["name"], None, str(e)))
+    return results
+
+
+def shard_items(items: List[Dict[str, Any]], n_shards: int) -> List[List[Dict[str, Any]]]:
+    """
+    Groups series by (source, release) so siblings share a worker, then
+    spreads the groups over n_shards, largest first onto the lightest shard.
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for item in items:
+        key = (item["source"], item.get("release_id") or item["id"])
+        groups.setdefault(key, []).append(item)
+
+    shards: List[List[Dict[str, Any]]] = [[] for _ in range(max(1, n_shards))]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(shards, key=len).extend(group)
+    return [shard for shard in shards if shard]
+
+
+class ShardedScheduler(MacroScheduler):
+    """
+    Coordinator/worker mode.
+    The coordinator owns the schedule and all state (last-seen dates,
+    summary fingerprints, event log, alerts, change feed). Worker processes
+    run the CPU-heavy fetch -> normalise -> detect path. A crashed worker
+    only costs a pool restart: its shard is resubmitted and no state is lost.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        super().__init__()
+        self.workers = workers or os.cpu_count() or 1
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # 'spawn': the coordinator runs threads (alert bus, metrics, feed),
+        # which are unsafe to fork
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.fred.api_key,
+                self.fred.base_url,
+                self.ecb.base_url,
+                self.detector.lookback_window,
+                self.settings["logging"],
+                self.settings["requests"],
+            ),
+        )
+
+    def process_items(self, items):
+        pending = shard_items(self.with_release_ids(items), self.workers * SHARDS_PER_WORKER)
+        bulk = self.bulk_options()
+        # Shards share the cycle deadline, including any resubmitted after a crash
+        deadline = self.cycle_deadline()
+
+        # One retry after a pool restart, then the series wait for their next poll
+        for attempt in range(2):
+            if not pending:
+                return
+            if self.pool is None:
+                self.pool = self._new_pool()
+
+            futures = {}
+            for shard in pending:
+                names = [item["name"] for item in shard]
+                last_seen = {n: self.last_seen_dates[n] for n in names if n in self.last_seen_dates}
+                vintages = {
+                    n: self.last_seen_vintages[n] for n in names if n in self.last_seen_vintages
+                }
+                fingerprints = {
+                    series_filename(n): self.summary_fingerprints[series_filename(n)]
+                    for n in names
+                    if series_filename(n) in self.summary_fingerprints
+                }
+                # Expectations come from the coordinator's model cache (O(1) each)
+                forecasts = {item["name"]: self.forecast_for(item) for item in shard}
+                futures[
+                    self.pool.submit(
+                        run_shard,
+                        shard,
+                        last_seen,
+                        fingerprints,
+                        bulk,
+                        forecasts,
+                        deadline,
+                        vintages,
+                    )
+                ] = shard
+
+            failed, broken = [], False
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    results, worker_metrics = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    failed.append(shard)
+                    continue
+                except Exception as e:
+                    logger.error("Shard of %d series failed: %s", len(shard), e)
+                    failed.append(shard)
+                    continue
+
+                METRICS.absorb(worker_metrics)
+                by_name = {item["name"]: item for item in shard}
+                for name, result, error in results:
+                    item = by_name[name]
+                    if error:
+                        METRICS.inc("macro_indicator_errors_total", source=item["source"])
+                        logger.error("Failed to process %s: %s", name, error)
+                        continue
+                    self.apply_result(item, result)
+
+            if broken:
+                METRICS.inc("macro_worker_restarts_total")
+                logger.warning("Worker pool crashed; restarting and resubmitting %d shard(s).", len(failed))
+                self.pool.shutdown(wait=False, cancel_futures=True)
+                self.pool = None
+            pending = failed
+
+        if pending:
+            logger.error("%d series skipped this cycle after a retry.", sum(len(s) for s in pending))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.pool = None
@@ -0,0 +1,116 @@
+import pandas as pd
+import numpy as np
+import logging
+import json
+import os
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_DIR = "data/processed/summaries"
+
+
+def series_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Cheap content hash of a normalised series.
+    Changes whenever a new observation lands OR an old one is revised.
+    Dates are hashed as nanoseconds, so a CSV read (datetime64[us]) and
+    the shared store (datetime64[ns]) of the same data agree.
+    """
+    if df.empty:
+        return "empty"
+    canonical = pd.DataFrame(
+        {
+            "date": df["date"].to_numpy().astype("datetime64[ns]").view("int64"),
+            "value": df["value"].to_numpy(dtype="float64"),
+        }
+    )
+    hashed = pd.util.hash_pandas_object(canonical, index=False)
+    return f"{len(df)}-{int(hashed.sum()) & 0xFFFFFFFFFFFFFFFF:x}"
+
+
+def _clean_float(value) -> Optional[float]:
+    # JSON has no NaN, so undefined stats (e.g. SD of one point) become null
+    if value is None or pd.isna(value):
+        return None
+    return float(value)
+
+
+def build_series_summary(df: pd.DataFrame, ma_window: int = 12) -> Dict[str, Any]:
+    """
+    Precomputes everything the dashboard needs for one series.
+    Ref: main_dashboard.py (Ticker Cards, 12M Stats, Smart Scaling, 12M Trend)
+
+    Args:
+        df: Normalised DataFrame ([date, value, indicator, source]).
+        ma_window: Rolling window for the trend line (observations).
+
+    Returns:
+        dict: JSON-serialisable summary record.
+    """
+    df = df.sort_values(by="date", ascending=True)
+    values = df["value"]
+
+    # 1. Ticker Card (latest vs previous print)
+    latest = values.iloc[-1]
+    prev = values.iloc[-2] if len(values) > 1 else latest
+
+    # 2. 12M Stats (fall back to full history if the last year is empty)
+    latest_date = df["date"].max()
+    cutoff_date = latest_date - pd.DateOffset(years=1)
+    stats_values = values[df["date"] > cutoff_date]
+    if stats_values.empty:
+        stats_values = values
+
+    # 3. Smart Scaling bounds (1% / 99% quantiles)
+    q_low = values.quantile(0.01)
+    q_high = values.quantile(0.99)
+
+    # 4. Rolling trend, aligned row-for-row with the stored CSV
+    ma = values.rolling(window=ma_window).mean()
+
+    return {
+        "indicator": str(df["indicator"].iloc[-1]) if "indicator" in df else None,
+        "fingerprint": series_fingerprint(df),
+        "rows": int(len(df)),
+        "latest_date": str(latest_date.date()),
+        "latest": _clean_float(latest),
+        "previous": _clean_float(prev),
+        "delta": _clean_float(latest - prev),
+        "vol_12m": _clean_float(stats_values.std()),
+        "high_12m": _clean_float(stats_values.max()),
+        "low_12m": _clean_float(stats_values.min()),
+        "q01": _clean_float(q_low),
+        "q99": _clean_float(q_high),
+        "ma_window": ma_window,
+        "ma": [_clean_float(v) for v in ma.to_numpy()],
+    }
+
+
+def summary_path(csv_filename: str, summary_dir: str = SUMMARY_DIR) -> str:
+    stem = os.path.splitext(os.path.basename(csv_filename))[0]
+    return os.path.join(summary_dir, stem + ".json")
+
+
+def write_summary(summary: Dict[str, Any], path: str) -> None:
+    """Writes atomically so a dashboard rerun never sees a half-written file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(summary, f)
+    os.replace(tmp_path, path)
+
+
+def load_summary(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def ma_series(summary: Dict[str, Any]) -> np.ndarray:
+    """Returns the stored rolling mean as a float array (NaN where undefined)."""
+    return np.array(
+        [np.nan if v is None else v for v in summary.get("ma", [])], dtype=float
+    )
@@ -0,0 +1,282 @@
+import json
+import logging
+import math
+import os
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SURPRISE_DIR = "data/processed/surprise"
+# Chartable history (long format: date, region, basket, index); also the change-feed key
+SURPRISE_FILE = "surprise_index.csv"
+STATE_FILE = "state.json"
+HISTORY_COLUMNS = ["date", "region", "basket", "index"]
+
+# Every region also gets a composite over all of its indicators
+ALL_BASKET = "All"
+
+# exp() of a float64 overflows past ~709; the backfill rebases long before
+MAX_EXPONENT = 50.0
+
+NS_PER_DAY = 86400 * 10**9
+
+
+def to_days(dates) -> np.ndarray:
+    """Dates -> float days since the epoch."""
+    stamps = pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[ns]")
+    return stamps.view(np.int64) / NS_PER_DAY
+
+
+def decayed_sums(days: np.ndarray, values: np.ndarray, decay: float) -> np.ndarray:
+    """
+    Running sum of 'values' at each event, every earlier term decayed by
+    exp(-decay * age in days). 'days' must be sorted.
+
+    Vectorised as exp(-decay * t_k) * cumsum(v_i * exp(decay * t_i)); the
+    growing factor is rebased whenever its exponent would pass MAX_EXPONENT,
+    carrying the running sum into the next chunk, so any history length
+    stays finite.
+    """
+    out = np.empty(len(days))
+    carry, carry_day = 0.0, days[0] if len(days) else 0.0
+    start = 0
+    while start < len(days):
+        base = days[start]
+        end = start + int(np.searchsorted(days[start:], base + MAX_EXPONENT / decay, side="right"))
+        growth = np.exp(decay * (days[start:end] - base))
+        prior = carry * math.exp(-decay * (base - carry_day))
+        out[start:end] = (prior + np.cumsum(values[start:end] * growth)) / growth
+        carry, carry_day = out[end - 1], days[end - 1]
+        start = end
+    return out
+
+
+class _Decayed:
+    """Decayed weighted sums of one index, anchored at day 't'."""
+
+    __slots__ = ("num", "den", "t")
+
+    def __init__(self, num: float = 0.0, den: float = 0.0, t: Optional[float] = None):
+        self.num, self.den, self.t = num, den, t
+
+    def add(self, day: float, wz: float, w: float, decay: float):
+        if self.t is None:
+            self.t = day
+        if day >= self.t:
+            factor = math.exp(-decay * (day - self.t))
+            self.num, self.den, self.t = self.num * factor, self.den * factor, day
+        else:
+            # Late arrival: enter it already decayed to the anchor
+            factor = math.exp(-decay * (self.t - day))
+            wz, w = wz * factor, w * factor
+        self.num += wz
+        self.den += w
+
+    def value(self) -> Optional[float]:
+        return self.num / self.den if self.den > 1e-12 else None
+
+
+class SurpriseIndex:
+    """
+    Composite macro surprise index per region and basket.
+
+    Each print's z-score (from EventDetector) enters with its indicator's
+    weight; older prints fade with a half-life. The index is the decayed
+    weighted mean of surprises, so it reads in z units: above zero, data
+    has been beating expectations lately. A negative weight flips an
+    indicator whose rise is bad news (e.g. unemployment).
+
+    Updates are O(1): two decayed sums per index, advanced to the new
+    print's date. A full rebuild (backfill) runs once per portfolio change,
+    vectorised over each index's whole history.
+    """
+
+    def __init__(self, half_life_days: float = 30.0, state_dir: str = SURPRISE_DIR):
+        self.half_life_days = float(half_life_days)
+        self.decay = math.log(2) / self.half_life_days
+        self.state_dir = state_dir
+        self._sums: Dict[Tuple[str, str], _Decayed] = {}
+        # indicator -> (day, w * z, w) of its latest print, so a re-scored
+        # print replaces its contribution instead of adding to it
+        self._latest: Dict[str, Tuple[float, float, float]] = {}
+        # indicator -> [region, basket, weight] the state was built with
+        self.assignments: Dict[str, List[Any]] = {}
+        self._pending: List[Tuple[str, str, str, float]] = []
+        self.dirty = False
+
+    @property
+    def history_path(self) -> str:
+        return os.path.join(self.state_dir, SURPRISE_FILE)
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.state_dir, STATE_FILE)
+
+    @staticmethod
+    def _keys(region: str, basket: Optional[str]) -> List[Tuple[str, str]]:
+        keys = [(region, ALL_BASKET)]
+        if basket and basket != ALL_BASKET:
+            keys.append((region, basket))
+        return keys
+
+    def update(self, indicator: str, date, z_score: float) -> bool:
+        """Folds one scored print in. Returns False if it was skipped."""
+        assignment = self.assignments.get(indicator)
+        if assignment is None or z_score is None or not np.isfinite(z_score):
+            return False
+        region, basket, weight = assignment
+        day = float(to_days([date])[0])
+        wz, w = weight * float(z_score), abs(weight)
+
+        previous = self._latest.get(indicator)
+        if previous is not None:
+            if day < previous[0]:
+                return False
+            if day == previous[0]:
+                if previous[1] == wz:
+                    return False
+                for key in self._keys(region, basket):
+                    self._sums[key].add(previous[0], -previous[1], -previous[2], self.decay)
+        self._latest[indicator] = (day, wz, w)
+
+        label = str(pd.Timestamp(date).date())
+        for key in self._keys(region, basket):
+            sums = self._sums.setdefault(key, _Decayed())
+            sums.add(day, wz, w, self.decay)
+            value = sums.value()
+            if value is not None:
+                self._pending.append((label, key[0], key[1], round(value, 4)))
+        self.dirty = True
+        return True
+
+    def value(self, region: str, basket: str = ALL_BASKET) -> Optional[float]:
+        sums = self._sums.get((region, basket))
+        return sums.value() if sums else None
+
+    def backfill(self, events: pd.DataFrame, assignments: Dict[str, List[Any]]) -> pd.DataFrame:
+        """
+        Rebuilds every index from scored history.
+
+        Args:
+            events: [indicator, date, z_score], one row per print.
+            assignments: indicator -> [region, basket, weight].
+
+        Returns:
+            The full history (date, region, basket, index), as written to history_path.
+        """
+        self.assignments = {k: list(v) for k, v in assignments.items()}
+        self._sums, self._latest, self._pending = {}, {}, []
+
+        events = events[events["indicator"].isin(self.assignments)].dropna(subset=["z_score"])
+        events = events.assign(day=to_days(events["date"].to_numpy())).sort_values("day", kind="stable")
+        spec = pd.DataFrame.from_dict(
+            self.assignments, orient="index", columns=["region", "basket", "weight"]
+        )
+        events = events.join(spec, on="indicator")
+        events["wz"] = events["weight"] * events["z_score"]
+        events["w"] = events["weight"].abs()
+
+        latest = events.groupby("indicator").tail(1)
+        self._latest = {
+            row.indicator: (row.day, row.wz, row.w) for row in latest.itertuples(index=False)
+        }
+
+        # Each print counts towards its region composite and its own basket
+        composite = events.assign(basket=ALL_BASKET)
+        baskets = events[events["basket"].notna() & (events["basket"] != ALL_BASKET)]
+        frames = []
+        for (region, basket), group in pd.concat([composite, baskets]).groupby(
+            ["region", "basket"], sort=True
+        ):
+            days = group["day"].to_numpy()
+            num = decayed_sums(days, group["wz"].to_numpy(), self.decay)
+            den = decayed_sums(days, group["w"].to_numpy(), self.decay)
+            self._sums[(region, basket)] = _Decayed(num[-1], den[-1], days[-1])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                index = np.where(den > 1e-12, num / den, np.nan)
+            frames.append(
+                pd.DataFrame(
+                    {"date": group["date"].to_numpy(), "region": region, "basket": basket, "index": index}
+                )
+            )
+
+        if frames:
+            history = pd.concat(frames, ignore_index=True).dropna(subset=["index"])
+            # Several prints on one day: the index after the last of them
+            history = history.drop_duplicates(["date", "region", "basket"], keep="last")
+            history["date"] = pd.to_datetime(history["date"]).dt.strftime("%Y-%m-%d")
+            history["index"] = history["index"].round(4)
+        else:
+            history = pd.DataFrame(columns=HISTORY_COLUMNS)
+        self._write_history(history)
+        self._save_state()
+        self.dirty = False
+        logger.info(
+            "Surprise index rebuilt: %d prints, %d indices", len(events), len(self._sums)
+        )
+        return history
+
+    # --- Persistence ---
+    def _write_history(self, history: pd.DataFrame):
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self.history_path + ".tmp"
+        history.to_csv(tmp_path, index=False, columns=HISTORY_COLUMNS)
+        os.replace(tmp_path, self.history_path)
+
+    def _save_state(self):
+        os.makedirs(self.state_dir, exist_ok=True)
+        record = {
+            "half_life_days": self.half_life_days,
+            "assignments": self.assignments,
+            "sums": [[r, b, s.num, s.den, s.t] for (r, b), s in self._sums.items()],
+            "latest": {k: list(v) for k, v in self._latest.items()},
+        }
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, self.state_path)
+
+    def save(self):
+        """Appends new history points and persists the sums (O(indices), not O(history))."""
+        if not self.dirty:
+            return
+        if self._pending:
+            pd.DataFrame(self._pending, columns=HISTORY_COLUMNS).to_csv(
+                self.history_path,
+                mode="a",
+                index=False,
+                header=not os.path.exists(self.history_path),
+            )
+            self._pending = []
+        self._save_state()
+        self.dirty = False
+
+    def load(self) -> bool:
+        """Restores saved state; False (nothing loaded) if missing or built with another half-life."""
+        try:
+            with open(self.state_path) as f:
+                record = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+        if record.get("half_life_days") != self.half_life_days or not os.path.exists(
+            self.history_path
+        ):
+            return False
+        self.assignments = record["assignments"]
+        self._sums = {(r, b): _Decayed(num, den, t) for r, b, num, den, t in record["sums"]}
+        self._latest = {k: tuple(v) for k, v in record["latest"].items()}
+        return True
+
+
+def load_surprise_history(path: str = os.path.join(SURPRISE_DIR, SURPRISE_FILE)) -> pd.DataFrame:
+    """The chartable index history, sorted by date (empty if not built yet)."""
+    try:
+        history = pd.read_csv(path, parse_dates=["date"])
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    # A re-scored print is appended again: the later row wins
+    history = history.drop_duplicates(["date", "region", "basket"], keep="last")
+    return history.sort_values("date", kind="stable").reset_index(drop=True)
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+# Observations per year by typical spacing (days), as FRED uses for annualising
+_PERIODS_PER_YEAR = [(1.5, 260), (8, 52), (16, 26), (35, 12), (100, 4), (200, 2)]
+
+
+def periods_per_year(dates: pd.Series) -> int:
+    """Infers the series frequency from the median gap between observations."""
+    if len(dates) < 2:
+        return 12
+    gap = pd.Series(dates).sort_values().diff().dt.days.median()
+    for max_days, periods in _PERIODS_PER_YEAR:
+        if gap <= max_days:
+            return periods
+    return 1
+
+
+def apply_units(df: pd.DataFrame, units: str = "lin") -> pd.DataFrame:
+    """
+    Reproduces FRED's 'units' transformations locally on a levels series.
+    Ref: https://fred.stlouisfed.org/docs/api/fred/series_observations.html#units
+
+    Bulk release downloads only return levels, so series configured with
+    e.g. 'pc1' or 'chg' are transformed here instead of by the API.
+
+    Args:
+        df: [date, value] DataFrame of levels (any column order).
+        units: One of lin, chg, ch1, pch, pc1, pca, cch, cca, log.
+
+    Returns:
+        pd.DataFrame: [date, value] with undefined leading rows dropped.
+    """
+    if units == "lin" or df.empty:
+        return df
+
+    out = df[["date", "value"]].sort_values("date").reset_index(drop=True)
+    x = out["value"].astype(float)
+    prev = x.shift(1)
+
+    if units in ("ch1", "pc1"):
+        # Year-ago value by date (works for any frequency)
+        year_ago = pd.Series(x.to_numpy(), index=out["date"] + pd.DateOffset(years=1))
+        year_ago = year_ago[~year_ago.index.duplicated(keep="last")]
+        prev_year = pd.Series(year_ago.reindex(out["date"]).to_numpy(), index=out.index)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if units == "chg":
+            value = x - prev
+        elif units == "ch1":
+            value = x - prev_year
+        elif units == "pch":
+            value = (x / prev - 1) * 100
+        elif units == "pc1":
+            value = (x / prev_year - 1) * 100
+        elif units == "pca":
+            value = ((x / prev) ** periods_per_year(out["date"]) - 1) * 100
+        elif units == "cch":
+            value = np.log(x / prev) * 100
+        elif units == "cca":
+            value = np.log(x / prev) * 100 * periods_per_year(out["date"])
+        elif units == "log":
+            value = np.log(x)
+        else:
+            raise ValueError(f"Unknown FRED units: {units}")
+
+    out["value"] = value.replace([np.inf, -np.inf], np.nan)
+    return out.dropna(subset=["value"]).reset_index(drop=True)
@@ -0,0 +1,68 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from src.alerts.alert_bus import AlertBus, AlertSink
+from src.alerts.sinks import WebhookSink
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        _RecordingHandler.received.append(json.loads(body))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class SlowSink(AlertSink):
+    name = "slow"
+
+    def emit_batch(self, events):
+        time.sleep(0.5)
+
+
+def make_event(indicator, date="2024-01-01", z_score=1.5):
+    return {"indicator": indicator, "date": date, "z_score": z_score}
+
+
+class TestAlertBus(unittest.TestCase):
+    def test_webhook_receives_coalesced_batch(self):
+        # Local stand-in webhook
+        _RecordingHandler.received = []
+        server = HTTPServer(("127.0.0.1", 0), _RecordingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/alerts"
+
+        bus = AlertBus([WebhookSink(url)], batch_window=0.2)
+        bus.publish(make_event("US CPI", z_score=1.0))
+        bus.publish(make_event("US CPI", z_score=2.0))  # same release, newer
+        bus.publish(make_event("US NFP"))
+        bus.close()
+        server.shutdown()
+
+        events = [e for body in _RecordingHandler.received for e in body["events"]]
+        self.assertEqual(len(events), 2)
+        cpi = next(e for e in events if e["indicator"] == "US CPI")
+        self.assertEqual(cpi["z_score"], 2.0)
+        self.assertEqual(bus.metrics()["webhook"]["coalesced"], 1)
+
+    def test_slow_sink_does_not_block_publish(self):
+        bus = AlertBus([SlowSink()], queue_size=2, batch_size=1, batch_window=0.0)
+
+        start = time.monotonic()
+        for i in range(10):
+            bus.publish(make_event(f"Series {i}"))
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        # Bounded queue -> excess alerts are counted, not buffered forever
+        self.assertGreater(bus.metrics()["slow"]["dropped"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import time
+import unittest
+from src.processing.change_feed import ChangeFeedPublisher, ChangeFeedSubscriber
+
+
+class TestChangeFeed(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "feed.sock")
+        self.publisher = ChangeFeedPublisher(self.path)
+        self.publisher.start()
+
+    def tearDown(self):
+        self.publisher.close()
+        self.tmp.cleanup()
+
+    def wait_for(self, condition, timeout=3.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_subscriber_receives_snapshot_and_updates(self):
+        # Published before the subscriber exists -> delivered as snapshot
+        self.publisher.publish("US CPI", "us_cpi.csv", "2024-01-01", [["2024-01-01", 3.1]])
+
+        subscriber = ChangeFeedSubscriber(self.path, retry_seconds=0.05).start()
+        self.assertTrue(self.wait_for(lambda: subscriber.version("us_cpi.csv") > 0))
+
+        seen = {"us_cpi.csv": subscriber.version("us_cpi.csv")}
+        self.assertEqual(subscriber.changed_since(seen), set())
+
+        self.publisher.publish("US NFP", "us_nfp.csv", "2024-01-01", [["2024-01-01", 150.0]])
+        self.assertTrue(self.wait_for(lambda: "us_nfp.csv" in subscriber.changed_since(seen)))
+        self.assertEqual(subscriber.latest["us_nfp.csv"]["tail"][-1][1], 150.0)
+
+    def test_second_publisher_leaves_a_live_feed_alone(self):
+        other = ChangeFeedPublisher(self.path)
+        self.assertFalse(other.start())
+        other.close()
+        self.assertTrue(os.path.exists(self.path))
+
+        # The running engine still serves its subscribers
+        self.publisher.publish("US CPI", "us_cpi.csv", "2024-01-01", [["2024-01-01", 3.1]])
+        subscriber = ChangeFeedSubscriber(self.path, retry_seconds=0.05).start()
+        self.assertTrue(self.wait_for(lambda: subscriber.version("us_cpi.csv") > 0))
+
+    def test_stale_socket_file_is_replaced(self):
+        self.publisher.close()
+        with open(self.path, "w"):
+            pass
+        self.publisher = ChangeFeedPublisher(self.path)
+        self.assertTrue(self.publisher.start())
+
+    def test_bind_errors_disable_the_feed(self):
+        path = os.path.join(self.tmp.name, "x" * 200, "feed.sock")
+        publisher = ChangeFeedPublisher(path)
+        self.assertFalse(publisher.start())
+        publisher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.processing.correlations import CorrelationEngine
+
+
+class TestCorrelationEngine(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.dates = pd.date_range(start="2015-01-01", periods=90, freq="MS")
+        lead_changes = rng.normal(size=90)
+        # B follows A's changes two months later, plus noise
+        follow_changes = np.r_[np.zeros(2), lead_changes[:-2]] + rng.normal(scale=0.3, size=90)
+        self.a = np.cumsum(lead_changes) + 50
+        self.b = np.cumsum(follow_changes) + 200
+
+        self.engine = CorrelationEngine(window=36, max_lag=3, min_periods=12)
+        self.engine.track("A")
+        self.engine.track("B")
+        self.engine.update_series("A", self.dates, self.a)
+        self.engine.update_series("B", self.dates, self.b)
+
+    def brute_force(self, a, lag):
+        da = pd.Series(a, index=self.dates).diff().shift(lag).iloc[-36:]
+        db = pd.Series(self.b, index=self.dates).diff().iloc[-36:]
+        mask = da.notna() & db.notna()
+        return np.corrcoef(da[mask], db[mask])[0, 1]
+
+    def test_running_sums_match_full_recompute(self):
+        for lag in range(4):
+            self.assertAlmostEqual(self.engine.correlation("A", "B", lag), self.brute_force(self.a, lag))
+        # Negative lag flips who leads
+        self.assertEqual(self.engine.correlation("B", "A", -2), self.engine.correlation("A", "B", 2))
+        self.assertEqual(self.engine.snapshot()["best_lag"][0][1], 2)
+
+    def test_revision_replaces_contribution(self):
+        revised = self.a.copy()
+        revised[-1] += 4.0
+        self.assertTrue(self.engine.update("A", self.dates[-1], revised[-1]))
+        self.assertFalse(self.engine.update("A", self.dates[-1], revised[-1]))
+        self.assertAlmostEqual(self.engine.correlation("A", "B", 0), self.brute_force(revised, 0))
+
+    def test_untracked_series_ignored(self):
+        self.assertFalse(self.engine.update("C", self.dates[-1], 1.0))
+        self.assertEqual(self.engine.names, ["A", "B"])
+
+
+if __name__ == "__main__":
+    unittest.main()
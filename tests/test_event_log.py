@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.processing.event_log import EventLog
+
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "events.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_claim_is_idempotent_across_instances(self):
+        event = {"classification": "Large Positive Surprise", "z_score": 1.8}
+        first = EventLog(self.db_path)
+        second = EventLog(self.db_path)  # e.g. a second scheduler
+
+        self.assertTrue(first.claim("US CPI", pd.Timestamp("2024-01-01"), "3.1", event))
+        self.assertFalse(first.claim("US CPI", "2024-01-01", "3.1", event))
+        self.assertFalse(second.claim("US CPI", "2024-01-01", "3.1", event))
+        # A revised value is a new vintage
+        self.assertTrue(second.claim("US CPI", "2024-01-01", "3.2", event))
+
+        # Restart sees everything that was emitted
+        restarted = EventLog(self.db_path)
+        self.assertTrue(restarted.seen("US CPI", "2024-01-01", "3.1"))
+        self.assertEqual(restarted.latest_dates(), {"US CPI": "2024-01-01"})
+
+    def test_range_query_filters(self):
+        log = EventLog(self.db_path)
+        log.claim("US CPI", "2024-01-01", "3.1", {"classification": "Neutral"})
+        log.claim("US CPI", "2024-02-01", "3.4", {"classification": "Moderate Surprise"})
+        log.claim("US NFP", "2024-02-01", "250", {"classification": "Moderate Surprise"})
+
+        rows = log.query(start="2024-02-01", classifications=["Moderate Surprise"])
+        self.assertEqual({r["indicator"] for r in rows}, {"US CPI", "US NFP"})
+
+        rows = log.query(indicators=["US CPI"], end="2024-01-31")
+        self.assertEqual([r["obs_date"] for r in rows], ["2024-01-01"])
+
+
+if __name__ == "__main__":
+    unittest.main()
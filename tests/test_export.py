@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.processing.export import export, iter_batches, list_series, write_ndjson
+from src.processing.series_store import store_path, write_series_store
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+CATALOG = {"us_cpi.csv": ("US CPI", "FRED"), "eurozone_inflation.csv": ("Eurozone Inflation", "ECB")}
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        dates = pd.date_range(start="2020-01-01", periods=24, freq="MS")
+        for filename, (indicator, source) in CATALOG.items():
+            df = pd.DataFrame({"date": dates, "value": range(24), "indicator": indicator, "source": source})
+            df.to_csv(os.path.join(self.tmp.name, filename), index=False)
+        # CPI also has a shared store file (the date filter becomes a binary search);
+        # Eurozone goes through the chunked CSV fallback
+        cpi = pd.read_csv(os.path.join(self.tmp.name, "us_cpi.csv"), parse_dates=["date"])
+        write_series_store(cpi, store_path("us_cpi.csv", os.path.join(self.tmp.name, "shared")))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def batches(self, **filters):
+        return list(iter_batches(data_dir=self.tmp.name, catalog=CATALOG, **filters))
+
+    def test_batches_are_bounded_and_filtered(self):
+        batches = self.batches(start="2020-03-01", end="2020-12-01", batch_size=4)
+        self.assertTrue(all(len(b) <= 4 for b in batches))
+        rows = pd.concat(batches)
+        self.assertEqual(list(rows.columns), ["date", "value", "indicator", "source"])
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(rows["date"].min(), pd.Timestamp("2020-03-01"))
+        self.assertEqual(rows["date"].max(), pd.Timestamp("2020-12-01"))
+
+        ecb = pd.concat(self.batches(sources=["ecb"]))
+        self.assertEqual(set(ecb["indicator"]), {"Eurozone Inflation"})
+        self.assertEqual(self.batches(indicators=["NOPE"]), [])
+
+    def test_files_without_metadata_columns_are_named_by_file(self):
+        pd.DataFrame({"date": ["2020-01-01"], "value": [1.0]}).to_csv(
+            os.path.join(self.tmp.name, "adhoc_series.csv"), index=False
+        )
+        series = list_series(data_dir=self.tmp.name, catalog=CATALOG)
+        self.assertIn(("adhoc_series", ""), [(i, s) for i, s, _ in series])
+
+    def test_ndjson_rows(self):
+        out = io.StringIO()
+        rows = write_ndjson(iter(self.batches(indicators=["us cpi"], end="2020-02-01")), out)
+        self.assertEqual(rows, 2)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(lines[0], {"date": "2020-01-01", "value": 0.0, "indicator": "US CPI", "source": "FRED"})
+
+    @unittest.skipUnless(pyarrow, "pyarrow not installed")
+    def test_arrow_and_parquet_round_trip(self):
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        arrow_path = os.path.join(self.tmp.name, "out.arrow")
+        self.assertEqual(export(iter(self.batches(batch_size=5)), "arrow", arrow_path), 48)
+        with pyarrow.ipc.open_stream(arrow_path) as reader:
+            self.assertEqual(reader.read_all().num_rows, 48)
+
+        parquet_path = os.path.join(self.tmp.name, "out.parquet")
+        export(iter(self.batches(batch_size=5)), "parquet", parquet_path)
+        self.assertEqual(pyarrow.parquet.read_table(parquet_path).num_rows, 48)
+
+
+if __name__ == "__main__":
+    unittest.main()
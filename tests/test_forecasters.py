@@ -0,0 +1,93 @@
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.processing.forecasters import (
+    ArForecaster,
+    EwmaForecaster,
+    FORECASTERS,
+    ForecastBook,
+    SeasonalNaiveForecaster,
+)
+from src.processing.portfolio import VALID_FORECASTERS
+
+
+def ar_series(n=200, seed=3):
+    rng = np.random.default_rng(seed)
+    values = [2.0, 2.1]
+    for _ in range(n - 2):
+        values.append(0.5 + 0.6 * values[-1] + 0.2 * values[-2] + rng.normal(scale=0.1))
+    return np.array(values)
+
+
+class TestForecasters(unittest.TestCase):
+    def test_rls_updates_track_full_refit(self):
+        values = ar_series()
+        incremental = ArForecaster(order=2, forgetting=1.0)
+        incremental.fit(values[:150])
+        for value in values[150:]:
+            incremental.update(value)
+
+        refit = ArForecaster(order=2, forgetting=1.0)
+        refit.fit(values)
+        np.testing.assert_allclose(incremental.theta, refit.theta, atol=1e-6)
+        self.assertAlmostEqual(incremental.predict(), refit.predict(), places=6)
+
+    def test_ewma_and_seasonal_naive(self):
+        values = ar_series(40)
+        model = EwmaForecaster(alpha=0.3)
+        for value in values:
+            model.update(value)
+        expected = pd.Series(values).ewm(alpha=0.3, adjust=False).mean().iloc[-1]
+        self.assertAlmostEqual(model.predict(), expected)
+
+        seasonal = SeasonalNaiveForecaster(season=12)
+        seasonal.fit(values)
+        self.assertEqual(seasonal.predict(), values[-12])
+
+    def test_portfolio_validation_knows_every_model(self):
+        self.assertEqual(set(FORECASTERS), VALID_FORECASTERS)
+
+
+class TestForecastBook(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        values = ar_series(120)
+        dates = pd.date_range(start="2010-01-01", periods=120, freq="MS")
+        self.df = pd.DataFrame({"date": dates, "value": values})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cold_start_update_and_persistence(self):
+        book = ForecastBook(default="ar", options={"ar": {"order": 2}}, state_dir=self.tmp.name)
+        self.assertIsNone(book.expectation("US CPI"))
+
+        book.observe("US CPI", self.df.iloc[:-1])
+        last_date, expected = book.expectation("US CPI")
+        self.assertEqual(last_date, self.df["date"].iloc[-2])
+
+        # New print: O(1) update moves the model forward one step
+        book.observe("US CPI", self.df.tail(5))
+        self.assertEqual(book.expectation("US CPI")[0], self.df["date"].iloc[-1])
+
+        # A fresh process picks the cached state up from disk
+        reloaded = ForecastBook(default="ar", options={"ar": {"order": 2}}, state_dir=self.tmp.name)
+        self.assertEqual(reloaded.expectation("US CPI"), book.expectation("US CPI"))
+        self.assertIsNone(reloaded.expectation("US CPI", "ewma"))
+
+    def test_revision_marks_model_for_refit(self):
+        book = ForecastBook(default="ewma", state_dir=self.tmp.name, refit_seconds=3600)
+        book.observe("US NFP", self.df)
+        self.assertFalse(book.needs_refit("US NFP"))
+
+        revised = self.df.copy()
+        revised.loc[revised.index[-1], "value"] += 1.0
+        book.observe("US NFP", revised.tail(5))
+        self.assertTrue(book.needs_refit("US NFP"))
+        self.assertTrue(book.refit("US NFP", revised))
+        self.assertFalse(book.needs_refit("US NFP"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import json
+import logging
+import unittest
+from src.processing.log_config import RateLimitFilter, StructuredFormatter
+
+
+def make_record(msg, *args, created=0.0, **extra):
+    record = logging.LogRecord("src.api", logging.WARNING, __file__, 1, msg, args, None)
+    record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+class TestLogConfig(unittest.TestCase):
+    def test_rate_limit_suppresses_repeats_and_reports_count(self):
+        limiter = RateLimitFilter(window_seconds=10, max_repeats=2)
+        passed = [limiter.filter(make_record("retry %d", i, created=i * 0.1)) for i in range(5)]
+        self.assertEqual(passed, [True, True, False, False, False])
+
+        # Next window: the record goes through and carries the suppressed count
+        record = make_record("retry %d", 9, created=20.0)
+        self.assertTrue(limiter.filter(record))
+        self.assertEqual(record.suppressed_repeats, 3)
+        self.assertIn("suppressed 3", record.getMessage())
+
+    def test_structured_formatter_includes_extra_fields(self):
+        record = make_record("fetched %s", "CPIAUCSL", created=1.5, source="FRED")
+        payload = json.loads(StructuredFormatter().format(record))
+        self.assertEqual(payload["msg"], "fetched CPIAUCSL")
+        self.assertEqual(payload["source"], "FRED")
+        self.assertEqual(payload["level"], "WARNING")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import urllib.request
+from src.processing.metrics import MetricsRegistry, start_metrics_server
+
+
+class TestMetrics(unittest.TestCase):
+    def test_timed_records_latency_and_errors(self):
+        registry = MetricsRegistry()
+        before = registry.snapshot()
+
+        with registry.timed("parse", source="ECB"):
+            pass
+        with self.assertRaises(ValueError):
+            with registry.timed("parse", source="ECB"):
+                raise ValueError("bad payload")
+        registry.inc("macro_rows_total", 120, source="ECB")
+
+        summary = registry.cycle_summary(before)
+        self.assertEqual(summary["stages"]["source=ECB,stage=parse"]["calls"], 2)
+        self.assertEqual(summary["counters"]["macro_stage_errors_total{source=ECB,stage=parse}"], 1)
+        self.assertEqual(summary["counters"]["macro_rows_total{source=ECB}"], 120)
+
+    def test_prometheus_endpoint(self):
+        registry = MetricsRegistry()
+        with registry.timed("fetch", source="FRED"):
+            pass
+        server = start_metrics_server(0, registry=registry)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            body = urllib.request.urlopen(url).read().decode()
+        finally:
+            server.shutdown()
+
+        self.assertIn('macro_stage_seconds_count{source="FRED",stage="fetch"} 1', body)
+        self.assertIn('le="+Inf"', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
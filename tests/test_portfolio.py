@@ -0,0 +1,95 @@
+import os
+import tempfile
+import time
+import unittest
+from src.processing.portfolio import Portfolio
+from src.processing.settings import load_settings
+
+POLLING = {"fast": 1, "slow": 60}
+
+SERIES_YAML = """
+series:
+  - {id: CPIAUCSL, source: FRED, name: US CPI, units: pc1, polling: fast, release_id: 10}
+  - {id: PAYEMS, source: FRED, name: US NFP, units: chg, polling: slow, release_id: 50}
+  - {id: UNRATE, source: FRED, name: US Unemployment, polling: slow, release_id: 50}
+"""
+
+
+class TestPortfolio(unittest.TestCase):
+    def test_repo_config_is_valid(self):
+        settings = load_settings()
+        portfolio = Portfolio.load(settings["portfolio_file"], settings["polling_classes"])
+        self.assertEqual(len(portfolio), 6)
+        self.assertEqual(len(portfolio.by_source["ECB"]), 1)
+
+    def test_validation_collects_errors(self):
+        with self.assertRaises(ValueError) as ctx:
+            Portfolio.from_items(
+                [
+                    {"id": "X", "source": "BLS", "name": "Bad Source"},
+                    {"id": "NOSLASH", "source": "ECB", "name": "Bad ECB"},
+                    {"id": "Y", "source": "FRED", "name": "Bad Units", "units": "pct"},
+                    {"id": "Z", "source": "FRED", "name": "Bad Release", "release_id": "ten"},
+                    {"id": "W", "source": "FRED", "name": "Bad Interval", "polling": "weird"},
+                ],
+                dict(POLLING, weird="often"),
+            )
+        message = str(ctx.exception)
+        self.assertIn("release_id must be an integer", message)
+        self.assertIn("needs a number of minutes", message)
+        self.assertIn("unknown source", message)
+        self.assertIn("FLOW/KEY", message)
+        self.assertIn("unknown FRED units", message)
+
+    def test_due_only_returns_elapsed_series(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "portfolio.yml")
+            with open(path, "w") as f:
+                f.write(SERIES_YAML)
+            portfolio = Portfolio.load(path, POLLING)
+
+        self.assertEqual([i["name"] for i in portfolio.by_release[50]], ["US NFP", "US Unemployment"])
+
+        now = 1_000_000.0
+        self.assertEqual(len(portfolio.due(now)), 3)
+        for item in portfolio:
+            portfolio.mark_polled(item["name"], now)
+
+        self.assertEqual(portfolio.due(now + 30), [])
+        self.assertEqual([i["name"] for i in portfolio.due(now + 61)], ["US CPI"])
+
+    def test_hot_reload_keeps_schedule_and_rejects_bad_edits(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "portfolio.yml")
+            with open(path, "w") as f:
+                f.write(SERIES_YAML)
+            portfolio = Portfolio.load(path, POLLING)
+            now = time.time()
+            for item in portfolio.due(now):
+                portfolio.mark_polled(item["name"], now)
+
+            # Add one series
+            with open(path, "a") as f:
+                f.write("  - {id: PPIFIS, source: FRED, name: US PPI, units: pc1}\n")
+            os.utime(path, (now + 5, now + 5))
+            self.assertTrue(portfolio.reload_if_changed())
+            self.assertEqual([i["name"] for i in portfolio.due(now + 1)], ["US PPI"])
+
+            # A broken edit is ignored
+            with open(path, "a") as f:
+                f.write("  - {id: BAD, source: NOPE, name: Broken}\n")
+            os.utime(path, (now + 10, now + 10))
+            self.assertFalse(portfolio.reload_if_changed())
+            self.assertEqual(len(portfolio), 4)
+
+            # So is a release_id that isn't an integer; the indexes stay intact
+            with open(path, "w") as f:
+                f.write(SERIES_YAML.replace("release_id: 50}", "release_id: CPI}", 1))
+            os.utime(path, (now + 15, now + 15))
+            self.assertFalse(portfolio.reload_if_changed())
+            self.assertEqual(len(portfolio.by_release[50]), 2)
+            self.assertEqual(len(portfolio.by_name), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+import pandas as pd
+from benchmarks.api_simulator import ApiSimulator
+from src.api.fred_client import FredClient
+from src.processing.scheduler import fetch_release_frames
+from src.processing.transformers import apply_units
+
+
+class TestApplyUnits(unittest.TestCase):
+    def setUp(self):
+        dates = pd.date_range(start="2020-01-01", periods=30, freq="MS")
+        self.df = pd.DataFrame({"date": dates, "value": np.linspace(100.0, 129.0, 30)})
+
+    def test_fred_formulas(self):
+        chg = apply_units(self.df, "chg")
+        self.assertEqual(len(chg), 29)
+        self.assertAlmostEqual(chg["value"].iloc[0], 1.0)
+
+        # Year-ago match by date: first defined print is 13 months in
+        pc1 = apply_units(self.df, "pc1")
+        self.assertEqual(pc1["date"].iloc[0], pd.Timestamp("2021-01-01"))
+        self.assertAlmostEqual(pc1["value"].iloc[0], (112.0 / 100.0 - 1) * 100)
+
+        pca = apply_units(self.df, "pca")
+        self.assertAlmostEqual(pca["value"].iloc[0], ((101.0 / 100.0) ** 12 - 1) * 100)
+        self.assertIs(apply_units(self.df, "lin"), self.df)
+
+
+class TestReleaseIngest(unittest.TestCase):
+    def setUp(self):
+        members = [f"SIM{i:03d}" for i in range(5)]
+        self.simulator = ApiSimulator(history=48, releases={77: members}).start()
+        self.fred = FredClient(api_key="TEST", base_url=self.simulator.fred_base_url)
+        self.items = [
+            {"id": sid, "source": "FRED", "name": f"Sim {sid}", "units": "lin", "release_id": 77}
+            for sid in members[:4]
+        ]
+
+    def tearDown(self):
+        self.simulator.stop()
+
+    def test_paged_bulk_matches_per_series_calls(self):
+        # 5 series x 48 observations over pages of 100: series span page breaks
+        frames = fetch_release_frames(self.fred, self.items, min_series=2, page_size=100)
+        self.assertEqual(self.simulator.stats["requests"], 3)
+        self.assertEqual(sorted(frames), sorted(item["name"] for item in self.items))
+
+        single = self.fred.get_series_data("SIM002")
+        bulk = frames["Sim SIM002"]
+        self.assertEqual(len(bulk), 48)
+        pd.testing.assert_frame_equal(bulk.reset_index(drop=True), single.reset_index(drop=True))
+
+    def test_small_groups_keep_per_series_calls(self):
+        self.assertEqual(fetch_release_frames(self.fred, self.items, min_series=10), {})
+        self.assertEqual(self.simulator.stats["requests"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.api.request_policy import (
+    DeadlineExceeded,
+    LatencyTracker,
+    RequestPolicy,
+    get_with_retry,
+    request_deadline,
+)
+
+
+class _ScriptedServer:
+    """
+    Answers 'ok'; the n-th request sleeps delays[n] seconds (0 once the
+    script runs out) and returns statuses[n] (200 once that runs out).
+    """
+
+    def __init__(self, delays, statuses=()):
+        self.delays = list(delays)
+        self.statuses = list(statuses)
+        self.requests = 0
+        lock = threading.Lock()
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with lock:
+                    n = server.requests
+                    server.requests += 1
+                time.sleep(server.delays[n] if n < len(server.delays) else 0)
+                self.send_response(server.statuses[n] if n < len(server.statuses) else 200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/series/observations"
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestRequestPolicy(unittest.TestCase):
+    def setUp(self):
+        self.server = _ScriptedServer([1.5])
+        self.policy = RequestPolicy(timeout=5, hedge_min_samples=5, min_hedge_delay=0.01)
+        for _ in range(10):
+            self.policy.latency.observe("TEST /series/observations", 0.02)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_tracker_percentile(self):
+        tracker = LatencyTracker(window=100)
+        for ms in range(1, 101):
+            tracker.observe("FRED", ms / 1000)
+        self.assertAlmostEqual(tracker.percentile("FRED", 95), 0.096)
+        self.assertIsNone(tracker.percentile("FRED", 95, min_samples=101))
+        self.assertIsNone(tracker.percentile("ECB", 50))
+
+    def test_slow_request_is_hedged(self):
+        start = time.perf_counter()
+        response = get_with_retry(self.server.url, source="TEST", policy=self.policy)
+        self.assertEqual(response.text, "ok")
+        # The stalled first request is abandoned, not waited for
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_hedges_are_capped_by_budget(self):
+        self.policy.hedge_burst = self.policy._tokens = 0
+        start = time.perf_counter()
+        get_with_retry(self.server.url, source="TEST", policy=self.policy)
+        self.assertGreater(time.perf_counter() - start, 1.4)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_deadline_bounds_attempts_and_retries(self):
+        self.policy.hedge = False
+        start = time.perf_counter()
+        with request_deadline(time.time() + 0.3):
+            with self.assertRaises(DeadlineExceeded):
+                get_with_retry(self.server.url, source="TEST", policy=self.policy)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+        with request_deadline(time.time() - 1):
+            with self.assertRaises(DeadlineExceeded):
+                get_with_retry(self.server.url, source="TEST", policy=self.policy)
+
+    def test_retryable_responses_are_not_latency_samples(self):
+        server = _ScriptedServer([], statuses=[429, 503])
+        policy = RequestPolicy(timeout=5, hedge=False)
+        try:
+            response = get_with_retry(server.url, source="TEST", backoff=0.01, policy=policy)
+        finally:
+            server.stop()
+        self.assertEqual(response.text, "ok")
+        self.assertEqual(server.requests, 3)
+        # Only the successful answer counts towards the endpoint's latency
+        endpoint = "TEST /series/observations"
+        self.assertIsNotNone(policy.latency.percentile(endpoint, 50))
+        self.assertIsNone(policy.latency.percentile(endpoint, 50, min_samples=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
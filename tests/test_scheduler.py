@@ -0,0 +1,131 @@
+import logging
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.alerts.alert_bus import AlertBus
+from src.alerts.sinks import FileSink
+from src.processing.portfolio import Portfolio
+
+ITEM = {"id": "TESTCPI", "source": "FRED", "name": "Test CPI", "region": "US", "basket": "inflation"}
+
+
+class _StaticFred:
+    """Serves whatever frame the test set, in place of the FRED API."""
+
+    api_key = "TEST"
+
+    def __init__(self):
+        self.df = pd.DataFrame(columns=["date", "value"])
+
+    def get_series_data(self, series_id, start_date=None, units="lin"):
+        return self.df.copy()
+
+
+def monthly(values, start="2020-01-01"):
+    dates = pd.date_range(start=start, periods=len(values), freq="MS").astype("datetime64[ns]")
+    return pd.DataFrame({"date": dates, "value": values})
+
+
+class SchedulerTestCase(unittest.TestCase):
+    """MacroScheduler in a scratch working directory, fed by _StaticFred."""
+
+    items = [ITEM]
+
+    def setUp(self):
+        from src.processing.scheduler import MacroScheduler
+
+        logging.disable(logging.WARNING)
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.scheduler = MacroScheduler()
+        self.scheduler.alerts.close()
+        self.scheduler.alerts = AlertBus([FileSink(os.path.join(self.tmp.name, "alerts.jsonl"))])
+        self.scheduler.portfolio = Portfolio.from_items(self.items, {"fast": 0})
+        self.scheduler.fred = _StaticFred()
+
+    def tearDown(self):
+        self.scheduler.alerts.close()
+        self.scheduler.event_log.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def poll(self, df):
+        self.scheduler.fred.df = df
+        self.scheduler.process_items(list(self.scheduler.portfolio))
+
+    def events(self):
+        return self.scheduler.event_log.query(indicators=[ITEM["name"]])
+
+
+class TestRevisions(SchedulerTestCase):
+    def test_same_date_revision_alerts_once_per_vintage(self):
+        values = list(np.linspace(2.0, 3.0, 30))
+        self.poll(monthly(values))
+        self.assertEqual(self.events(), [])
+
+        self.poll(monthly(values + [3.5]))
+        self.assertEqual(len(self.events()), 1)
+
+        # Re-polling the unchanged print is not an event; revising it is
+        self.poll(monthly(values + [3.5]))
+        self.assertEqual(len(self.events()), 1)
+        self.poll(monthly(values + [3.9]))
+        events = self.events()
+        self.assertEqual([e["vintage"] for e in events], ["3.9", "3.5"])
+        self.poll(monthly(values + [3.9]))
+        self.assertEqual(len(self.events()), 2)
+
+    def test_insufficient_history_is_not_claimed_or_dispatched(self):
+        lookback = self.scheduler.detector.lookback_window
+        values = list(np.linspace(2.0, 3.0, lookback - 3))
+        self.poll(monthly(values))
+        self.poll(monthly(values + [3.5]))
+        self.assertEqual(self.events(), [])
+        self.assertEqual(self.scheduler.alerts.metrics()["file"]["enqueued"], 0)
+
+
+class TestAlertBackpressure(SchedulerTestCase):
+    def test_warns_only_on_new_losses(self):
+        logging.disable(logging.NOTSET)
+        stats = self.scheduler.alerts.workers[0].stats
+        stats["dropped"] = 2
+        with self.assertLogs("MacroScheduler", logging.WARNING) as logs:
+            self.scheduler.report_alert_backpressure()
+        self.assertIn("dropped=+2 (2 total)", logs.output[0])
+
+        # Same totals next cycle: the problem has stopped, nothing to report
+        with self.assertNoLogs("MacroScheduler", logging.WARNING):
+            self.scheduler.report_alert_backpressure()
+
+        stats["failed"] = 1
+        with self.assertLogs("MacroScheduler", logging.WARNING) as logs:
+            self.scheduler.report_alert_backpressure()
+        self.assertIn("dropped=+0 (2 total) failed=+1 (1 total)", logs.output[0])
+
+
+class TestSurpriseIndexWiring(SchedulerTestCase):
+    def test_live_updates_match_a_rebuild(self):
+        rng = np.random.default_rng(5)
+        values = list(2.0 + rng.normal(scale=0.2, size=36).cumsum())
+        self.poll(monthly(values))
+        self.scheduler.publish_surprise_index()
+
+        # New prints and a revision, scored live (alerts use the model's expectation)
+        for new in (values[-1] + 0.6, values[-1] - 0.3):
+            values.append(new)
+            self.poll(monthly(values))
+        values[-1] += 0.4
+        self.poll(monthly(values))
+        self.assertEqual(len(self.events()), 3)
+        live = self.scheduler.surprise.value("US", "inflation")
+
+        self.scheduler.backfill_surprise_index(self.scheduler.surprise_assignments())
+        self.assertAlmostEqual(self.scheduler.surprise.value("US", "inflation"), live, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
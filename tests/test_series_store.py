@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.processing.series_store import SharedSeriesReader, store_path, write_series_store
+
+
+class TestSeriesStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = store_path("us_cpi.csv", self.tmp.name)
+        dates = pd.date_range(start="2021-01-01", periods=24, freq="MS")
+        self.df = pd.DataFrame({"date": dates, "value": np.arange(24, dtype=float)})
+        write_series_store(self.df, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_frame_is_zero_copy_view_of_mapping(self):
+        reader = SharedSeriesReader(self.tmp.name)
+        df, ma = reader.frame("us_cpi.csv")
+        block = reader.block("us_cpi.csv")
+
+        self.assertIsInstance(block, np.memmap)
+        self.assertTrue(np.shares_memory(df["value"].to_numpy(), block))
+        self.assertTrue((df["date"] == self.df["date"]).all())
+        self.assertEqual(df["value"].iloc[-1], 23.0)
+        self.assertAlmostEqual(ma[-1], 17.5)
+        self.assertTrue(np.isnan(ma[0]))
+
+    def test_swap_keeps_old_view_and_remaps_new(self):
+        reader = SharedSeriesReader(self.tmp.name)
+        old_df, _ = reader.frame("us_cpi.csv")
+        # Same mapping while the file is unchanged
+        self.assertIs(reader.block("us_cpi.csv"), reader.block("us_cpi.csv"))
+
+        write_series_store(self.df.assign(value=self.df["value"] * 2), self.path)
+        new_df, _ = reader.frame("us_cpi.csv")
+        self.assertEqual(new_df["value"].iloc[-1], 46.0)
+        self.assertEqual(old_df["value"].iloc[-1], 23.0)
+
+    def test_missing_series(self):
+        reader = SharedSeriesReader(self.tmp.name)
+        self.assertIsNone(reader.stamp("nope.csv"))
+        self.assertIsNone(reader.frame("nope.csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
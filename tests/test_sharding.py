@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+import pandas as pd
+from benchmarks.api_simulator import ApiSimulator
+from src.alerts.alert_bus import AlertBus
+from src.alerts.sinks import FileSink
+from src.processing.metrics import METRICS
+from src.processing.portfolio import series_filename
+from src.processing.sharded_scheduler import run_shard, shard_items
+
+
+def _crash_once(calls_path, marker_path, items, *args):
+    """run_shard stand-in: logs the shard, and the first call kills its worker."""
+    with open(calls_path, "a") as f:
+        f.write(json.dumps([item["name"] for item in items]) + "\n")
+    if not os.path.exists(marker_path):
+        open(marker_path, "w").close()
+        os._exit(1)
+    return run_shard(items, *args)
+
+
+class _CrashOncePool:
+    """Routes every submitted shard through _crash_once."""
+
+    def __init__(self, pool, calls_path, marker_path):
+        self.pool = pool
+        self.paths = (calls_path, marker_path)
+
+    def submit(self, fn, *args):
+        return self.pool.submit(_crash_once, *self.paths, *args)
+
+    def shutdown(self, **kwargs):
+        self.pool.shutdown(**kwargs)
+
+
+class TestSharding(unittest.TestCase):
+    def test_release_siblings_share_a_shard(self):
+        items = [
+            {"id": f"CPI{i}", "source": "FRED", "name": f"CPI {i}", "release_id": 10}
+            for i in range(6)
+        ] + [
+            {"id": f"X{i}", "source": "FRED", "name": f"X {i}"} for i in range(6)
+        ]
+        shards = shard_items(items, 4)
+
+        cpi_shards = [s for s in shards if any(i.get("release_id") == 10 for i in s)]
+        self.assertEqual(len(cpi_shards), 1)
+        self.assertEqual(sum(len(s) for s in shards), 12)
+        # Ungrouped series fill the remaining shards evenly
+        self.assertEqual(sorted(len(s) for s in shards), [2, 2, 2, 6])
+
+    def test_never_more_shards_than_items(self):
+        items = [{"id": "A", "source": "ECB", "name": "A"}]
+        self.assertEqual(len(shard_items(items, 8)), 1)
+
+
+
+class TestShardedProcessItems(unittest.TestCase):
+    def setUp(self):
+        from src.processing.sharded_scheduler import ShardedScheduler
+
+        logging.disable(logging.WARNING)
+        self.simulator = ApiSimulator(history=36).start()
+        self.env = {k: os.environ.get(k) for k in ("FRED_BASE_URL", "ECB_BASE_URL")}
+        os.environ["FRED_BASE_URL"] = self.simulator.fred_base_url
+        os.environ["ECB_BASE_URL"] = self.simulator.ecb_base_url
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+        self.scheduler = ShardedScheduler(workers=2)
+        self.scheduler.alerts.close()
+        self.scheduler.alerts = AlertBus([FileSink(os.path.join(self.tmp.name, "alerts.jsonl"))])
+        self.calls_path = os.path.join(self.tmp.name, "calls.jsonl")
+        new_pool = self.scheduler._new_pool
+        self.scheduler._new_pool = lambda: _CrashOncePool(
+            new_pool(), self.calls_path, os.path.join(self.tmp.name, "crashed")
+        )
+
+    def tearDown(self):
+        self.scheduler.close()
+        self.scheduler.alerts.close()
+        self.scheduler.event_log.close()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+        self.simulator.stop()
+        for key, value in self.env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        logging.disable(logging.NOTSET)
+
+    def test_crashed_pool_is_restarted_and_results_merged(self):
+        items = [
+            {"id": f"SIM{i:03d}", "source": "FRED", "name": f"Sim {i}", "units": "lin"}
+            for i in range(4)
+        ] + [{"id": "NOSLASH", "source": "ECB", "name": "Broken ECB", "units": "lin"}]
+        before = METRICS.snapshot()
+        self.scheduler.process_items(items)
+        counters = METRICS.cycle_summary(before)["counters"]
+
+        # One restart; shards lost with the pool ran once more, nothing a third time
+        self.assertEqual(counters["macro_worker_restarts_total{}"], 1)
+        with open(self.calls_path) as f:
+            calls = [json.loads(line) for line in f]
+        runs = {item["name"]: sum(item["name"] in shard for shard in calls) for item in items}
+        self.assertEqual(runs[calls[0][0]], 2)
+        self.assertEqual(set(runs.values()) - {1, 2}, set())
+
+        # Results applied on the coordinator; the bad series failed on its own
+        self.assertEqual(
+            sorted(self.scheduler.last_seen_dates), [f"Sim {i}" for i in range(4)]
+        )
+        self.assertEqual(counters["macro_indicator_errors_total{source=ECB}"], 1)
+        # Worker metrics were drained back into the coordinator's registry
+        written = sum(
+            len(pd.read_csv(os.path.join("data/processed", series_filename(f"Sim {i}"))))
+            for i in range(4)
+        )
+        self.assertEqual(counters["macro_rows_total{source=FRED}"], written)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import pandas as pd
+from src.processing.summaries import build_series_summary, series_fingerprint
+
+
+class TestSummaries(unittest.TestCase):
+    def setUp(self):
+        dates = pd.date_range(start="2022-01-01", periods=24, freq="MS")
+        self.df = pd.DataFrame({"date": dates, "value": [float(i) for i in range(24)]})
+        self.df["indicator"] = "Test Indicator"
+        self.df["source"] = "FRED"
+
+    def test_summary_matches_dashboard_logic(self):
+        summary = build_series_summary(self.df)
+
+        self.assertEqual(summary["latest"], 23.0)
+        self.assertEqual(summary["delta"], 1.0)
+        # Last year = the 12 prints after the cutoff
+        self.assertEqual(summary["high_12m"], 23.0)
+        self.assertEqual(summary["low_12m"], 12.0)
+        self.assertAlmostEqual(summary["q99"], self.df["value"].quantile(0.99))
+        # Rolling mean is aligned with the CSV rows (undefined for the first 11)
+        self.assertEqual(len(summary["ma"]), 24)
+        self.assertIsNone(summary["ma"][10])
+        self.assertEqual(summary["ma"][11], 5.5)
+
+    def test_fingerprint_detects_revisions(self):
+        revised = self.df.copy()
+        revised.loc[5, "value"] = 99.0
+        self.assertEqual(series_fingerprint(self.df), series_fingerprint(self.df.copy()))
+        self.assertNotEqual(series_fingerprint(self.df), series_fingerprint(revised))
+        # Same data read back with another datetime unit (CSV vs shared store)
+        as_us = self.df.assign(date=self.df["date"].astype("datetime64[us]"))
+        self.assertEqual(series_fingerprint(as_us), series_fingerprint(self.df))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.processing.event_detector import EventDetector
+from src.processing.surprise_index import (
+    SurpriseIndex,
+    decayed_sums,
+    load_surprise_history,
+    to_days,
+)
+
+ASSIGNMENTS = {
+    "US CPI": ["US", "inflation", 1.0],
+    "US Unemployment": ["US", "labour", -1.0],
+    "UK Inflation": ["UK", "inflation", 1.0],
+}
+
+
+def make_events(n=40, seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start="2015-01-01", periods=n, freq="MS").astype("datetime64[ns]")
+    frames = [
+        pd.DataFrame({"indicator": name, "date": dates + pd.Timedelta(days=i), "z_score": rng.normal(size=n).round(2)})
+        for i, name in enumerate(ASSIGNMENTS)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestSurpriseIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_decayed_sums_rebase_matches_direct(self):
+        # 60 years of daily prints with a 1-day half-life: exp(decay * t) alone would overflow
+        days = np.arange(0, 365 * 60, dtype=float)
+        values = np.random.default_rng(0).normal(size=len(days))
+        decay = np.log(2)
+        out = decayed_sums(days, values, decay)
+        self.assertTrue(np.isfinite(out).all())
+        for k in (0, 500, len(days) - 1):
+            direct = np.sum(values[: k + 1] * np.exp(-decay * (days[k] - days[: k + 1])))
+            self.assertAlmostEqual(out[k], direct, places=9)
+
+    def test_incremental_updates_match_backfill(self):
+        events = make_events()
+        full = SurpriseIndex(half_life_days=45, state_dir=os.path.join(self.tmp.name, "full"))
+        full.backfill(events, ASSIGNMENTS)
+
+        events = events.sort_values("date", kind="stable")
+        live = SurpriseIndex(half_life_days=45, state_dir=os.path.join(self.tmp.name, "live"))
+        live.backfill(events.iloc[:60], ASSIGNMENTS)
+        for row in events.iloc[60:].itertuples(index=False):
+            self.assertTrue(live.update(row.indicator, row.date, row.z_score))
+
+        for key in [("US", "All"), ("US", "labour"), ("UK", "inflation")]:
+            self.assertAlmostEqual(live.value(*key), full.value(*key), places=9)
+
+        # Re-polling a print is a no-op; a re-scored print replaces its contribution
+        last = events.iloc[-1]
+        region = ASSIGNMENTS[last.indicator][0]
+        self.assertFalse(live.update(last.indicator, last.date, last.z_score))
+        before = live.value(region)
+        self.assertTrue(live.update(last.indicator, last.date, last.z_score + 1.0))
+        self.assertNotAlmostEqual(live.value(region), before)
+        self.assertTrue(live.update(last.indicator, last.date, last.z_score))
+        self.assertAlmostEqual(live.value(region), before, places=9)
+
+        # History on disk: backfilled points plus the appended updates
+        live.save()
+        history = load_surprise_history(live.history_path)
+        self.assertEqual(set(history["basket"]), {"All", "inflation", "labour"})
+        latest = history[(history["region"] == region) & (history["basket"] == "All")]
+        self.assertAlmostEqual(latest["index"].iloc[-1], round(before, 4))
+
+    def test_negative_weight_and_persistence(self):
+        events = pd.DataFrame(
+            {"indicator": ["US Unemployment"], "date": [pd.Timestamp("2024-01-01")], "z_score": [2.0]}
+        )
+        index = SurpriseIndex(state_dir=self.tmp.name)
+        index.backfill(events, ASSIGNMENTS)
+        self.assertAlmostEqual(index.value("US", "labour"), -2.0)
+        # Equal-weight mean, the older print decayed by one half-life
+        index.update("US CPI", pd.Timestamp("2024-01-31"), 1.0)
+        self.assertAlmostEqual(index.value("US"), (1.0 - 2.0 * 0.5) / 1.5)
+        index.save()
+
+        restored = SurpriseIndex(state_dir=self.tmp.name)
+        self.assertTrue(restored.load())
+        self.assertEqual(restored.assignments, ASSIGNMENTS)
+        self.assertAlmostEqual(restored.value("US"), index.value("US"))
+        self.assertFalse(SurpriseIndex(half_life_days=10, state_dir=self.tmp.name).load())
+
+    def test_detector_history_scores_match_latest(self):
+        values = [3.0, 3.1, 2.9, 3.0, 3.05, 2.95, 3.0, 3.1, 2.9, 3.0, 3.0, 3.8, 3.2, 3.3]
+        df = pd.DataFrame({"date": pd.date_range(start="2023-01-01", periods=len(values), freq="MS"), "value": values})
+        detector = EventDetector(lookback_window=12)
+        scores = detector.z_scores(df)
+        self.assertEqual(len(scores), len(values) - 11)
+        for end in range(12, len(values) + 1):
+            expected = detector.analyze_release(df.iloc[:end])["z_score"]
+            self.assertAlmostEqual(scores["z_score"].iloc[end - 12], expected)
+        self.assertEqual(to_days([pd.Timestamp("1970-01-03")])[0], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()